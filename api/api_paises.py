@@ -6,12 +6,77 @@
 #     /v3.1/name/{name}
 #     /v3.1/alpha/{code}
 #     /v3.1/region/{region}
+# - Las respuestas se guardan en una caché persistente (api/cache_api.py)
+#   con TTL y revalidación ETag/Last-Modified; sin red se usan las
+#   respuestas guardadas.
+# - Opcionalmente se puede cargar el dataset completo (/all o un snapshot
+#   JSON) en un índice en memoria (api/indice_paises.py); desde ese
+#   momento las búsquedas no hacen ninguna llamada de red.
+# - Las llamadas HTTP usan una requests.Session propia con pool de
+#   conexiones keep-alive, reintentos con backoff ante 5xx y gzip.
 # ==============================================================
 
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from aplicacion import config
+from api.cache_api import CacheRespuestas
+from api.indice_paises import IndicePaises
 
 BASE_URL = "https://restcountries.com/v3.1"
 
+# /all exige indicar `fields` (máximo 10 por llamada), así que se piden en
+# dos grupos y se unen por cca3.
+CAMPOS_ALL = (
+    "name,cca2,cca3,region,subregion,capital,population,area,currencies,languages",
+    "cca3,timezones,flags,maps",
+)
+
+_cache_compartida = None
+_cache_lock = threading.Lock()
+
+def _cache_por_defecto() -> CacheRespuestas:
+    """Caché compartida por todas las instancias (se crea en el primer uso, una sola vez)."""
+    global _cache_compartida
+    if _cache_compartida is None:
+        with _cache_lock:
+            if _cache_compartida is None:
+                _cache_compartida = CacheRespuestas(
+                    config.API_CACHE_DIR,
+                    ttl=config.API_CACHE_TTL,
+                    max_entradas=config.API_CACHE_MAX_ENTRADAS,
+                )
+    return _cache_compartida
+
+
+def _crear_sesion(reintentos: int, backoff: float, pool_max: int) -> requests.Session:
+    """
+    Session con pool de conexiones (keep-alive) y reintentos automáticos.
+    Reintenta GET ante errores de conexión y respuestas 500/502/503/504 con
+    espera exponencial (backoff, 2*backoff, 4*backoff, ...).
+    """
+    retry = Retry(
+        total=reintentos,
+        connect=reintentos,
+        read=reintentos,
+        status=reintentos,
+        backoff_factor=backoff,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,  # al agotar reintentos devuelve la última respuesta
+    )
+    adapter = HTTPAdapter(pool_connections=pool_max, pool_maxsize=pool_max, max_retries=retry)
+    sesion = requests.Session()
+    sesion.mount("https://", adapter)
+    sesion.mount("http://", adapter)
+    return sesion
+
 
 def _parse_currencies(currencies_obj) -> str:
     """
@@ -74,15 +139,73 @@ def _normalize_country(c: dict) -> dict:
 
 
 class ApiPaisesService:
-    HEADERS = {"User-Agent": "AppConsole/1.0"}
+    HEADERS = {
+        "User-Agent": "AppConsole/1.0",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+    _SIN_CACHE = object()
+    MAX_MUESTRAS_LATENCIA = 1000
+    MAX_CODIGOS_POR_LLAMADA = 50   # códigos por llamada a /alpha?codes=
+
+    def __init__(self, base_url: str = BASE_URL, cache=_SIN_CACHE, usar_cache: bool = True,
+                 timeout: float | None = None, reintentos: int | None = None,
+                 backoff: float | None = None):
+        """
+        base_url  : raíz de la API (se puede apuntar a un servidor local de prueba).
+        cache     : CacheRespuestas a usar; por defecto la caché compartida en API_CACHE_DIR.
+        usar_cache: False desactiva la caché por completo.
+        timeout / reintentos / backoff: por defecto API_TIMEOUT / API_REINTENTOS / API_BACKOFF.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = config.API_TIMEOUT if timeout is None else timeout
+        self.session = _crear_sesion(
+            config.API_REINTENTOS if reintentos is None else reintentos,
+            config.API_BACKOFF if backoff is None else backoff,
+            config.API_POOL_MAX,
+        )
+        self._metricas_lock = threading.Lock()
+        self._latencias_ms = deque(maxlen=self.MAX_MUESTRAS_LATENCIA)
+        self._llamadas = 0
+        self._errores = 0
+        if not usar_cache:
+            self.cache = None
+        elif cache is ApiPaisesService._SIN_CACHE:
+            self.cache = _cache_por_defecto()
+        else:
+            self.cache = cache
+        self.indice: IndicePaises | None = None
+        self._crudos: list[dict] | None = None
 
     def _get(self, path: str, params: dict | None = None):
-        url = f"{BASE_URL}{path}"
+        url = f"{self.base_url}{path}"
+        clave = CacheRespuestas.clave(path, params)
+        entrada = self.cache.obtener(clave) if self.cache else None
+        if entrada and entrada["fresca"]:
+            return entrada["datos"]
+
+        # Entrada vencida: revalidamos en vez de descargar todo de nuevo
+        headers = dict(self.HEADERS)
+        if entrada:
+            if entrada["etag"]:
+                headers["If-None-Match"] = entrada["etag"]
+            if entrada["last_modified"]:
+                headers["If-Modified-Since"] = entrada["last_modified"]
+
+        inicio = time.perf_counter()
         try:
-            resp = requests.get(url, params=params or {}, headers=self.HEADERS, timeout=8)
+            resp = self.session.get(url, params=params or {}, headers=headers, timeout=self.timeout)
+            self._registrar_latencia(inicio, ok=resp.status_code < 500)
+            if resp.status_code == 304 and entrada:
+                self.cache.refrescar(clave)
+                return entrada["datos"]
             resp.raise_for_status()
-            return resp.json()
+            datos = resp.json()
+            if self.cache:
+                self.cache.guardar(clave, datos, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+            return datos
         except requests.exceptions.Timeout:
+            self._registrar_latencia(inicio, ok=False)
             print(" Error: Tiempo de espera agotado al consultar la API.")
         except requests.exceptions.HTTPError as e:
             # 404, etc.
@@ -90,25 +213,113 @@ class ApiPaisesService:
                 return None
             print(f" Error HTTP: {e}")
         except requests.exceptions.ConnectionError:
+            self._registrar_latencia(inicio, ok=False)
             print("🌐 Error: No hay conexión a Internet o la API no responde.")
         except Exception as e:
             print(f" Error inesperado al consultar API: {e}")
+
+        # Sin respuesta válida: si hay una copia guardada (aunque vencida), la usamos
+        if entrada:
+            print(" (Mostrando datos guardados en caché)")
+            return entrada["datos"]
         return None
 
+    # --------- Métricas de latencia ----------
+
+    def _registrar_latencia(self, inicio: float, ok: bool = True) -> None:
+        ms = (time.perf_counter() - inicio) * 1000
+        with self._metricas_lock:
+            self._llamadas += 1
+            if not ok:
+                self._errores += 1
+            self._latencias_ms.append(ms)
+
+    def estadisticas_latencia(self) -> dict:
+        """
+        Latencia de las llamadas de red (no incluye aciertos de caché), en ms,
+        sobre las últimas MAX_MUESTRAS_LATENCIA llamadas.
+        """
+        with self._metricas_lock:
+            muestras = sorted(self._latencias_ms)
+            llamadas, errores = self._llamadas, self._errores
+        if not muestras:
+            return {"llamadas": llamadas, "errores": errores}
+
+        def _pct(p: float) -> float:
+            return muestras[min(len(muestras) - 1, int(p * len(muestras)))]
+
+        return {
+            "llamadas": llamadas,
+            "errores": errores,
+            "promedio_ms": sum(muestras) / len(muestras),
+            "p50_ms": _pct(0.50),
+            "p95_ms": _pct(0.95),
+            "max_ms": muestras[-1],
+        }
+
+    # --------- Índice en memoria ----------
+
+    def _descargar_todos(self) -> list[dict] | None:
+        """Descarga /all (en grupos de campos) y une los resultados por cca3."""
+        fusion: dict[str, dict] = {}
+        for campos in CAMPOS_ALL:
+            data = self._get("/all", {"fields": campos})
+            if not data or not isinstance(data, list):
+                return None
+            for c in data:
+                if isinstance(c, dict) and c.get("cca3"):
+                    fusion.setdefault(c["cca3"], {}).update(c)
+        return list(fusion.values())
+
+    def cargar_indice(self, ruta_snapshot: str | None = None) -> bool:
+        """
+        Carga todos los países en memoria y construye los índices.
+        ruta_snapshot: archivo JSON con la lista cruda de /all (ver guardar_snapshot).
+                       Si es None se usa config.API_PAISES_SNAPSHOT o, si no existe, la API.
+        Retorna True si el índice quedó cargado.
+        """
+        ruta_snapshot = ruta_snapshot or config.API_PAISES_SNAPSHOT or None
+        crudos = None
+        if ruta_snapshot:
+            try:
+                with open(ruta_snapshot, "r", encoding="utf-8") as f:
+                    crudos = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f" No se pudo leer el snapshot de países ({e}); se usará la API.")
+        if not isinstance(crudos, list):
+            crudos = self._descargar_todos()
+        if not crudos:
+            return False
+        self.indice = IndicePaises(_normalize_country(c) for c in crudos if isinstance(c, dict))
+        self._crudos = crudos
+        return True
+
+    def guardar_snapshot(self, ruta: str) -> None:
+        """Guarda la lista cruda cargada por cargar_indice() para usarla sin red."""
+        crudos = self._crudos or self._descargar_todos()
+        if not crudos:
+            raise ValueError("No hay datos de países para guardar.")
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(crudos, f, ensure_ascii=False)
+
     # --------- Métodos públicos ----------
 
-    def buscar_por_nombre(self, nombre: str, full: bool = False) -> list[dict]:
+    def buscar_por_nombre(self, nombre: str, full: bool = False, limite: int | None = None) -> list[dict]:
         """
         Busca países por nombre. Puede retornar varios.
         full=False -> coincide parcial ('chi' encuentra 'Chile'/'China')
+        limite     -> máximo de resultados (None = todos)
         """
         if not nombre or not isinstance(nombre, str):
             return []
+        if self.indice is not None:
+            return self.indice.buscar_nombre(nombre, full=full, limite=limite)
         params = {"fullText": "true"} if full else None
         data = self._get(f"/name/{nombre.strip()}", params)
         if not data or not isinstance(data, list):
             return []
-        return [_normalize_country(c) for c in data]
+        paises = [_normalize_country(c) for c in data]
+        return paises if limite is None else paises[:limite]
 
     def buscar_por_codigo(self, codigo: str) -> dict | None:
         """
@@ -116,6 +327,8 @@ class ApiPaisesService:
         """
         if not codigo or not isinstance(codigo, str):
             return None
+        if self.indice is not None:
+            return self.indice.por_codigo(codigo)
         data = self._get(f"/alpha/{codigo.strip()}")
         if not data:
             return None
@@ -127,12 +340,59 @@ class ApiPaisesService:
             return _normalize_country(data[0])
         return None
 
+    def buscar_por_codigos(self, codigos: list[str]) -> list[dict | None]:
+        """
+        Busca muchos países por código ISO (alpha-2 o alpha-3) de una vez.
+        - Quita duplicados (sin distinguir mayúsculas) antes de consultar.
+        - Usa el endpoint por lotes /alpha?codes=CL,AR,... (o el índice si está cargado).
+        - Si el lote falla, consulta los códigos en paralelo con un pool de hilos acotado
+          (API_CONCURRENCIA).
+        Retorna una lista del mismo largo y orden que `codigos`; None donde no hubo resultado.
+        """
+        normalizados = [c.strip().upper() if isinstance(c, str) and c.strip() else None for c in codigos]
+        unicos = list(dict.fromkeys(c for c in normalizados if c))
+        if not unicos:
+            return [None] * len(normalizados)
+
+        if self.indice is not None:
+            encontrados = {c: self.indice.por_codigo(c) for c in unicos}
+        else:
+            encontrados = self._buscar_lote_codigos(unicos)
+            if encontrados is None:
+                hilos = max(1, min(config.API_CONCURRENCIA, len(unicos)))
+                with ThreadPoolExecutor(max_workers=hilos) as pool:
+                    encontrados = dict(zip(unicos, pool.map(self.buscar_por_codigo, unicos)))
+
+        return [encontrados.get(c) if c else None for c in normalizados]
+
+    def _buscar_lote_codigos(self, codigos: list[str]) -> dict | None:
+        """
+        Consulta /alpha?codes=... en grupos de MAX_CODIGOS_POR_LLAMADA.
+        Retorna {codigo: país normalizado o None}, o None si algún lote no respondió.
+        """
+        encontrados: dict[str, dict | None] = {}
+        for i in range(0, len(codigos), self.MAX_CODIGOS_POR_LLAMADA):
+            grupo = codigos[i:i + self.MAX_CODIGOS_POR_LLAMADA]
+            data = self._get("/alpha", {"codes": ",".join(grupo)})
+            if not isinstance(data, list):
+                return None
+            por_codigo = {}
+            for c in data:
+                pais = _normalize_country(c)
+                por_codigo[str(pais["codigo_cca2"]).upper()] = pais
+                por_codigo[str(pais["codigo_cca3"]).upper()] = pais
+            for codigo in grupo:
+                encontrados[codigo] = por_codigo.get(codigo)
+        return encontrados
+
     def listar_por_region(self, region: str) -> list[dict]:
         """
         Lista países por región: Africa, Americas, Asia, Europe, Oceania, Antarctic
         """
         if not region or not isinstance(region, str):
             return []
+        if self.indice is not None:
+            return self.indice.listar_region(region)
         data = self._get(f"/region/{region.strip()}")
         if not data or not isinstance(data, list):
             return []
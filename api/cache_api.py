@@ -0,0 +1,172 @@
+# api/cache_api.py
+# ==============================================================
+# Caché persistente (SQLite) para respuestas de APIs HTTP
+# --------------------------------------------------------------
+# - Clave: endpoint + parámetros (ordenados).
+# - TTL: mientras la entrada está "fresca" se responde sin red.
+# - Cuando vence, se revalida con ETag / Last-Modified (304 = sigue igual).
+# - Límite de tamaño con política LRU (se borran las menos usadas).
+# - Si no hay red se pueden servir entradas vencidas (modo offline).
+# Delante del archivo hay un LRU pequeño en memoria con los objetos ya
+# deserializados, así las consultas repetidas se resuelven en microsegundos.
+# Los aciertos en memoria también cuentan para el LRU del archivo: su
+# último acceso se anota y se escribe en SQLite por tandas (cada
+# INTERVALO_ACCESOS segundos y siempre antes de desalojar entradas).
+# ==============================================================
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class CacheRespuestas:
+    """Caché de respuestas JSON respaldada por un archivo SQLite."""
+
+    INTERVALO_ACCESOS = 5.0  # segundos entre escrituras de ultimo_acceso de aciertos en memoria
+
+    def __init__(self, directorio: str, ttl: float = 86400, max_entradas: int = 500,
+                 max_en_memoria: int = 128, nombre_archivo: str = "cache_api.sqlite3") -> None:
+        if max_entradas < 1:
+            raise ValueError("max_entradas debe ser al menos 1.")
+        os.makedirs(directorio, exist_ok=True)
+        self.ruta = os.path.join(directorio, nombre_archivo)
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        self.max_en_memoria = max(0, max_en_memoria)
+
+        self._lock = threading.Lock()
+        self._memoria = OrderedDict()  # clave -> entrada (dict)
+        self._accesos = {}             # clave -> último acceso en memoria aún no escrito
+        self._accesos_volcados = time.monotonic()
+        self._db = sqlite3.connect(self.ruta, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS respuestas (
+                clave         TEXT PRIMARY KEY,
+                cuerpo        TEXT NOT NULL,
+                etag          TEXT,
+                last_modified TEXT,
+                guardado      REAL NOT NULL,
+                ultimo_acceso REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS ix_respuestas_acceso ON respuestas (ultimo_acceso)")
+        self._db.commit()
+
+    @staticmethod
+    def clave(path: str, params: dict | None = None) -> str:
+        """Clave estable para endpoint + parámetros."""
+        if not params:
+            return path
+        pares = "&".join(f"{k}={params[k]}" for k in sorted(params))
+        return f"{path}?{pares}"
+
+    def _recordar(self, clave: str, entrada: dict) -> None:
+        if not self.max_en_memoria:
+            return
+        self._memoria[clave] = entrada
+        self._memoria.move_to_end(clave)
+        while len(self._memoria) > self.max_en_memoria:
+            self._memoria.popitem(last=False)
+
+    def _volcar_accesos(self, forzar: bool = False) -> None:
+        """Escribe en SQLite los últimos accesos pendientes (se llama con el lock tomado)."""
+        if not self._accesos:
+            return
+        if not forzar and time.monotonic() - self._accesos_volcados < self.INTERVALO_ACCESOS:
+            return
+        self._db.executemany(
+            "UPDATE respuestas SET ultimo_acceso = ? WHERE clave = ?",
+            [(t, c) for c, t in self._accesos.items()],
+        )
+        self._db.commit()
+        self._accesos.clear()
+        self._accesos_volcados = time.monotonic()
+
+    def obtener(self, clave: str) -> dict | None:
+        """
+        Retorna la entrada guardada o None.
+        Entrada = {"datos", "etag", "last_modified", "guardado", "fresca"}.
+        """
+        ahora = time.time()
+        with self._lock:
+            entrada = self._memoria.get(clave)
+            if entrada is not None:
+                self._memoria.move_to_end(clave)
+                self._accesos[clave] = ahora
+                self._volcar_accesos()
+            else:
+                fila = self._db.execute(
+                    "SELECT cuerpo, etag, last_modified, guardado FROM respuestas WHERE clave = ?",
+                    (clave,),
+                ).fetchone()
+                if fila is None:
+                    return None
+                self._db.execute("UPDATE respuestas SET ultimo_acceso = ? WHERE clave = ?", (ahora, clave))
+                self._db.commit()
+                entrada = {
+                    "datos": json.loads(fila[0]),
+                    "etag": fila[1],
+                    "last_modified": fila[2],
+                    "guardado": fila[3],
+                }
+                self._recordar(clave, entrada)
+        return dict(entrada, fresca=(ahora - entrada["guardado"]) < self.ttl)
+
+    def guardar(self, clave: str, datos, etag: str | None = None, last_modified: str | None = None) -> None:
+        """Guarda (o reemplaza) una respuesta y aplica el límite LRU."""
+        ahora = time.time()
+        cuerpo = json.dumps(datos, ensure_ascii=False)
+        with self._lock:
+            self._db.execute(
+                """
+                INSERT OR REPLACE INTO respuestas (clave, cuerpo, etag, last_modified, guardado, ultimo_acceso)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (clave, cuerpo, etag, last_modified, ahora, ahora),
+            )
+            self._accesos.pop(clave, None)
+            sobrantes = self._db.execute("SELECT COUNT(*) FROM respuestas").fetchone()[0] - self.max_entradas
+            if sobrantes > 0:
+                self._volcar_accesos(forzar=True)
+                viejas = [c for (c,) in self._db.execute(
+                    "SELECT clave FROM respuestas ORDER BY ultimo_acceso LIMIT ?", (sobrantes,)
+                )]
+                self._db.executemany("DELETE FROM respuestas WHERE clave = ?", [(c,) for c in viejas])
+                for c in viejas:
+                    self._memoria.pop(c, None)
+                    self._accesos.pop(c, None)
+            self._db.commit()
+            self._recordar(clave, {"datos": datos, "etag": etag,
+                                   "last_modified": last_modified, "guardado": ahora})
+
+    def refrescar(self, clave: str) -> None:
+        """Marca una entrada como recién validada (respuesta 304 del servidor)."""
+        ahora = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE respuestas SET guardado = ?, ultimo_acceso = ? WHERE clave = ?", (ahora, ahora, clave)
+            )
+            self._db.commit()
+            self._accesos.pop(clave, None)
+            entrada = self._memoria.get(clave)
+            if entrada is not None:
+                entrada["guardado"] = ahora
+
+    def limpiar(self) -> None:
+        """Borra todas las entradas."""
+        with self._lock:
+            self._db.execute("DELETE FROM respuestas")
+            self._db.commit()
+            self._memoria.clear()
+            self._accesos.clear()
+
+    def cerrar(self) -> None:
+        with self._lock:
+            self._volcar_accesos(forzar=True)
+            self._db.close()
@@ -0,0 +1,102 @@
+# api/indice_paises.py
+# ==============================================================
+# Índice en memoria de países (ya normalizados con _normalize_country)
+# --------------------------------------------------------------
+# - por código  : dicts cca2 / cca3 -> país (O(1))
+# - por región  : región -> lista de países
+# - por nombre  : arreglo ordenado de nombres (común y oficial) para
+#                 búsqueda por prefijo con bisect (O(log n + k)) y
+#                 dict nombre exacto -> países para full=True (O(1));
+#                 la subcadena solo se recorre si los prefijos no
+#                 alcanzan el límite pedido (semántica de /name/{name}).
+# ==============================================================
+
+from bisect import bisect_left
+
+
+class IndicePaises:
+    """Índices de búsqueda sobre una lista de países normalizados."""
+
+    def __init__(self, paises: list[dict]) -> None:
+        self.paises = list(paises)
+        self.por_cca2: dict[str, dict] = {}
+        self.por_cca3: dict[str, dict] = {}
+        self.por_region: dict[str, list[dict]] = {}
+        self._exactos: dict[str, list[int]] = {}
+        nombres: list[tuple[str, int]] = []
+
+        for i, p in enumerate(self.paises):
+            cca2 = str(p.get("codigo_cca2", "")).upper()
+            cca3 = str(p.get("codigo_cca3", "")).upper()
+            if cca2 and cca2 != "-":
+                self.por_cca2[cca2] = p
+            if cca3 and cca3 != "-":
+                self.por_cca3[cca3] = p
+            self.por_region.setdefault(str(p.get("region", "-")).casefold(), []).append(p)
+            for campo in ("nombre_comun", "nombre_oficial"):
+                nombre = p.get(campo)
+                if nombre and nombre != "-":
+                    nombres.append((nombre.casefold(), i))
+                    pos_exactas = self._exactos.setdefault(nombre.casefold(), [])
+                    if i not in pos_exactas:
+                        pos_exactas.append(i)
+
+        nombres.sort()
+        self._nombres = [n for n, _ in nombres]
+        self._posiciones = [i for _, i in nombres]
+
+    def __len__(self) -> int:
+        return len(self.paises)
+
+    def por_codigo(self, codigo: str) -> dict | None:
+        """Busca por código ISO alpha-2 o alpha-3."""
+        c = (codigo or "").strip().upper()
+        if len(c) == 2:
+            return self.por_cca2.get(c)
+        return self.por_cca3.get(c)
+
+    def listar_region(self, region: str) -> list[dict]:
+        return list(self.por_region.get((region or "").strip().casefold(), []))
+
+    def buscar_prefijo(self, texto: str) -> list[dict]:
+        """Países cuyo nombre común u oficial empieza por `texto` (sin distinguir mayúsculas)."""
+        t = (texto or "").strip().casefold()
+        if not t:
+            return []
+        vistos, salida = set(), []
+        i = bisect_left(self._nombres, t)
+        while i < len(self._nombres) and self._nombres[i].startswith(t):
+            pos = self._posiciones[i]
+            if pos not in vistos:
+                vistos.add(pos)
+                salida.append(self.paises[pos])
+            i += 1
+        return salida
+
+    def buscar_nombre(self, texto: str, full: bool = False, limite: int | None = None) -> list[dict]:
+        """
+        Misma semántica que /name/{name}:
+          full=True  -> nombre común u oficial exactamente igual.
+          full=False -> coincidencia parcial; primero los que empiezan por el texto.
+        limite: máximo de resultados; si los prefijos ya lo cubren no se
+                recorre la lista completa buscando la subcadena.
+        """
+        t = (texto or "").strip().casefold()
+        if not t:
+            return []
+        if full:
+            salida = [self.paises[i] for i in self._exactos.get(t, [])]
+            return salida if limite is None else salida[:limite]
+
+        salida = self.buscar_prefijo(t)
+        if limite is not None and len(salida) >= limite:
+            return salida[:limite]
+        ya = {id(p) for p in salida}
+        for p in self.paises:
+            if id(p) in ya:
+                continue
+            if t in str(p.get("nombre_comun", "")).casefold() or t in str(p.get("nombre_oficial", "")).casefold():
+                salida.append(p)
+                if limite is not None and len(salida) >= limite:
+                    break
+        return salida
@@ -0,0 +1,290 @@
+# aplicacion/analitica_empleados.py
+# ==============================================================
+# ANALÍTICA DE EMPLEADOS SOBRE UNA TABLA COLUMNAR EN MEMORIA
+# --------------------------------------------------------------
+# TablaEmpleados es una foto de la tabla empleado guardada por columnas:
+#   id        array('q')  id_empleado
+#   salario   array('d')
+#   inicio    array('q')  fecha_inicio_contrato en días desde 1970-01-01
+#                         (SIN_FECHA si no tiene)
+#   tipo      array('b')  código de tipo_empleado (índice en `categorias`)
+# Se arma leyendo empleadoDAO.iter_columnas_analitica en bloques de tuplas,
+# sin crear un dict ni un Empleado por fila.
+#
+# Las operaciones (estadísticas de salario por tipo, histograma de
+# antigüedad, filtros) trabajan sobre vistas NumPy de esas columnas
+# (np.frombuffer, sin copiar) si NumPy está instalado; si no, recorren
+# los array.array en Python puro con el mismo resultado (como
+# reportes_turnos.horas_por_ventana). Solo a_numpy exige NumPy.
+#
+# Uso:
+#   tabla = TablaEmpleados.desde_bd()
+#   tabla.estadisticas_salario_por_tipo()
+#   tabla.filtrar(tipo="Gerente", salario_min=1_000_000).histograma_antiguedad()
+# ==============================================================
+
+import bisect
+import datetime
+import math
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from dominio.empleado import Empleado
+from persistencia import empleadoDAO
+
+SIN_FECHA = -(2 ** 62)
+_EPOCA = datetime.date(1970, 1, 1)
+BORDES_ANTIGUEDAD = (0, 1, 2, 5, 10, 20)  # años; el último tramo queda abierto
+
+
+def _numpy():
+    """NumPy es opcional: solo vectoriza las operaciones."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def _percentil(ordenados, q: float) -> float:
+    """Percentil con interpolación lineal (mismo criterio que np.percentile por defecto)."""
+    pos = (len(ordenados) - 1) * q / 100
+    i = int(pos)
+    if i + 1 >= len(ordenados):
+        return float(ordenados[-1])
+    return float(ordenados[i] + (ordenados[i + 1] - ordenados[i]) * (pos - i))
+
+def _dias(fecha) -> int:
+    if isinstance(fecha, datetime.datetime):
+        fecha = fecha.date()
+    return (fecha - _EPOCA).days
+
+
+class TablaEmpleados:
+    """Foto columnar de la tabla empleado."""
+
+    __slots__ = ("id", "salario", "inicio", "tipo", "categorias", "_codigos")
+
+    def __init__(self, categorias: Optional[Sequence[str]] = None) -> None:
+        self.id = array("q")
+        self.salario = array("d")
+        self.inicio = array("q")
+        self.tipo = array("b")
+        # Los tipos conocidos tienen siempre el mismo código; un texto fuera del Enum
+        # (datos viejos) recibe el siguiente código libre.
+        self.categorias: List[str] = list(categorias or (t.value for t in Empleado.TipoEmpleado))
+        self._codigos = {c: i for i, c in enumerate(self.categorias)}
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def __repr__(self) -> str:
+        return f"TablaEmpleados(filas={len(self)}, categorias={self.categorias})"
+
+    # ----------------------------------------------------------
+    # Construcción
+    # ----------------------------------------------------------
+    def _codigo(self, valor: str) -> int:
+        codigo = self._codigos.get(valor)
+        if codigo is None:
+            if len(self.categorias) >= 127:
+                raise ValueError("Demasiados tipos de empleado distintos para array('b').")
+            codigo = self._codigos[valor] = len(self.categorias)
+            self.categorias.append(valor)
+        return codigo
+
+    def agregar_bloque(self, filas: Iterable[tuple]) -> None:
+        """Agrega filas (id, salario, dias_inicio, tipo) con el formato de iter_columnas_analitica."""
+        filas = list(filas)
+        if not filas:
+            return
+        ids, salarios, dias, tipos = zip(*filas)
+        self.id.extend(ids)
+        self.salario.extend(salarios)
+        self.inicio.extend(SIN_FECHA if d is None else d for d in dias)
+        codigos = self._codigos
+        self.tipo.extend(codigos[t] if t in codigos else self._codigo(t) for t in tipos)
+
+    @classmethod
+    def desde_bd(cls, tamano_bloque: int = 10000) -> "TablaEmpleados":
+        """Arma la tabla recorriendo empleado en bloques (cursor de servidor)."""
+        tabla = cls()
+        for bloque in empleadoDAO.iter_columnas_analitica(tamano_bloque):
+            tabla.agregar_bloque(bloque)
+        return tabla
+
+    # ----------------------------------------------------------
+    # Vistas NumPy
+    # ----------------------------------------------------------
+    def a_numpy(self) -> Dict[str, object]:
+        """{"id", "salario", "inicio", "tipo"} como arreglos NumPy que comparten memoria con la tabla."""
+        np = _numpy()
+        if np is None:
+            raise RuntimeError("a_numpy requiere NumPy (pip install numpy).")
+        return {
+            "id": np.frombuffer(self.id, dtype=np.int64),
+            "salario": np.frombuffer(self.salario, dtype=np.float64),
+            "inicio": np.frombuffer(self.inicio, dtype=np.int64),
+            "tipo": np.frombuffer(self.tipo, dtype=np.int8),
+        }
+
+    def _desde_mascara(self, mascara) -> "TablaEmpleados":
+        if not isinstance(mascara, (list, tuple)):
+            return self._desde_mascara_numpy(mascara)
+        nueva = TablaEmpleados(self.categorias)
+        for i, ok in enumerate(mascara):
+            if ok:
+                nueva.id.append(self.id[i])
+                nueva.salario.append(self.salario[i])
+                nueva.inicio.append(self.inicio[i])
+                nueva.tipo.append(self.tipo[i])
+        return nueva
+
+    def _desde_mascara_numpy(self, mascara) -> "TablaEmpleados":
+        cols = self.a_numpy()
+        nueva = TablaEmpleados(self.categorias)
+        nueva.id.frombytes(cols["id"][mascara].tobytes())
+        nueva.salario.frombytes(cols["salario"][mascara].tobytes())
+        nueva.inicio.frombytes(cols["inicio"][mascara].tobytes())
+        nueva.tipo.frombytes(cols["tipo"][mascara].tobytes())
+        return nueva
+
+    def antiguedad_anios(self, hoy: Optional[datetime.date] = None):
+        """
+        Antigüedad en años por empleado (NaN si no tiene fecha de inicio).
+        Arreglo NumPy, o array('d') si NumPy no está instalado.
+        """
+        np = _numpy()
+        dia_hoy = _dias(hoy or datetime.date.today())
+        if np is None:
+            return array("d", (math.nan if d == SIN_FECHA else (dia_hoy - d) / 365.2425 for d in self.inicio))
+        inicio = self.a_numpy()["inicio"]
+        anios = (dia_hoy - inicio) / 365.2425
+        anios[inicio == SIN_FECHA] = np.nan
+        return anios
+
+    # ----------------------------------------------------------
+    # Operaciones
+    # ----------------------------------------------------------
+    def filtrar(self, tipo: Optional[str] = None, salario_min: Optional[float] = None,
+                salario_max: Optional[float] = None, inicio_desde: Optional[datetime.date] = None,
+                inicio_hasta: Optional[datetime.date] = None) -> "TablaEmpleados":
+        """Nueva tabla con las filas que cumplen todos los criterios indicados (límites inclusive)."""
+        codigo = None
+        if tipo is not None:
+            codigo = self._codigos.get(tipo.value if isinstance(tipo, Empleado.TipoEmpleado) else tipo, -1)
+        np = _numpy()
+        if np is None:
+            desde = _dias(inicio_desde) if inicio_desde is not None else None
+            hasta = _dias(inicio_hasta) if inicio_hasta is not None else None
+            mascara = [
+                (codigo is None or t == codigo)
+                and (salario_min is None or s >= salario_min)
+                and (salario_max is None or s <= salario_max)
+                and (desde is None or d >= desde)
+                and (hasta is None or (d <= hasta and d != SIN_FECHA))
+                for t, s, d in zip(self.tipo, self.salario, self.inicio)
+            ]
+            return self._desde_mascara(mascara)
+
+        cols = self.a_numpy()
+        mascara = np.ones(len(self), dtype=bool)
+        if tipo is not None:
+            if codigo == -1:
+                mascara[:] = False
+            else:
+                mascara &= cols["tipo"] == codigo
+        if salario_min is not None:
+            mascara &= cols["salario"] >= salario_min
+        if salario_max is not None:
+            mascara &= cols["salario"] <= salario_max
+        if inicio_desde is not None:
+            mascara &= cols["inicio"] >= _dias(inicio_desde)
+        if inicio_hasta is not None:
+            mascara &= (cols["inicio"] <= _dias(inicio_hasta)) & (cols["inicio"] != SIN_FECHA)
+        return self._desde_mascara(mascara)
+
+    def estadisticas_salario_por_tipo(self) -> Dict[str, Dict[str, float]]:
+        """{tipo: {cantidad, suma, media, minimo, p50, p90, maximo}} para cada tipo con empleados."""
+        np = _numpy()
+        if np is None:
+            por_tipo: Dict[int, List[float]] = {}
+            for t, s in zip(self.tipo, self.salario):
+                por_tipo.setdefault(t, []).append(s)
+            resultado = {}
+            for codigo, categoria in enumerate(self.categorias):
+                tramo = sorted(por_tipo.get(codigo, ()))
+                if not tramo:
+                    continue
+                suma = math.fsum(tramo)
+                resultado[categoria] = {
+                    "cantidad": len(tramo), "suma": suma, "media": suma / len(tramo),
+                    "minimo": tramo[0], "p50": _percentil(tramo, 50), "p90": _percentil(tramo, 90),
+                    "maximo": tramo[-1],
+                }
+            return resultado
+
+        cols = self.a_numpy()
+        tipos, salarios = cols["tipo"], cols["salario"]
+        cantidades = np.bincount(tipos, minlength=len(self.categorias))
+        sumas = np.bincount(tipos, weights=salarios, minlength=len(self.categorias))
+        # Un solo ordenamiento por (tipo, salario): cada tipo queda como un tramo contiguo
+        orden = np.lexsort((salarios, tipos))
+        ordenados = salarios[orden]
+        inicios = np.concatenate(([0], np.cumsum(cantidades)[:-1]))
+
+        resultado = {}
+        for codigo, categoria in enumerate(self.categorias):
+            n = int(cantidades[codigo])
+            if not n:
+                continue
+            tramo = ordenados[inicios[codigo]:inicios[codigo] + n]
+            resultado[categoria] = {
+                "cantidad": n,
+                "suma": float(sumas[codigo]),
+                "media": float(sumas[codigo] / n),
+                "minimo": float(tramo[0]),
+                "p50": float(np.percentile(tramo, 50)),
+                "p90": float(np.percentile(tramo, 90)),
+                "maximo": float(tramo[-1]),
+            }
+        return resultado
+
+    def histograma_antiguedad(self, bordes: Sequence[float] = BORDES_ANTIGUEDAD,
+                              hoy: Optional[datetime.date] = None, por_tipo: bool = False) -> Dict:
+        """
+        Cantidad de empleados por tramo de antigüedad (años). Tramos [b_i, b_i+1) y el último
+        abierto (>= último borde). Los empleados sin fecha de inicio se cuentan aparte.
+        Con por_tipo=True, "conteos" es {tipo: [...]}.
+        """
+        np = _numpy()
+        anios = self.antiguedad_anios(hoy)
+        etiquetas = [f"{a:g}-{b:g}" for a, b in zip(bordes[:-1], bordes[1:])] + [f"{bordes[-1]:g}+"]
+        if np is None:
+            return self._histograma_python(anios, list(bordes), etiquetas, por_tipo)
+
+        con_fecha = ~np.isnan(anios)
+        limites = np.append(np.asarray(bordes, dtype=np.float64), np.inf)
+
+        def contar(mascara):
+            return np.histogram(anios[mascara], bins=limites)[0].tolist()
+
+        if por_tipo:
+            tipos = self.a_numpy()["tipo"]
+            conteos = {c: contar(con_fecha & (tipos == i)) for i, c in enumerate(self.categorias)}
+        else:
+            conteos = contar(con_fecha)
+        return {"tramos": etiquetas, "conteos": conteos, "sin_fecha": int((~con_fecha).sum())}
+
+    def _histograma_python(self, anios, bordes: List[float], etiquetas: List[str], por_tipo: bool) -> Dict:
+        vacio = lambda: [0] * len(bordes)
+        conteos = {c: vacio() for c in self.categorias} if por_tipo else vacio()
+        sin_fecha = 0
+        for a, t in zip(anios, self.tipo):
+            if math.isnan(a):
+                sin_fecha += 1
+                continue
+            i = bisect.bisect_right(bordes, a) - 1
+            if i < 0:
+                continue  # antes del primer borde (fecha futura), como np.histogram
+            (conteos[self.categorias[t]] if por_tipo else conteos)[i] += 1
+        return {"tramos": etiquetas, "conteos": conteos, "sin_fecha": sin_fecha}
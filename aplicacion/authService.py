@@ -3,14 +3,27 @@
 # Servicio de autenticación.
 # - Login con verificación de hash (bcrypt)
 # - Permite validar si un usuario existe y está activo
+# - Las búsquedas por username pasan por la caché corta de UsuarioDAO,
+#   así obtener_usuario_activo + login hacen una sola consulta a la BD.
+# - Si el hash tiene un costo distinto de BCRYPT_ROUNDS, tras un login
+#   correcto se recalcula en segundo plano (no retrasa el login).
 # ==============================================================
 
+from concurrent.futures import Future
+
 from persistencia.usuarioDAO import UsuarioDAO
-from aplicacion.seguridad import verificar_password
+from aplicacion.seguridad import (
+    encriptar_password,
+    enviar_a_pool_hash,
+    necesita_rehash,
+    verificar_password,
+    verificar_password_async,
+)
 
 class AuthService:
-    def __init__(self):
-        self.dao = UsuarioDAO()
+    def __init__(self, dao=None):
+        # `dao` permite inyectar otro almacén (p. ej. el de los benchmarks)
+        self.dao = dao if dao is not None else UsuarioDAO()
 
     def obtener_usuario_activo(self, username: str):
         """
@@ -30,6 +43,11 @@ class AuthService:
         """
         Autentica al usuario validando su contraseña encriptada.
         """
+        user = self._usuario_para_login(username, password)
+        return self._resultado_login(user, password, verificar_password(password, user.password_hash))
+
+    def _usuario_para_login(self, username: str, password: str):
+        """Valida los datos y busca el usuario (BD o caché). Lanza ValueError si no sirve."""
         if not username.strip():
             raise ValueError("El usuario no puede estar vacío.")
         if not password.strip():
@@ -39,8 +57,49 @@ class AuthService:
 
         if user is None or not getattr(user, "activo", False):
             raise ValueError("Usuario no encontrado o inactivo.")
+        return user
 
-        if not verificar_password(password, user.password_hash):
+    def _resultado_login(self, user, password: str, coincide: bool):
+        if not coincide:
             raise ValueError("Contraseña incorrecta.")
 
+        if necesita_rehash(user.password_hash):
+            enviar_a_pool_hash(self._rehashear, user.id, user.username, password, user.password_hash)
+
         return user
+
+    def _rehashear(self, id_usuario: int, username: str, password: str, hash_anterior: str) -> bool:
+        """Recalcula el hash con el costo configurado. Los errores no afectan al login."""
+        try:
+            actualizado = self.dao.actualizar_password_hash(
+                id_usuario, encriptar_password(password), hash_anterior
+            )
+            UsuarioDAO.invalidar_cache(username)
+            return actualizado
+        except Exception as e:
+            print(f"⚠ No se pudo actualizar el hash de '{username}': {e}")
+            return False
+
+    def login_async(self, username: str, password: str) -> Future:
+        """
+        Versión no bloqueante de login.
+        La búsqueda del usuario (E/S contra la BD o la caché) se hace en el hilo
+        de quien llama; al pool de hashing solo va bcrypt.checkpw, que es para lo
+        que está dimensionado (HASH_WORKERS = núcleos, no conexiones).
+        El Future resuelve al Usuario o lanza ValueError al pedir .result().
+        """
+        resultado: Future = Future()
+        try:
+            user = self._usuario_para_login(username, password)
+        except Exception as e:
+            resultado.set_exception(e)
+            return resultado
+
+        def _completar(verificacion: Future) -> None:
+            try:
+                resultado.set_result(self._resultado_login(user, password, verificacion.result()))
+            except Exception as e:
+                resultado.set_exception(e)
+
+        verificar_password_async(password, user.password_hash).add_done_callback(_completar)
+        return resultado
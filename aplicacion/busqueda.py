@@ -0,0 +1,271 @@
+# aplicacion/busqueda.py
+# ==============================================================
+# BÚSQUEDA POR TEXTO (empleados, proyectos, departamentos)
+# --------------------------------------------------------------
+# Estrategia:
+#   1) MySQL FULLTEXT (MATCH ... AGAINST, migración 3): usa el índice,
+#      ordena por relevancia y no recorre la tabla.
+#   2) Si FULLTEXT no encuentra nada, o el texto solo trae términos más
+#      cortos que los que indexa MySQL, se busca por prefijo del nombre
+#      (LIKE 'texto%' ... LIMIT, rango sobre el índice de nombre; nunca
+#      '%texto%', que recorre la tabla entera).
+#   3) Si tampoco hay prefijos, o la BD no tiene el índice FULLTEXT, se
+#      usa un índice de n-gramas en memoria (IndiceNgramas), que encuentra
+#      fragmentos de palabra ("erez" -> "Pérez") y errores de tipeo. Se
+#      construye la primera vez que hace falta y después los servicios lo
+#      mantienen fila a fila (refrescar) en vez de descartarlo en cada
+#      escritura. FULLTEXT se vuelve a probar pasado
+#      config.BUSQUEDA_REINTENTO_FULLTEXT segundos.
+#
+# IndiceNgramas guarda, para cada trigrama, los ids que lo contienen y
+# el peso del campo donde aparece. Una búsqueda solo visita las listas
+# de los trigramas de la consulta (no todas las filas) y puntúa por
+# trigramas coincidentes ponderados por IDF y por peso de campo, así
+# tolera errores de tipeo y búsquedas por prefijo.
+# ==============================================================
+
+import heapq
+import math
+import re
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+
+from aplicacion import config
+from persistencia import empleadoDAO
+from persistencia.departamentoDAO import DepartamentoDAO
+from persistencia.proyectoDAO import ProyectoDAO
+from persistencia.texto_completo import es_error_fulltext
+
+_SEPARADORES = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalizar(texto) -> str:
+    """Minúsculas y sin tildes ("Pérez" -> "perez")."""
+    t = unicodedata.normalize("NFKD", str(texto or ""))
+    return "".join(c for c in t if not unicodedata.combining(c)).casefold()
+
+def _tokens(texto) -> list:
+    return [t for t in _SEPARADORES.split(normalizar(texto)) if t]
+
+
+class IndiceNgramas:
+    """Índice invertido de n-gramas sobre algunos campos de filas (dicts)."""
+
+    def __init__(self, campos: dict, clave_id: str, n: int = 3, umbral: float = 0.5) -> None:
+        """
+        campos : {campo: peso}, p. ej. {"nombre": 3, "correo": 1}
+        umbral : fracción mínima (ponderada) de n-gramas de la consulta que debe
+                 tener una fila para aparecer en los resultados.
+        """
+        maximo = max(campos.values())
+        self.campos = {c: p / maximo for c, p in campos.items()}
+        self.clave_id = clave_id
+        self.n = n
+        self.umbral = umbral
+        self._filas = {}                    # id -> fila
+        self._gramas = {}                   # id -> {grama: peso}
+        self._postings = defaultdict(dict)  # grama -> {id: peso}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._filas)
+
+    def _gramas_token(self, token: str, prefijo: bool = False) -> set:
+        # Se rellena con espacios para que los tokens cortos también generen
+        # n-gramas y el inicio de palabra pese más. En la consulta no se
+        # rellena el final: así "ped" encuentra "pedro" (búsqueda por prefijo).
+        t = f" {token}" if prefijo else f" {token} "
+        if len(t) < self.n:
+            return {t}
+        return {t[i:i + self.n] for i in range(len(t) - self.n + 1)}
+
+    def _gramas_fila(self, fila: dict) -> dict:
+        gramas = {}
+        for campo, peso in self.campos.items():
+            for token in _tokens(fila.get(campo)):
+                for g in self._gramas_token(token):
+                    if peso > gramas.get(g, 0):
+                        gramas[g] = peso
+        return gramas
+
+    def agregar(self, fila: dict) -> None:
+        id_ = fila[self.clave_id]
+        with self._lock:
+            self.eliminar(id_)
+            gramas = self._gramas_fila(fila)
+            self._filas[id_] = fila
+            self._gramas[id_] = gramas
+            for g, peso in gramas.items():
+                self._postings[g][id_] = peso
+
+    def eliminar(self, id_) -> None:
+        with self._lock:
+            if self._filas.pop(id_, None) is None:
+                return
+            for g in self._gramas.pop(id_, {}):
+                posting = self._postings.get(g)
+                if posting is not None:
+                    posting.pop(id_, None)
+                    if not posting:
+                        del self._postings[g]
+
+    def buscar(self, texto: str, limite: int = 50) -> list:
+        """Filas (copias con clave "relevancia") ordenadas de más a menos relevante."""
+        tokens = _tokens(texto)
+        if not tokens:
+            return []
+        with self._lock:
+            total = len(self._filas) or 1
+            consulta = set()
+            for t in tokens:
+                consulta |= self._gramas_token(t, prefijo=True)
+            idf = {g: math.log(1 + total / (1 + len(self._postings.get(g, ())))) for g in consulta}
+            maximo = sum(idf.values())
+
+            # cobertura: fracción (por IDF) de n-gramas de la consulta presentes en la fila;
+            # puntaje: lo mismo pero ponderado por el peso del campo donde aparecen.
+            cobertura = defaultdict(float)
+            puntajes = defaultdict(float)
+            for g in consulta:
+                for id_, peso in self._postings.get(g, {}).items():
+                    cobertura[id_] += idf[g]
+                    puntajes[id_] += idf[g] * peso
+
+            frase = " ".join(tokens)
+            candidatos = []
+            for id_, c in cobertura.items():
+                if c / maximo < self.umbral:
+                    continue
+                puntaje = puntajes[id_] / maximo
+                fila = self._filas[id_]
+                # Bonus si el texto aparece tal cual en algún campo
+                for campo, peso in self.campos.items():
+                    if frase in normalizar(fila.get(campo)):
+                        puntaje += 0.5 * peso
+                        break
+                candidatos.append((puntaje, id_))
+
+            mejores = heapq.nlargest(limite, candidatos, key=lambda c: c[0])
+            return [dict(self._filas[id_], relevancia=round(p, 4)) for p, id_ in mejores]
+
+
+class BuscadorTexto:
+    """
+    Combina la búsqueda FULLTEXT del DAO, la búsqueda por prefijo del nombre
+    y el índice de n-gramas en memoria (para lo que las otras dos no encuentran).
+    """
+
+    def __init__(self, nombre: str, buscar_fulltext, buscar_prefijo, cargar_bloques, cargar_fila,
+                 clave_id: str, campos: dict) -> None:
+        self.nombre = nombre
+        self._buscar_fulltext = buscar_fulltext
+        self._buscar_prefijo = buscar_prefijo
+        self._cargar_bloques = cargar_bloques
+        self._cargar_fila = cargar_fila
+        self._clave_id = clave_id
+        self._campos = campos
+        self._indice = None
+        self._lock = threading.Lock()
+        self._reintentar_fulltext_en = 0.0   # time.monotonic(); 0 = disponible
+        self.consultas_fulltext = 0
+        self.consultas_prefijo = 0
+        self.consultas_ngramas = 0
+
+    @property
+    def fulltext_disponible(self) -> bool:
+        return time.monotonic() >= self._reintentar_fulltext_en
+
+    def _indice_listo(self) -> IndiceNgramas:
+        with self._lock:
+            if self._indice is None:
+                indice = IndiceNgramas(self._campos, self._clave_id)
+                for bloque in self._cargar_bloques(1000):
+                    for fila in bloque:
+                        indice.agregar(fila)
+                self._indice = indice
+            return self._indice
+
+    def _ngramas(self, texto: str, limite: int) -> list:
+        self.consultas_ngramas += 1
+        return self._indice_listo().buscar(texto, limite)
+
+    def buscar(self, texto: str, limite: int = 50) -> list:
+        texto = (texto or "").strip()
+        if not texto:
+            return []
+        if not self.fulltext_disponible:
+            return self._ngramas(texto, limite)
+        try:
+            filas = self._buscar_fulltext(texto, limite)
+        except Exception as e:
+            if not es_error_fulltext(e):
+                raise
+            print(f"⚠ Búsqueda FULLTEXT de {self.nombre} no disponible ({e}); "
+                  f"se usa el índice en memoria y se reintenta en "
+                  f"{config.BUSQUEDA_REINTENTO_FULLTEXT:g} s.")
+            self._reintentar_fulltext_en = time.monotonic() + config.BUSQUEDA_REINTENTO_FULLTEXT
+            return self._ngramas(texto, limite)
+
+        self._reintentar_fulltext_en = 0.0
+        if filas:
+            self.consultas_fulltext += 1
+            return filas
+        # Sin resultados (o términos demasiado cortos): prefijo con índice y LIMIT
+        self.consultas_prefijo += 1
+        filas = [dict(f, relevancia=0.0) for f in self._buscar_prefijo(texto, limite)]
+        return filas or self._ngramas(texto, limite)
+
+    def refrescar(self, id_) -> None:
+        """
+        Lleva al índice en memoria (si está armado) la fila `id_` tal como quedó
+        en la BD tras un alta o edición; si ya no existe, la quita.
+        """
+        indice = self._indice
+        if indice is None or id_ is None:
+            return
+        fila = self._cargar_fila(id_)
+        if fila is None:
+            indice.eliminar(id_)
+        else:
+            indice.agregar(fila)
+
+    def eliminar(self, id_) -> None:
+        """Quita una fila borrada del índice en memoria (si está armado)."""
+        indice = self._indice
+        if indice is not None:
+            indice.eliminar(id_)
+
+    def invalidar(self) -> None:
+        """Descarta el índice en memoria (cargas masivas); se rearma si vuelve a hacer falta."""
+        with self._lock:
+            self._indice = None
+
+    def estadisticas(self) -> dict:
+        indice = self._indice
+        return {
+            "fulltext_disponible": self.fulltext_disponible,
+            "consultas_fulltext": self.consultas_fulltext,
+            "consultas_prefijo": self.consultas_prefijo,
+            "consultas_ngramas": self.consultas_ngramas,
+            "filas_indice_memoria": len(indice) if indice is not None else 0,
+        }
+
+
+# Un buscador por entidad (los servicios los usan y los refrescan al escribir)
+EMPLEADOS = BuscadorTexto(
+    "empleados", empleadoDAO.buscar_empleados_texto, empleadoDAO.buscar_empleados_por_prefijo,
+    empleadoDAO.iter_empleados, empleadoDAO.buscar_empleado_detalle_por_id,
+    "id_empleado", {"nombre": 3, "usuario": 2, "correo": 1},
+)
+PROYECTOS = BuscadorTexto(
+    "proyectos", ProyectoDAO.buscar_proyectos_texto, ProyectoDAO.buscar_proyectos_por_prefijo,
+    ProyectoDAO.iter_proyectos, ProyectoDAO.obtener_proyecto_por_id,
+    "id_proyecto", {"nombre": 3, "descripcion": 1},
+)
+DEPARTAMENTOS = BuscadorTexto(
+    "departamentos", DepartamentoDAO.buscar_departamentos_texto, DepartamentoDAO.buscar_departamentos_por_prefijo,
+    DepartamentoDAO.iter_departamentos, DepartamentoDAO.obtener_departamento_por_id,
+    "id_departamento", {"nombre": 1},
+)
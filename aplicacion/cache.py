@@ -0,0 +1,114 @@
+# aplicacion/cache.py
+# ==============================================================
+# Caché en memoria con TTL y tamaño acotado (LRU), thread-safe.
+# --------------------------------------------------------------
+# - Cada entrada vence `ttl` segundos después de guardarse.
+# - Si se supera `max_entradas` se descarta la usada hace más tiempo.
+# - Lleva contadores de aciertos/fallos para poder medir su efecto.
+# ==============================================================
+
+import threading
+import time
+from collections import OrderedDict
+
+_FALTA = object()
+
+
+class CacheTTL:
+    """Diccionario con vencimiento por tiempo y política LRU."""
+
+    def __init__(self, ttl: float = 30, max_entradas: int = 1024) -> None:
+        if max_entradas < 1:
+            raise ValueError("max_entradas debe ser al menos 1.")
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        self._datos = OrderedDict()  # clave -> (vence_en, valor)
+        self._lock = threading.Lock()
+        self._aciertos = 0
+        self._fallos = 0
+
+    def obtener(self, clave, defecto=None):
+        """Retorna el valor guardado o `defecto` si no está o ya venció."""
+        ahora = time.monotonic()
+        with self._lock:
+            item = self._datos.get(clave, _FALTA)
+            if item is not _FALTA and item[0] > ahora:
+                self._datos.move_to_end(clave)
+                self._aciertos += 1
+                return item[1]
+            if item is not _FALTA:
+                del self._datos[clave]
+            self._fallos += 1
+            return defecto
+
+    def guardar(self, clave, valor) -> None:
+        with self._lock:
+            self._datos[clave] = (time.monotonic() + self.ttl, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.max_entradas:
+                self._datos.popitem(last=False)
+
+    def obtener_o_cargar(self, clave, cargar):
+        """
+        Read-through: si la clave no está (o venció) llama a `cargar()`,
+        guarda el resultado y lo retorna.
+        """
+        valor = self.obtener(clave, _FALTA)
+        if valor is _FALTA:
+            valor = cargar()
+            self.guardar(clave, valor)
+        return valor
+
+    def invalidar(self, clave) -> None:
+        with self._lock:
+            self._datos.pop(clave, None)
+
+    def invalidar_si(self, condicion) -> int:
+        """Borra las entradas cuya clave cumple `condicion(clave)`. Retorna cuántas borró."""
+        with self._lock:
+            claves = [c for c in self._datos if condicion(c)]
+            for c in claves:
+                del self._datos[c]
+        return len(claves)
+
+    def limpiar(self) -> None:
+        with self._lock:
+            self._datos.clear()
+
+    def estadisticas(self) -> dict:
+        with self._lock:
+            total = self._aciertos + self._fallos
+            return {
+                "aciertos": self._aciertos,
+                "fallos": self._fallos,
+                "tasa_aciertos": self._aciertos / total if total else 0.0,
+                "entradas": len(self._datos),
+                "max_entradas": self.max_entradas,
+                "ttl": self.ttl,
+            }
+
+
+def bloques_con_cache(cache: CacheTTL, clave, generar_bloques, tamano_bloque: int, max_filas: int):
+    """
+    Generador de bloques (listas) con read-through sobre `cache`.
+    - Si `clave` está en caché, entrega esa lista troceada en bloques.
+    - Si no, reenvía los bloques de `generar_bloques(tamano_bloque)` y, si se
+      recorrió completo sin superar `max_filas`, guarda el resultado.
+      Así las tablas pequeñas quedan en memoria y las grandes siguen en streaming.
+    Entrega copias de las filas para que quien las modifique no altere la caché.
+    """
+    filas = cache.obtener(clave)
+    if filas is not None:
+        for i in range(0, len(filas), tamano_bloque):
+            yield [dict(f) for f in filas[i:i + tamano_bloque]]
+        return
+
+    acumuladas = []
+    for bloque in generar_bloques(tamano_bloque):
+        if acumuladas is not None:
+            acumuladas.extend(dict(f) for f in bloque)
+            if len(acumuladas) > max_filas:
+                acumuladas = None  # demasiado grande para cachear
+        yield bloque
+    if acumuladas is not None:
+        cache.guardar(clave, acumuladas)
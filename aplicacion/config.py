@@ -15,6 +15,12 @@ def env_int(key: str, default: int = 0) -> int:
     except Exception:
         return default
 
+def env_float(key: str, default: float = 0.0) -> float:
+    try:
+        return float(os.getenv(key, default))
+    except Exception:
+        return default
+
 # ---- Config BD ----
 DB_HOST     = env_str("DB_HOST", "127.0.0.1")
 DB_PORT     = env_int("DB_PORT", 3306)
@@ -24,3 +30,43 @@ DB_PASSWORD = env_str("DB_PASSWORD", "")
 
 # ---- Seguridad ----
 BCRYPT_ROUNDS = env_int("BCRYPT_ROUNDS", 12)
+HASH_WORKERS  = env_int("HASH_WORKERS", os.cpu_count() or 2)  # hilos para bcrypt
+USUARIOS_CACHE_TTL = env_float("USUARIOS_CACHE_TTL", 30)  # segundos; 0 = sin caché
+USUARIOS_CACHE_MAX = env_int("USUARIOS_CACHE_MAX", 1024)
+
+# ---- Caché de catálogos (departamentos / proyectos) ----
+CATALOGO_CACHE_TTL       = env_float("CATALOGO_CACHE_TTL", 60)      # segundos; 0 = sin caché
+CATALOGO_CACHE_MAX       = env_int("CATALOGO_CACHE_MAX", 256)       # entradas (páginas, ids, listados)
+CATALOGO_CACHE_MAX_FILAS = env_int("CATALOGO_CACHE_MAX_FILAS", 5000) # listados más grandes no se cachean
+
+# ---- Búsqueda por texto ----
+BUSQUEDA_REINTENTO_FULLTEXT = env_float("BUSQUEDA_REINTENTO_FULLTEXT", 300)  # segundos sin FULLTEXT tras un error
+
+# ---- Ingesta por lotes de turnos ----
+TURNOS_TAMANO_LOTE    = env_int("TURNOS_TAMANO_LOTE", 500)       # turnos por INSERT multi-fila
+TURNOS_INTERVALO_MAX  = env_float("TURNOS_INTERVALO_MAX", 1.0)   # segundos máx. antes de escribir
+TURNOS_CAPACIDAD_COLA = env_int("TURNOS_CAPACIDAD_COLA", 10000)  # turnos en espera (back-pressure)
+
+# ---- Reportes de horas ----
+HORAS_JORNADA_MAX = env_float("HORAS_JORNADA_MAX", 8)   # horas por día antes de contar horas extra
+HORAS_SEMANA_MAX  = env_float("HORAS_SEMANA_MAX", 40)   # horas por semana antes de contar horas extra
+REPORTES_USAR_RESUMEN = bool(env_int("REPORTES_USAR_RESUMEN", 1))  # 0 = agregar sobre REGISTRODETURNO
+
+# ---- Pool de conexiones BD ----
+DB_POOL_MIN              = env_int("DB_POOL_MIN", 1)
+DB_POOL_MAX              = env_int("DB_POOL_MAX", 10)
+DB_POOL_IDLE_TIMEOUT     = env_int("DB_POOL_IDLE_TIMEOUT", 300)   # segundos
+DB_POOL_CHECKOUT_TIMEOUT = env_int("DB_POOL_CHECKOUT_TIMEOUT", 10) # segundos
+
+# ---- Caché de la API de países ----
+API_CACHE_DIR          = env_str("API_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "app_paises"))
+API_CACHE_TTL          = env_int("API_CACHE_TTL", 86400)   # segundos (1 día)
+API_CACHE_MAX_ENTRADAS = env_int("API_CACHE_MAX_ENTRADAS", 500)
+API_PAISES_SNAPSHOT    = env_str("API_PAISES_SNAPSHOT", "")  # JSON con /all para trabajar sin red
+
+# ---- Cliente HTTP de la API de países ----
+API_TIMEOUT     = env_float("API_TIMEOUT", 8.0)    # segundos (conexión y lectura)
+API_REINTENTOS  = env_int("API_REINTENTOS", 3)     # reintentos ante 5xx / errores de conexión
+API_BACKOFF     = env_float("API_BACKOFF", 0.5)    # espera base exponencial entre reintentos
+API_POOL_MAX    = env_int("API_POOL_MAX", 10)      # conexiones keep-alive por host
+API_CONCURRENCIA = env_int("API_CONCURRENCIA", 8)  # hilos para consultas en paralelo
@@ -17,6 +17,8 @@
 from datetime import datetime
 from dominio.empleado import Empleado
 from persistencia import empleadoDAO   # DAO expuesto como módulo (archivo único)
+from persistencia.unidad_trabajo import UnidadDeTrabajo, despues_de_confirmar
+from aplicacion import busqueda, importacion_lotes
 
 # --------------------------------------------------------------
 # PARSERS / VALIDADORES
@@ -88,7 +90,8 @@ def crear_empleado(
     fecha_inicio: str,
     salario: int | float,
     usuario: str,
-    tipo_empleado_str: str
+    tipo_empleado_str: str,
+    uow: UnidadDeTrabajo | None = None
 ) -> None:
     """
     Crea un nuevo empleado.
@@ -98,6 +101,20 @@ def crear_empleado(
       3) Normalizar teléfono (int si son solo dígitos; si no, se guarda como texto).
       4) Construir el objeto de dominio Empleado.
       5) Delegar el INSERT al DAO.
+    Con `uow` el índice de búsqueda se actualiza recién tras el commit de la unidad.
+    """
+    emp = _construir_empleado(nombre, direccion, telefono, correo, fecha_inicio,
+                              salario, usuario, tipo_empleado_str)
+
+    # 5) Enviar al DAO para que haga el INSERT real en la BD
+    nuevo_id = empleadoDAO.insert_empleado(emp, uow=uow)
+    despues_de_confirmar(uow, lambda: busqueda.EMPLEADOS.refrescar(nuevo_id))
+
+def _construir_empleado(nombre, direccion, telefono, correo, fecha_inicio,
+                        salario, usuario, tipo_empleado_str) -> Empleado:
+    """
+    Pasos 1) a 4) de crear_empleado: valida, normaliza y construye el Empleado.
+    Lanza ValueError si algún dato no es válido. Se comparte con la importación masiva.
     """
     # 1) Validación mínima: evita registros incompletos en BD
     if not (nombre and direccion and correo and usuario and tipo_empleado_str):
@@ -112,7 +129,7 @@ def crear_empleado(
     tel_valor = int(tel_texto) if tel_texto.isdigit() else tel_texto
 
     # 4) Construimos el objeto de dominio (lo que tu capa de persistencia espera)
-    emp = Empleado(
+    return Empleado(
         id_empleado=None,               # None porque la PK se autogenera (AUTO_INCREMENT)
         nombre=nombre.strip(),
         direccion=direccion.strip(),
@@ -124,8 +141,74 @@ def crear_empleado(
         tipo_empleado=tipo_enum
     )
 
-    # 5) Enviar al DAO para que haga el INSERT real en la BD
-    empleadoDAO.insert_empleado(emp)
+# --------------------------------------------------------------
+# C  =  CREATE masivo (importación por lotes)
+# --------------------------------------------------------------
+
+# Claves esperadas en cada fila a importar (mismo orden que crear_empleado)
+CAMPOS_IMPORTACION = ("nombre", "direccion", "telefono", "correo", "fecha_inicio",
+                      "salario", "usuario", "tipo_empleado")
+
+def importar_empleados(filas, tamano_lote: int = 500) -> dict:
+    """
+    Importa muchos empleados de una vez (p.ej. una carga desde RR.HH.).
+
+    Parámetros:
+        filas       : iterable de dicts con las claves de CAMPOS_IMPORTACION.
+                      Se consume de a un lote, no se carga completo en memoria.
+        tamano_lote : filas por INSERT multi-fila / commit.
+
+    Flujo:
+        1) Cada fila se valida con las mismas reglas que crear_empleado
+           (_parse_tipo_empleado, _parse_fecha, ...). Las inválidas se rechazan
+           y se informan sin detener la importación.
+        2) Las válidas se acumulan y se insertan por lotes con executemany (un commit por lote).
+        3) Si un lote falla en la BD (p.ej. un dato que viola una restricción), se reintenta
+           fila por fila para aislar las filas problemáticas y no perder las demás.
+
+    Retorna:
+        {"insertados": int, "lotes": int,
+         "rechazados": [(numero_fila, motivo), ...],   # numero_fila empieza en 1
+         "errores_lote": [(numero_lote, motivo), ...]}
+    (el esquema de lotes está en aplicacion/importacion_lotes.py)
+    """
+    resultado = importacion_lotes.importar_por_lotes(
+        filas, _empleado_desde_fila, empleadoDAO.insert_empleados_lote, tamano_lote)
+    if resultado["insertados"]:
+        busqueda.EMPLEADOS.invalidar()
+    return resultado
+
+def _empleado_desde_fila(fila: dict) -> Empleado:
+    return _construir_empleado(*[fila.get(campo) for campo in CAMPOS_IMPORTACION])
+
+# --------------------------------------------------------------
+# R  =  READ (listado paginado)
+# --------------------------------------------------------------
+
+def listar_empleados(after_nombre: str | None = None, after_id: int | None = None,
+                     limit: int | None = None) -> list[dict]:
+    """
+    Devuelve los empleados ordenados por (nombre, id_empleado); sin `limit`, todos.
+    Con `limit` devuelve una página por keyset: para la página siguiente se pasan
+    el nombre y el id de la última fila recibida. Así la página N cuesta lo mismo
+    que la página 1.
+    Retorna: lista de dicts (vacía si no hay más filas).
+    """
+    if after_id is not None:
+        after_id = int(after_id)
+    if limit is not None:
+        limit = int(limit)
+    return empleadoDAO.listar_empleados(after_nombre=after_nombre, after_id=after_id, limit=limit)
+
+def buscar_empleados(texto: str, limite: int = 50) -> list[dict]:
+    """
+    Búsqueda por texto en nombre, usuario y correo, de más a menos relevante.
+    Usa el índice FULLTEXT de la BD; si no encuentra nada (o el texto es muy
+    corto) busca por prefijo del nombre, y como último recurso en el índice de
+    n-gramas en memoria (ver aplicacion/busqueda.py).
+    Cada dict trae además la clave "relevancia".
+    """
+    return busqueda.EMPLEADOS.buscar(texto, int(limite))
 
 # --------------------------------------------------------------
 # U  =  UPDATE
@@ -140,7 +223,8 @@ def editar_empleado(
     fecha_inicio: str,
     salario: int | float,
     usuario: str,
-    tipo_empleado_str: str
+    tipo_empleado_str: str,
+    uow: UnidadDeTrabajo | None = None
 ) -> int:
     """
     Edita un empleado existente por su ID.
@@ -171,19 +255,23 @@ def editar_empleado(
         fecha_inicio=fecha_dt.strftime("%Y-%m-%d %H:%M:%S"),
         salario=float(salario),
         usuario=(usuario or "").strip(),
-        tipo_empleado=tipo_enum.value
+        tipo_empleado=tipo_enum.value,
+        uow=uow
     )
+    despues_de_confirmar(uow, lambda: busqueda.EMPLEADOS.refrescar(int(id_empleado)))
     return filas
 
 # --------------------------------------------------------------
 # D  =  DELETE (ELIMINACIÓN DE LA BD)
 # --------------------------------------------------------------
 
-def eliminar_empleado(id_empleado: int) -> int:
+def eliminar_empleado(id_empleado: int, uow: UnidadDeTrabajo | None = None) -> int:
     """
     Elimina físicamente (DELETE) un empleado por su ID.
     Retorna: filas afectadas (0 si no existía / 1 si se borró).
     Nota: "eliminación física" significa que el registro desaparece de la BD;
           si prefieres eliminación lógica, habría que usar un campo 'activo=0'.
     """
-    return empleadoDAO.eliminar_empleado_por_id(int(id_empleado))
+    filas = empleadoDAO.eliminar_empleado_por_id(int(id_empleado), uow=uow)
+    despues_de_confirmar(uow, lambda: busqueda.EMPLEADOS.eliminar(int(id_empleado)))
+    return filas
@@ -10,12 +10,37 @@
 #   * Validar/normalizar entradas (por ejemplo, nombre con largo mínimo).
 #   * Construir objetos de dominio coherentes.
 #   * Delegar las operaciones CRUD al DAO.
+#   * Cachear las lecturas (catálogo pequeño y muy consultado): caché
+#     read-through con TTL y tamaño acotado; las escrituras invalidan
+#     solo las entradas afectadas. Toda lectura acepta usar_cache=False.
 # ==============================================================
 
 # Importamos la clase con el Enum (modelo de dominio)
 from dominio.departamento import Departamento
 # Importamos el DAO que hace las consultas a BD
 from persistencia.departamentoDAO import DepartamentoDAO
+from persistencia import empleadoDAO
+from persistencia.unidad_trabajo import UnidadDeTrabajo, despues_de_confirmar
+# Búsqueda por texto (FULLTEXT con respaldo de n-gramas en memoria)
+from aplicacion import busqueda
+from aplicacion import config
+from aplicacion.cache import CacheTTL, bloques_con_cache
+
+# Claves: ("id", id_departamento) | ("pagina", after_nombre, after_id, limit) | ("todos",)
+_cache = CacheTTL(ttl=config.CATALOGO_CACHE_TTL, max_entradas=config.CATALOGO_CACHE_MAX)
+
+def _invalidar(id_departamento=None) -> None:
+    """
+    Invalida lo que una escritura puede haber cambiado: los listados (un alta,
+    cambio de nombre o baja mueve filas entre páginas) y, si se indica, la
+    entrada por id de ese departamento. Las entradas por id de los demás se conservan.
+    El índice de búsqueda en memoria solo se actualiza en esa fila.
+    Dentro de una UnidadDeTrabajo se llama recién tras su commit (despues_de_confirmar).
+    """
+    _cache.invalidar_si(lambda clave: clave[0] != "id")
+    if id_departamento is not None:
+        _cache.invalidar(("id", int(id_departamento)))
+        busqueda.DEPARTAMENTOS.refrescar(int(id_departamento))
 
 class gestiondepartamento:
     """
@@ -26,7 +51,8 @@ class gestiondepartamento:
 
     # ================== C  (CREATE) ==================
     @staticmethod
-    def crear_departamento(nombre: str, tipo: Departamento.TipoDepartamento):
+    def crear_departamento(nombre: str, tipo: Departamento.TipoDepartamento,
+                           uow: UnidadDeTrabajo | None = None):
         """
         Crea un nuevo departamento.
         - Valida que el nombre tenga un largo mínimo razonable.
@@ -50,14 +76,17 @@ class gestiondepartamento:
         )
 
         # Delegamos el INSERT al DAO (maneja conexión y SQL)
-        DepartamentoDAO.guardar_departamento(departamento)
+        nuevo_id = DepartamentoDAO.guardar_departamento(departamento, uow=uow)
+        departamento.establecer_id_departamento(nuevo_id)
+        despues_de_confirmar(uow, lambda: _invalidar(nuevo_id))
 
         # Devolvemos el objeto por si la capa superior quiere mostrarlo/usar su info
         return departamento
 
     # ================== U  (UPDATE) ==================
     @staticmethod
-    def editar_departamento(id_departamento: int, nuevo_nombre: str, nuevo_tipo: Departamento.TipoDepartamento):
+    def editar_departamento(id_departamento: int, nuevo_nombre: str, nuevo_tipo: Departamento.TipoDepartamento,
+                            uow: UnidadDeTrabajo | None = None):
         """
         Actualiza un departamento existente.
         - Valida el nuevo nombre (mismo criterio de creación).
@@ -78,11 +107,12 @@ class gestiondepartamento:
         )
 
         # Delegamos el UPDATE al DAO
-        DepartamentoDAO.actualizar_departamento(departamento_actualizado)
+        DepartamentoDAO.actualizar_departamento(departamento_actualizado, uow=uow)
+        despues_de_confirmar(uow, lambda: _invalidar(id_departamento))
 
     # ================== D  (DELETE) ==================
     @staticmethod
-    def eliminar_departamento(id_departamento: int):
+    def eliminar_departamento(id_departamento: int, uow: UnidadDeTrabajo | None = None):
         """
         Elimina un departamento por su ID (ELIMINACIÓN en bd).
         - Valida que el ID sea un entero positivo.
@@ -99,14 +129,16 @@ class gestiondepartamento:
             return
 
         # Delegamos el DELETE al DAO
-        DepartamentoDAO.eliminar_departamento(id_int)
+        DepartamentoDAO.eliminar_departamento(id_int, uow=uow)
+        despues_de_confirmar(uow, lambda: _invalidar(id_int))
 
     # ================== R  (READ por ID) ==================
     @staticmethod
-    def obtener_departamento_por_id(id_departamento: int):
+    def obtener_departamento_por_id(id_departamento: int, usar_cache: bool = True):
         """
         Busca un departamento por su ID.
         - Valida el ID.
+        - Con usar_cache=True responde desde la caché si el dato sigue vigente.
         - Retorna un dict con {id_departamento, nombre, tipo_departamento} si existe;
           o None si no se encuentra / el ID no es válido.
         """
@@ -121,19 +153,86 @@ class gestiondepartamento:
             return None
 
         # Delegamos la búsqueda al DAO (SELECT ... WHERE id=...)
-        return DepartamentoDAO.obtener_departamento_por_id(id_int)
+        if not usar_cache:
+            return DepartamentoDAO.obtener_departamento_por_id(id_int)
+        fila = _cache.obtener_o_cargar(("id", id_int), lambda: DepartamentoDAO.obtener_departamento_por_id(id_int))
+        return dict(fila) if fila else fila
 
     # ================== R  (READ listar todos) ==================
     @staticmethod
-    def listar_departamentos():
+    def listar_departamentos(after_nombre=None, after_id=None, limit=None, usar_cache: bool = True):
         """
         Lista todos los departamentos.
+        Con `limit` devuelve solo una página (paginación por keyset sobre
+        nombre, id_departamento): after_nombre/after_id = última fila de la página anterior.
         Retorna:
             Lista de dicts con la forma:
             [{ 'id_departamento': ..., 'nombre': ..., 'tipo_departamento': ... }, ...]
         (El formato exacto depende de cómo lo arme el DAO).
+        Con usar_cache=True cada página se guarda en la caché (clave = parámetros).
+        """
+        if not usar_cache:
+            return DepartamentoDAO.listar_departamentos(after_nombre, after_id, limit)
+        filas = _cache.obtener_o_cargar(
+            ("pagina", after_nombre, after_id, limit),
+            lambda: DepartamentoDAO.listar_departamentos(after_nombre, after_id, limit),
+        )
+        return [dict(f) for f in filas]
+
+    # ================== R  (READ recorrer en bloques) ==================
+    @staticmethod
+    def iter_departamentos(tamano_bloque: int = 500, usar_cache: bool = True):
+        """
+        Recorre todos los departamentos en bloques (listas de dicts) de hasta
+        `tamano_bloque` elementos, sin cargar la tabla completa en memoria.
+        Útil para paginar en la UI o exportar.
+        Con usar_cache=True, si la tabla entera cabe en CATALOGO_CACHE_MAX_FILAS
+        queda en caché y los recorridos siguientes no van a la BD.
+        """
+        if not usar_cache:
+            return DepartamentoDAO.iter_departamentos(tamano_bloque)
+        return bloques_con_cache(_cache, ("todos",), DepartamentoDAO.iter_departamentos,
+                                 tamano_bloque, config.CATALOGO_CACHE_MAX_FILAS)
+
+    # ================== R  (READ con dotación y salarios) ==================
+    @staticmethod
+    def iter_departamentos_con_resumen(tamano_bloque: int = 500):
+        """
+        Recorre los departamentos en bloques de hasta `tamano_bloque` dicts, cada uno
+        con 'empleados' y 'total_salarios'. Una consulta agregada por bloque
+        (paginación keyset), nunca una por departamento.
+        No usa la caché: los totales cambian con cada alta/baja de empleados.
+        """
+        after_nombre = after_id = None
+        while True:
+            bloque = DepartamentoDAO.listar_departamentos_con_resumen(after_nombre, after_id, tamano_bloque)
+            if not bloque:
+                return
+            yield bloque
+            if len(bloque) < tamano_bloque:
+                return
+            after_nombre, after_id = bloque[-1]["nombre"], bloque[-1]["id_departamento"]
+
+    @staticmethod
+    def empleados_del_departamento(id_departamento: int):
+        """Lista de dicts (formato de empleadoDAO) con los empleados del departamento."""
+        return empleadoDAO.listar_empleados_de_departamento(int(id_departamento))
+
+    # ================== U  (asignar empleados) ==================
+    @staticmethod
+    def asignar_empleados(id_departamento: int, ids_empleados) -> int:
+        """
+        Mueve los empleados indicados al departamento, en una sola transacción.
+        Retorna cuántos empleados cambiaron de departamento.
+        Lanza ValueError (sin mover a nadie) si el departamento no existe o con los
+        IDs de empleado que no existen; ambos se comprueban dentro de la transacción.
         """
-        return DepartamentoDAO.listar_departamentos()
+        return empleadoDAO.asignar_departamento([int(i) for i in ids_empleados], int(id_departamento))
+
+    @staticmethod
+    def quitar_empleados(ids_empleados) -> int:
+        """Deja sin departamento a los empleados indicados. Retorna cuántos cambiaron (ValueError si alguno no existe)."""
+        return empleadoDAO.asignar_departamento([int(i) for i in ids_empleados], None)
 
     # ================== R  (READ buscar por nombre) ==================
     @staticmethod
@@ -147,3 +246,30 @@ class gestiondepartamento:
         """
         patron = (nombre or "").strip()
         return DepartamentoDAO.buscar_departamentos_por_nombre(patron)
+
+    # ================== R  (READ búsqueda por texto) ==================
+    @staticmethod
+    def buscar_departamentos(texto: str, limite: int = 50):
+        """
+        Búsqueda por texto en el nombre, de más a menos relevante.
+        - Usa el índice FULLTEXT de la BD (sin recorrer la tabla).
+        - Si no encuentra nada, o el texto es muy corto, busca por prefijo del
+          nombre (LIKE 'texto%' con índice y LIMIT).
+        - Si la BD no tiene FULLTEXT, o nada de lo anterior encuentra filas, usa
+          el índice de n-gramas en memoria (tolera tildes y errores de tipeo).
+        Retorna:
+            Lista de dicts como listar_departamentos(), con la clave extra 'relevancia'.
+        """
+        return busqueda.DEPARTAMENTOS.buscar(texto, int(limite))
+
+    # ================== Caché ==================
+    @staticmethod
+    def estadisticas_cache() -> dict:
+        """Aciertos/fallos/entradas de la caché de departamentos."""
+        return _cache.estadisticas()
+
+    @staticmethod
+    def limpiar_cache() -> None:
+        """Vacía la caché (p. ej. tras cargas masivas hechas por fuera del servicio)."""
+        _cache.limpiar()
+        busqueda.DEPARTAMENTOS.invalidar()
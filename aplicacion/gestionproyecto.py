@@ -10,10 +10,32 @@
 # Beneficios:
 #   * Separa la UI (menús) de la lógica y del acceso a datos.
 #   * Hace el código más mantenible y testeable.
+#
+# Las lecturas pasan por una caché read-through (TTL + tamaño acotado):
+# el catálogo de proyectos es pequeño y los menús lo consultan mucho.
+# crear/editar/eliminar invalidan solo lo afectado; usar_cache=False la omite.
 # ==============================================================
 
 from dominio.proyecto import Proyecto            # Modelo de dominio (clase Proyecto)
 from persistencia.proyectoDAO import ProyectoDAO # Acceso a datos (consultas SQL)
+from persistencia.proyectoEmpleadoDAO import ProyectoEmpleadoDAO  # Asignaciones proyecto <-> empleado
+from persistencia.unidad_trabajo import UnidadDeTrabajo, despues_de_confirmar
+from aplicacion import busqueda                  # Búsqueda por texto (FULLTEXT / n-gramas)
+from aplicacion import config
+from aplicacion.cache import CacheTTL, bloques_con_cache
+
+# Claves: ("pagina", after_nombre, after_id, limit) | ("todos",)
+_cache = CacheTTL(ttl=config.CATALOGO_CACHE_TTL, max_entradas=config.CATALOGO_CACHE_MAX)
+
+def _invalidar(id_proyecto=None) -> None:
+    """
+    Una escritura puede mover filas entre páginas: se descartan los listados.
+    El índice de búsqueda en memoria solo se actualiza en la fila escrita.
+    Dentro de una UnidadDeTrabajo se llama recién tras su commit (despues_de_confirmar).
+    """
+    _cache.invalidar_si(lambda clave: clave[0] in ("pagina", "todos"))
+    if id_proyecto is not None:
+        busqueda.PROYECTOS.refrescar(int(id_proyecto))
 
 class gestionProyecto:
     """
@@ -23,7 +45,7 @@ class gestionProyecto:
 
     # ===================== C  (CREATE) =====================
     @staticmethod
-    def crear_proyecto(nombre, descripcion, fecha_inicio):
+    def crear_proyecto(nombre, descripcion, fecha_inicio, uow: UnidadDeTrabajo | None = None):
         """
         Crea un nuevo Proyecto.
 
@@ -39,7 +61,7 @@ class gestionProyecto:
             4) Retornamos el objeto por si la UI quiere mostrarlo.
 
         Retorna:
-            Proyecto (instancia recién creada; OJO: no trae el id salvo que lo setees en el DAO)
+            Proyecto (instancia recién creada, con el id que asignó la BD)
         """
         # 1) Construimos el objeto de dominio. La PK (id_proyecto) la generará la BD.
         proyecto = Proyecto(None, nombre, descripcion, fecha_inicio)
@@ -49,14 +71,17 @@ class gestionProyecto:
         proyecto.nuevoProyecto()
 
         # 3) Persistimos en BD a través del DAO (INSERT).
-        ProyectoDAO.guardar_proyecto(proyecto)
+        nuevo_id = ProyectoDAO.guardar_proyecto(proyecto, uow=uow)
+        if nuevo_id is not None:
+            proyecto.establecer_id(nuevo_id)
+        despues_de_confirmar(uow, lambda: _invalidar(nuevo_id))
 
         # 4) Devolvemos el objeto (útil para mostrar datos o continuar flujo).
         return proyecto
 
     # ===================== U  (UPDATE) =====================
     @staticmethod
-    def editar_proyecto(id_proyecto, nombre, descripcion, fecha_inicio):
+    def editar_proyecto(id_proyecto, nombre, descripcion, fecha_inicio, uow: UnidadDeTrabajo | None = None):
         """
         Actualiza un Proyecto existente en la BD.
 
@@ -70,11 +95,12 @@ class gestionProyecto:
             Aquí delegamos la actualización al DAO. Si quisieras validaciones
             (p. ej., nombre con largo mínimo, fecha válida), este es un buen lugar.
         """
-        ProyectoDAO.actualizar_proyecto(nombre, descripcion, fecha_inicio, id_proyecto)
+        ProyectoDAO.actualizar_proyecto(nombre, descripcion, fecha_inicio, id_proyecto, uow=uow)
+        despues_de_confirmar(uow, lambda: _invalidar(id_proyecto))
 
     # ===================== D  (DELETE) =====================
     @staticmethod
-    def eliminar_proyecto(id_proyecto):
+    def eliminar_proyecto(id_proyecto, uow: UnidadDeTrabajo | None = None):
         """
         Elimina físicamente (DELETE) un Proyecto por su ID.
 
@@ -85,13 +111,16 @@ class gestionProyecto:
             Eliminación física = el registro desaparece de la BD.
             Si prefieres “eliminación lógica”, cambia la estrategia en el DAO.
         """
-        ProyectoDAO.eliminar_proyecto(id_proyecto)
+        ProyectoDAO.eliminar_proyecto(id_proyecto, uow=uow)
+        despues_de_confirmar(uow, lambda: _invalidar(id_proyecto))
 
     # ===================== R  (READ: listar todos) =====================
     @staticmethod
-    def listar_todos():
+    def listar_todos(after_nombre=None, after_id=None, limit=None, usar_cache: bool = True):
         """
         Devuelve una lista con todos los proyectos.
+        Con `limit` devuelve solo una página (paginación por keyset sobre
+        nombre, id_proyecto): after_nombre/after_id = última fila de la página anterior.
 
         Retorna:
             List[Dict]: cada elemento típicamente con:
@@ -102,8 +131,37 @@ class gestionProyecto:
                   'fecha_inicio': date/datetime
                 }
             (El formato exacto depende de lo que construye el DAO.)
+
+        Caché:
+            Con usar_cache=True cada página queda en caché hasta que venza el TTL
+            o haya una escritura. usar_cache=False va siempre a la BD.
+        """
+        if not usar_cache:
+            return ProyectoDAO.listar_proyectos(after_nombre, after_id, limit)
+        filas = _cache.obtener_o_cargar(
+            ("pagina", after_nombre, after_id, limit),
+            lambda: ProyectoDAO.listar_proyectos(after_nombre, after_id, limit),
+        )
+        return [dict(f) for f in filas]
+
+    # ===================== R  (READ: recorrer en bloques) =====================
+    @staticmethod
+    def iter_todos(tamano_bloque: int = 500, usar_cache: bool = True):
         """
-        return ProyectoDAO.listar_proyectos()
+        Variante en streaming de listar_todos().
+
+        Retorna:
+            Generador de List[Dict] (bloques de hasta `tamano_bloque` proyectos),
+            con la misma estructura que listar_todos(). La memoria no crece con la tabla.
+
+        Caché:
+            Si la tabla completa cabe en CATALOGO_CACHE_MAX_FILAS se guarda y los
+            recorridos siguientes no van a la BD; si no, sigue siendo streaming.
+        """
+        if not usar_cache:
+            return ProyectoDAO.iter_proyectos(tamano_bloque)
+        return bloques_con_cache(_cache, ("todos",), ProyectoDAO.iter_proyectos,
+                                 tamano_bloque, config.CATALOGO_CACHE_MAX_FILAS)
 
     # ===================== R  (READ: buscar por nombre) =====================
     @staticmethod
@@ -118,3 +176,73 @@ class gestionProyecto:
             List[Dict] con la misma estructura que listar_todos(), pero filtrada.
         """
         return ProyectoDAO.buscar_proyectos_por_nombre(texto)
+
+    # ===================== R  (READ: búsqueda por texto) =====================
+    @staticmethod
+    def buscar(texto: str, limite: int = 50):
+        """
+        Búsqueda por texto en nombre y descripción, ordenada por relevancia.
+
+        Usa el índice FULLTEXT de la BD; si no encuentra nada (o el texto es
+        demasiado corto para él) busca por prefijo del nombre con índice, y si
+        la BD no tiene FULLTEXT o tampoco hay prefijos, usa el índice de
+        n-gramas en memoria.
+
+        Retorna:
+            List[Dict] como listar_todos(), con la clave extra 'relevancia'.
+        """
+        return busqueda.PROYECTOS.buscar(texto, int(limite))
+
+    # ===================== Asignación de empleados =====================
+    @staticmethod
+    def _validar_asignacion(id_proyecto, ids_empleados) -> list:
+        ids = [int(i) for i in ids_empleados]
+        if ProyectoDAO.obtener_proyecto_por_id(int(id_proyecto)) is None:
+            raise ValueError(f"No existe el proyecto con ID {id_proyecto}.")
+        faltan = ProyectoEmpleadoDAO.empleados_inexistentes(ids)
+        if faltan:
+            raise ValueError(f"No existen los empleados con ID: {', '.join(map(str, faltan))}.")
+        return ids
+
+    @staticmethod
+    def asignar_empleados(id_proyecto, ids_empleados) -> int:
+        """
+        Asigna varios empleados al proyecto en una sola transacción.
+        Los que ya estaban asignados se ignoran. Retorna cuántos se agregaron.
+        Lanza ValueError si el proyecto o algún empleado no existe (no se asigna ninguno).
+        """
+        ids = gestionProyecto._validar_asignacion(id_proyecto, ids_empleados)
+        return ProyectoEmpleadoDAO.asignar(int(id_proyecto), ids)
+
+    @staticmethod
+    def desasignar_empleados(id_proyecto, ids_empleados) -> int:
+        """Quita varios empleados del proyecto en una sola transacción. Retorna cuántos se quitaron."""
+        return ProyectoEmpleadoDAO.desasignar(int(id_proyecto), [int(i) for i in ids_empleados])
+
+    @staticmethod
+    def reemplazar_empleados(id_proyecto, ids_empleados):
+        """Deja exactamente esos empleados en el proyecto. Retorna (agregados, quitados)."""
+        ids = gestionProyecto._validar_asignacion(id_proyecto, ids_empleados)
+        return ProyectoEmpleadoDAO.reemplazar(int(id_proyecto), ids)
+
+    @staticmethod
+    def empleados_del_proyecto(id_proyecto):
+        """List[Dict] con id_empleado, nombre, usuario, tipo_empleado y fecha_asignacion."""
+        return ProyectoEmpleadoDAO.empleados_de_proyecto(int(id_proyecto))
+
+    @staticmethod
+    def proyectos_de_empleado(id_empleado):
+        """List[Dict] con los proyectos del empleado (como listar_todos, más fecha_asignacion)."""
+        return ProyectoEmpleadoDAO.proyectos_de_empleado(int(id_empleado))
+
+    # ===================== Caché =====================
+    @staticmethod
+    def estadisticas_cache() -> dict:
+        """Aciertos/fallos/entradas de la caché de proyectos."""
+        return _cache.estadisticas()
+
+    @staticmethod
+    def limpiar_cache() -> None:
+        """Vacía la caché (p. ej. tras cargas masivas hechas por fuera del servicio)."""
+        _cache.limpiar()
+        busqueda.PROYECTOS.invalidar()
@@ -0,0 +1,72 @@
+# aplicacion/importacion_lotes.py
+# ==============================================================
+# IMPORTACIÓN POR LOTES (esquema común a todas las entidades)
+# --------------------------------------------------------------
+# 1) Cada fila se convierte/valida con `convertir`; las inválidas se
+#    rechazan con su motivo sin detener la importación.
+# 2) Las válidas se insertan por lotes con `insertar_lote` (un commit
+#    por lote).
+# 3) Si la BD rechaza un lote completo (hizo rollback), se guarda el
+#    error del lote y se reintenta fila por fila para aislar la(s)
+#    fila(s) con problema y no perder las demás.
+#
+# La usan gestion_empleado.importar_empleados y transferencia_datos
+# (departamentos, proyectos, turnos, usuarios).
+# ==============================================================
+
+# Errores de conversión que significan "fila inválida" (no un bug)
+ERRORES_FILA = (ValueError, TypeError, AttributeError)
+
+
+def resultado_vacio() -> dict:
+    return {"insertados": 0, "lotes": 0, "rechazados": [], "errores_lote": []}
+
+
+def importar_por_lotes(filas, convertir, insertar_lote, tamano_lote: int) -> dict:
+    """
+    Parámetros:
+        filas         : iterable de filas (se consume de a un lote, no completo en memoria).
+        convertir     : fila -> objeto de dominio; lanza ValueError/TypeError si no es válida.
+        insertar_lote : lista de objetos -> cantidad insertada (rollback y excepción si falla).
+        tamano_lote   : filas por INSERT multi-fila / commit.
+
+    Retorna:
+        {"insertados": int, "lotes": int,
+         "rechazados": [(numero_fila, motivo), ...],      # numero_fila empieza en 1
+         "errores_lote": [(numero_lote, motivo), ...]}    # lotes reintentados fila por fila
+    """
+    if int(tamano_lote) < 1:
+        raise ValueError("tamano_lote debe ser al menos 1.")
+    resultado = resultado_vacio()
+    lote: list[tuple[int, object]] = []
+
+    for numero, fila in enumerate(filas, start=1):
+        try:
+            lote.append((numero, convertir(fila)))
+        except ERRORES_FILA as e:
+            resultado["rechazados"].append((numero, str(e)))
+            continue
+        if len(lote) >= tamano_lote:
+            _volcar(lote, insertar_lote, resultado)
+            lote = []
+
+    if lote:
+        _volcar(lote, insertar_lote, resultado)
+    return resultado
+
+
+def _volcar(lote: list, insertar_lote, resultado: dict) -> None:
+    """Inserta un lote validado; si la BD lo rechaza, reintenta fila por fila."""
+    resultado["lotes"] += 1
+    try:
+        resultado["insertados"] += insertar_lote([obj for _, obj in lote])
+        return
+    except Exception as e:
+        # El lote completo hizo rollback: se deja constancia y se aíslan las filas
+        resultado["errores_lote"].append((resultado["lotes"], f"Error de BD: {e}"))
+
+    for numero, obj in lote:
+        try:
+            resultado["insertados"] += insertar_lote([obj])
+        except Exception as e:
+            resultado["rechazados"].append((numero, f"Error de BD: {e}"))
@@ -0,0 +1,259 @@
+# aplicacion/ingesta_turnos.py
+# ==============================================================
+# INGESTA MASIVA DE TURNOS (RegistroDeTurno)
+# --------------------------------------------------------------
+# REGISTRODETURNO es la tabla de mayor volumen. En vez de un INSERT +
+# commit por turno, IngestorTurnos:
+#   - recibe los turnos en una cola acotada (enviar). Si la cola está
+#     llena, enviar espera (back-pressure) o falla tras `timeout`.
+#   - un hilo de fondo arma lotes y los escribe con un INSERT multi-fila
+#     (registroturnoDAO.guardar_turnos_lote, un commit por lote).
+#   - un lote se escribe al llegar a `tamano_lote` turnos o cuando el
+#     turno más antiguo lleva `intervalo_max` segundos esperando.
+#   - si la BD rechaza un lote, se reintenta turno por turno para aislar
+#     los inválidos sin perder el resto.
+#   - cada lote produce un resultado (dict) que queda en resultados() y
+#     se entrega al callback `al_completar_lote`, si se indicó.
+#
+# Uso:
+#   with IngestorTurnos(tamano_lote=1000) as ing:
+#       for turno in turnos:
+#           ing.enviar(turno)
+#   # al salir del with se escriben los pendientes y se detiene el hilo
+# ==============================================================
+
+import functools
+import queue
+import threading
+import time
+from collections import deque
+
+from aplicacion import config
+from dominio.registrodeturno import RegistroDeTurno
+from persistencia.registrarturnoDAO import registroturnoDAO
+
+_VACIAR = object()   # marca: escribir ya lo acumulado
+_DETENER = object()  # marca: escribir lo acumulado y terminar
+
+
+class IngestorTurnos:
+    """Escritor por lotes de RegistroDeTurno con hilo de fondo."""
+
+    def __init__(
+        self,
+        tamano_lote: int = config.TURNOS_TAMANO_LOTE,
+        intervalo_max: float = config.TURNOS_INTERVALO_MAX,
+        capacidad_cola: int = config.TURNOS_CAPACIDAD_COLA,
+        insertar_lote=None,
+        al_completar_lote=None,
+        max_resultados: int = 1000,
+    ) -> None:
+        """
+        tamano_lote       : turnos por INSERT multi-fila.
+        intervalo_max     : segundos máximos que un turno espera en memoria antes de escribirse.
+        capacidad_cola    : turnos que pueden esperar; con la cola llena enviar() se bloquea.
+        insertar_lote     : función list[RegistroDeTurno] -> int (por defecto el DAO, sin
+                            imprimir errores: quedan en el resultado de cada lote).
+        al_completar_lote : callback(resultado: dict) invocado desde el hilo de fondo.
+        max_resultados    : resultados de lote que se conservan (los más recientes).
+        """
+        if tamano_lote < 1 or capacidad_cola < 1 or intervalo_max <= 0:
+            raise ValueError("tamano_lote y capacidad_cola deben ser >= 1 e intervalo_max > 0.")
+        self.tamano_lote = tamano_lote
+        self.intervalo_max = intervalo_max
+        self._insertar_lote = insertar_lote or functools.partial(
+            registroturnoDAO.guardar_turnos_lote, informar_errores=False)
+        self._al_completar_lote = al_completar_lote
+        self._cola = queue.Queue(maxsize=capacidad_cola)
+        self._resultados = deque(maxlen=max_resultados)
+        self._lock = threading.Lock()
+        # Serializa "¿está cerrado?" + put en la cola contra cerrar(): ningún turno
+        # puede quedar encolado detrás de _DETENER. Es otro lock porque el put
+        # puede bloquearse con la cola llena y el hilo de fondo necesita _lock.
+        self._lock_entrada = threading.Lock()
+        self._hilo = None
+        self._cerrado = False
+        self._contadores = {"recibidos": 0, "insertados": 0, "rechazados": 0, "lotes": 0,
+                            "esperas_cola_llena": 0}
+
+    # ----------------------------------------------------------
+    # Ciclo de vida
+    # ----------------------------------------------------------
+    def iniciar(self) -> "IngestorTurnos":
+        with self._lock:
+            if self._cerrado:
+                raise RuntimeError("El ingestor ya fue cerrado.")
+            if self._hilo is None:
+                self._hilo = threading.Thread(target=self._bucle, name="ingesta-turnos", daemon=True)
+                self._hilo.start()
+        return self
+
+    def __enter__(self) -> "IngestorTurnos":
+        return self.iniciar()
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+    def cerrar(self, timeout: float | None = None) -> None:
+        """Escribe lo pendiente y detiene el hilo. Después no se aceptan más turnos."""
+        with self._lock_entrada:
+            with self._lock:
+                if self._cerrado:
+                    return
+                self._cerrado = True
+                hilo = self._hilo
+            if hilo is not None:
+                self._cola.put(_DETENER)
+        if hilo is not None:
+            hilo.join(timeout)
+
+    # ----------------------------------------------------------
+    # Entrada
+    # ----------------------------------------------------------
+    @staticmethod
+    def _validar(registro: RegistroDeTurno) -> None:
+        if not isinstance(registro, RegistroDeTurno):
+            raise TypeError("Se esperaba un RegistroDeTurno.")
+        id_empleado = registro.obtener_id_empleado()
+        horas = registro.obtener_cantidad_horas()
+        if not isinstance(id_empleado, int) or id_empleado <= 0:
+            raise ValueError("id_empleado debe ser un entero positivo.")
+        if isinstance(horas, float) and horas.is_integer():
+            horas = int(horas)
+        if isinstance(horas, bool) or not isinstance(horas, int) or horas < 0:
+            # cantidad_horas es INT en la BD: 7.5 se truncaría sin avisar
+            raise ValueError("cantidad_horas debe ser un número entero de horas no negativo.")
+        if registro.obtener_fecha() is None:
+            raise ValueError("El turno debe tener fecha.")
+
+    def enviar(self, registro: RegistroDeTurno, timeout: float | None = None) -> None:
+        """
+        Encola un turno. Valida antes de encolar (ValueError/TypeError).
+        Si la cola está llena espera; con `timeout` lanza queue.Full al vencer.
+        """
+        self._validar(registro)
+        with self._lock_entrada:
+            if self._cerrado:
+                raise RuntimeError("El ingestor está cerrado.")
+            if self._hilo is None:
+                self.iniciar()
+            try:
+                self._cola.put_nowait(registro)
+            except queue.Full:
+                with self._lock:
+                    self._contadores["esperas_cola_llena"] += 1
+                self._cola.put(registro, timeout=timeout)
+            with self._lock:
+                self._contadores["recibidos"] += 1
+
+    def enviar_muchos(self, registros, timeout: float | None = None) -> int:
+        """Encola varios turnos; retorna cuántos se encolaron."""
+        n = 0
+        for r in registros:
+            self.enviar(r, timeout)
+            n += 1
+        return n
+
+    def vaciar(self) -> None:
+        """
+        Fuerza la escritura de lo acumulado y espera a que todo lo encolado esté escrito.
+        Tras cerrar() no hace nada: cerrar() ya escribió lo pendiente y el hilo terminó.
+        """
+        with self._lock_entrada:
+            if self._hilo is None or self._cerrado:
+                return
+            self._cola.put(_VACIAR)
+        self._cola.join()
+
+    # ----------------------------------------------------------
+    # Hilo de fondo
+    # ----------------------------------------------------------
+    def _bucle(self) -> None:
+        lote = []
+        limite = None       # instante en que hay que escribir el lote aunque no esté lleno
+        sin_confirmar = 0   # elementos sacados de la cola aún sin task_done()
+        while True:
+            espera = None if limite is None else max(0.0, limite - time.monotonic())
+            try:
+                item = self._cola.get(timeout=espera)
+            except queue.Empty:
+                item = None  # venció el intervalo
+            if item is not None:
+                sin_confirmar += 1
+
+            if item is _DETENER:
+                motivo = "cierre"
+            elif item is _VACIAR:
+                motivo = "vaciado"
+            else:
+                if item is not None:
+                    lote.append(item)
+                    if limite is None:
+                        limite = time.monotonic() + self.intervalo_max
+                if len(lote) >= self.tamano_lote:
+                    motivo = "tamano"
+                elif limite is not None and time.monotonic() >= limite:
+                    motivo = "tiempo"
+                else:
+                    motivo = None
+
+            if motivo:
+                if lote:
+                    self._escribir(lote, motivo)
+                lote, limite = [], None
+                # task_done recién con los turnos ya escritos: así vaciar() espera de verdad
+                for _ in range(sin_confirmar):
+                    self._cola.task_done()
+                sin_confirmar = 0
+
+            if item is _DETENER:
+                return
+
+    def _escribir(self, lote: list, motivo: str) -> None:
+        inicio = time.perf_counter()
+        insertados, rechazados, error = 0, [], None
+        try:
+            insertados = self._insertar_lote(lote)
+        except Exception as e:
+            # El lote hizo rollback completo: se aísla el/los turnos con problema
+            error = str(e)
+            for registro in lote:
+                try:
+                    insertados += self._insertar_lote([registro])
+                except Exception as e_fila:
+                    rechazados.append((registro, str(e_fila)))
+
+        with self._lock:
+            self._contadores["lotes"] += 1
+            self._contadores["insertados"] += insertados
+            self._contadores["rechazados"] += len(rechazados)
+            numero = self._contadores["lotes"]
+        resultado = {
+            "lote": numero,
+            "motivo": motivo,
+            "filas": len(lote),
+            "insertados": insertados,
+            "rechazados": rechazados,
+            "error_lote": error,
+            "segundos": time.perf_counter() - inicio,
+        }
+        self._resultados.append(resultado)
+        if self._al_completar_lote is not None:
+            try:
+                self._al_completar_lote(resultado)
+            except Exception as e:
+                print(f"⚠ Error en el callback de ingesta de turnos: {e}")
+
+    # ----------------------------------------------------------
+    # Consulta
+    # ----------------------------------------------------------
+    def resultados(self) -> list:
+        """Resultados de los últimos lotes escritos (más antiguo primero)."""
+        return list(self._resultados)
+
+    def estadisticas(self) -> dict:
+        with self._lock:
+            datos = dict(self._contadores)
+        datos["en_cola"] = self._cola.qsize()
+        datos["activo"] = self._hilo is not None and self._hilo.is_alive()
+        return datos
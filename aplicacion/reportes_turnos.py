@@ -0,0 +1,217 @@
+# aplicacion/reportes_turnos.py
+# ==============================================================
+# REPORTES DE HORAS POR EMPLEADO (REGISTRODETURNO)
+# --------------------------------------------------------------
+# - Día / semana ISO / mes, horas extra y top-N: el GROUP BY se hace
+#   en la BD (registroturnoDAO.iter_horas_agrupadas); aquí solo se
+#   vuelcan las filas ya reducidas a arreglos.
+# - Por defecto se leen los resúmenes materializados (persistencia.
+#   resumen_horas, una fila por empleado y día/mes) en vez de los turnos;
+#   con usar_resumen=False se agrega directo sobre REGISTRODETURNO.
+# - Ventanas a medida (p. ej. quincenas desde una fecha cualquiera):
+#   la BD reduce por (empleado, día) y las ventanas se suman en memoria
+#   por bloques, con NumPy si está instalado (np.unique + np.bincount)
+#   o con un dict si no lo está.
+#
+# Los resultados son SerieHoras: tres array.array paralelos
+# (id_empleado, periodo, horas) en lugar de una lista de dicts.
+# `periodo` es una clave entera: AAAAMMDD (día o inicio de ventana),
+# AAAASS (semana ISO) o AAAAMM (mes).
+# ==============================================================
+
+import datetime
+from array import array
+from typing import Optional
+
+from aplicacion import config
+from persistencia.registrarturnoDAO import registroturnoDAO
+
+PERIODOS = ("dia", "semana", "mes")
+
+
+def _numpy():
+    """NumPy es opcional: solo acelera las ventanas a medida."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def _clave_dia(fecha: datetime.date) -> int:
+    return fecha.year * 10000 + fecha.month * 100 + fecha.day
+
+def _validar_rango(desde: datetime.date, hasta: datetime.date) -> None:
+    if desde is None or hasta is None:
+        raise ValueError("Se requieren las fechas desde y hasta.")
+    if desde > hasta:
+        raise ValueError("La fecha desde no puede ser posterior a hasta.")
+
+
+class SerieHoras:
+    """Horas por (empleado, período) en arreglos paralelos."""
+
+    __slots__ = ("tipo", "id_empleado", "periodo", "horas")
+
+    def __init__(self, tipo: str) -> None:
+        self.tipo = tipo                  # dia | semana | mes | ventana | rango
+        self.id_empleado = array("q")
+        self.periodo = array("q")
+        self.horas = array("d")
+
+    def __len__(self) -> int:
+        return len(self.horas)
+
+    def __iter__(self):
+        """Tuplas (id_empleado, periodo, horas)."""
+        return zip(self.id_empleado, self.periodo, self.horas)
+
+    def __repr__(self) -> str:
+        return f"SerieHoras(tipo={self.tipo!r}, filas={len(self)})"
+
+    def _agregar_bloque(self, filas, descontar: float = 0) -> None:
+        if not filas:
+            return
+        ids, periodos, horas = zip(*filas)
+        self.id_empleado.extend(ids)
+        self.periodo.extend(periodos)
+        if descontar:
+            self.horas.extend(float(h) - descontar for h in horas)
+        else:
+            self.horas.extend(horas)
+
+    def totales_por_empleado(self) -> dict:
+        """{id_empleado: horas} sumando todos los períodos de la serie."""
+        totales = {}
+        for id_empleado, horas in zip(self.id_empleado, self.horas):
+            totales[id_empleado] = totales.get(id_empleado, 0.0) + horas
+        return totales
+
+    def a_numpy(self) -> tuple:
+        """(id_empleado, periodo, horas) como arreglos NumPy sin copiar los datos."""
+        import numpy as np
+        return (np.frombuffer(self.id_empleado, dtype=np.int64),
+                np.frombuffer(self.periodo, dtype=np.int64),
+                np.frombuffer(self.horas, dtype=np.float64))
+
+
+# --------------------------------------------------------------
+# Agregados calculados en la BD
+# --------------------------------------------------------------
+
+def horas_por_periodo(periodo: str, desde: datetime.date, hasta: datetime.date,
+                      id_empleado: Optional[int] = None,
+                      usar_resumen: bool = config.REPORTES_USAR_RESUMEN) -> SerieHoras:
+    """Total de horas por empleado y día, semana ISO o mes entre dos fechas (inclusive)."""
+    if periodo not in PERIODOS:
+        raise ValueError(f"Período inválido: {periodo!r} (dia, semana o mes).")
+    _validar_rango(desde, hasta)
+    serie = SerieHoras(periodo)
+    for bloque in registroturnoDAO.iter_horas_agrupadas(periodo, desde, hasta, id_empleado,
+                                                        usar_resumen=usar_resumen):
+        serie._agregar_bloque(bloque)
+    return serie
+
+def horas_por_dia(desde, hasta, id_empleado: Optional[int] = None,
+                  usar_resumen: bool = config.REPORTES_USAR_RESUMEN) -> SerieHoras:
+    return horas_por_periodo("dia", desde, hasta, id_empleado, usar_resumen)
+
+def horas_por_semana(desde, hasta, id_empleado: Optional[int] = None,
+                     usar_resumen: bool = config.REPORTES_USAR_RESUMEN) -> SerieHoras:
+    return horas_por_periodo("semana", desde, hasta, id_empleado, usar_resumen)
+
+def horas_por_mes(desde, hasta, id_empleado: Optional[int] = None,
+                  usar_resumen: bool = config.REPORTES_USAR_RESUMEN) -> SerieHoras:
+    return horas_por_periodo("mes", desde, hasta, id_empleado, usar_resumen)
+
+def horas_extra(desde: datetime.date, hasta: datetime.date, periodo: str = "dia",
+                limite: Optional[float] = None, id_empleado: Optional[int] = None,
+                usar_resumen: bool = config.REPORTES_USAR_RESUMEN) -> SerieHoras:
+    """
+    Períodos en que un empleado superó `limite` horas; `horas` trae solo el excedente.
+    Sin límite se usa HORAS_JORNADA_MAX (dia) o HORAS_SEMANA_MAX (semana); para mes es obligatorio.
+    """
+    if periodo not in PERIODOS:
+        raise ValueError(f"Período inválido: {periodo!r} (dia, semana o mes).")
+    if limite is None:
+        limite = {"dia": config.HORAS_JORNADA_MAX, "semana": config.HORAS_SEMANA_MAX}.get(periodo)
+        if limite is None:
+            raise ValueError("Indique el límite de horas para el período mes.")
+    _validar_rango(desde, hasta)
+    serie = SerieHoras(periodo)
+    for bloque in registroturnoDAO.iter_horas_agrupadas(periodo, desde, hasta, id_empleado,
+                                                        minimo_horas=limite, usar_resumen=usar_resumen):
+        serie._agregar_bloque(bloque, descontar=limite)
+    return serie
+
+def top_empleados(desde: datetime.date, hasta: datetime.date, n: int = 10,
+                  usar_resumen: bool = config.REPORTES_USAR_RESUMEN) -> SerieHoras:
+    """Los `n` empleados con más horas en el rango, de mayor a menor (periodo = AAAAMMDD de desde)."""
+    if n < 1:
+        raise ValueError("n debe ser al menos 1.")
+    _validar_rango(desde, hasta)
+    clave = _clave_dia(desde)
+    serie = SerieHoras("rango")
+    filas = registroturnoDAO.top_empleados_por_horas(desde, hasta, n, usar_resumen)
+    serie._agregar_bloque([(id_empleado, clave, horas) for id_empleado, horas in filas])
+    return serie
+
+
+# --------------------------------------------------------------
+# Ventanas a medida (en memoria, por bloques)
+# --------------------------------------------------------------
+
+def _ventanas_numpy(np, bloques, dias: int, n_ventanas: int):
+    claves_parciales, horas_parciales = [], []
+    for bloque in bloques:
+        datos = np.array(bloque, dtype=np.float64)  # columnas: id_empleado, dia, horas
+        claves = datos[:, 0].astype(np.int64) * n_ventanas + datos[:, 1].astype(np.int64) // dias
+        unicas, inversa = np.unique(claves, return_inverse=True)
+        claves_parciales.append(unicas)
+        horas_parciales.append(np.bincount(inversa, weights=datos[:, 2]))
+    if not claves_parciales:
+        return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, np.float64)
+    # Un mismo (empleado, ventana) puede aparecer en varios bloques: se reduce otra vez
+    unicas, inversa = np.unique(np.concatenate(claves_parciales), return_inverse=True)
+    horas = np.bincount(inversa, weights=np.concatenate(horas_parciales))
+    return unicas // n_ventanas, unicas % n_ventanas, horas
+
+def _ventanas_python(bloques, dias: int):
+    acumulado = {}
+    for bloque in bloques:
+        for id_empleado, dia, horas in bloque:
+            clave = (id_empleado, dia // dias)
+            acumulado[clave] = acumulado.get(clave, 0.0) + float(horas)
+    claves = sorted(acumulado)
+    return ([c[0] for c in claves], [c[1] for c in claves], [acumulado[c] for c in claves])
+
+def horas_por_ventana(desde: datetime.date, hasta: datetime.date, dias: int,
+                      id_empleado: Optional[int] = None, usar_numpy: Optional[bool] = None,
+                      usar_resumen: bool = config.REPORTES_USAR_RESUMEN) -> SerieHoras:
+    """
+    Horas por empleado en ventanas consecutivas de `dias` días a partir de `desde`
+    (la última puede quedar incompleta). `periodo` es el AAAAMMDD de inicio de cada ventana.
+    usar_numpy: None = si está instalado; False fuerza la versión en Python puro.
+    """
+    if dias < 1:
+        raise ValueError("dias debe ser al menos 1.")
+    _validar_rango(desde, hasta)
+    np = _numpy() if usar_numpy is not False else None
+    if usar_numpy and np is None:
+        raise RuntimeError("NumPy no está instalado.")
+
+    n_ventanas = (hasta - desde).days // dias + 1
+    inicios = [_clave_dia(desde + datetime.timedelta(days=i * dias)) for i in range(n_ventanas)]
+    bloques = registroturnoDAO.iter_horas_por_dia_relativo(desde, hasta, id_empleado, usar_resumen)
+
+    serie = SerieHoras("ventana")
+    if np is not None:
+        ids, ventanas, horas = _ventanas_numpy(np, bloques, dias, n_ventanas)
+        serie.id_empleado.frombytes(ids.astype(np.int64).tobytes())
+        serie.periodo.frombytes(np.asarray(inicios, dtype=np.int64)[ventanas].tobytes())
+        serie.horas.frombytes(horas.astype(np.float64).tobytes())
+    else:
+        ids, ventanas, horas = _ventanas_python(bloques, dias)
+        serie.id_empleado.extend(ids)
+        serie.periodo.extend(inicios[v] for v in ventanas)
+        serie.horas.extend(horas)
+    return serie
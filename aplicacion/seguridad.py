@@ -1,8 +1,22 @@
 # aplicacion/seguridad.py
 # Encriptación y verificación de contraseñas con bcrypt
+#
+# bcrypt libera el GIL mientras calcula el hash, así que las variantes
+# *_async lo ejecutan en un pool acotado de hilos (HASH_WORKERS) y
+# devuelven un concurrent.futures.Future: varias altas o logins en
+# paralelo aprovechan todos los núcleos sin bloquear a quien llama.
+
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import bcrypt
 
+from aplicacion import config
+
+_pool_hash: ThreadPoolExecutor | None = None
+_lock_pool = threading.Lock()
+
 def encriptar_password(password_plano: str) -> str:
     """
     Genera un hash seguro (bcrypt) a partir de una contraseña en texto plano.
@@ -10,7 +24,7 @@ def encriptar_password(password_plano: str) -> str:
     """
     if not isinstance(password_plano, str) or not password_plano:
         raise ValueError("La contraseña no puede estar vacía y debe ser str.")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=config.BCRYPT_ROUNDS)
     password_hash = bcrypt.hashpw(password_plano.encode("utf-8"), salt)
     return password_hash.decode("utf-8")
 
@@ -25,3 +39,59 @@ def verificar_password(password_plano: str, password_hash: str) -> bool:
         return bcrypt.checkpw(password_plano.encode("utf-8"), password_hash.encode("utf-8"))
     except Exception:
         return False
+
+def costo_hash(password_hash: str) -> int | None:
+    """Costo (log2 de rondas) de un hash bcrypt "$2b$12$...", o None si no se reconoce."""
+    partes = (password_hash or "").split("$")
+    if len(partes) < 4 or not partes[1].startswith("2"):
+        return None
+    try:
+        return int(partes[2])
+    except ValueError:
+        return None
+
+def necesita_rehash(password_hash: str) -> bool:
+    """
+    True si el hash se generó con un costo distinto de BCRYPT_ROUNDS.
+    Permite subir (o bajar) el costo sin obligar a resetear contraseñas:
+    se recalcula en el próximo login correcto.
+    """
+    costo = costo_hash(password_hash)
+    return costo is not None and costo != config.BCRYPT_ROUNDS
+
+
+# --------------------------------------------------------------
+# Variantes no bloqueantes (pool de hilos)
+# --------------------------------------------------------------
+
+def _obtener_pool() -> ThreadPoolExecutor:
+    global _pool_hash
+    if _pool_hash is None:
+        with _lock_pool:
+            if _pool_hash is None:
+                _pool_hash = ThreadPoolExecutor(
+                    max_workers=max(1, config.HASH_WORKERS), thread_name_prefix="bcrypt"
+                )
+    return _pool_hash
+
+def enviar_a_pool_hash(fn, *args, **kwargs) -> Future:
+    """Ejecuta `fn(*args, **kwargs)` en el pool de hashing y retorna su Future."""
+    return _obtener_pool().submit(fn, *args, **kwargs)
+
+def encriptar_password_async(password_plano: str) -> Future:
+    """Igual que encriptar_password, pero retorna un Future[str]."""
+    return enviar_a_pool_hash(encriptar_password, password_plano)
+
+def verificar_password_async(password_plano: str, password_hash: str) -> Future:
+    """Igual que verificar_password, pero retorna un Future[bool]."""
+    return enviar_a_pool_hash(verificar_password, password_plano, password_hash)
+
+def cerrar_pool_hash(esperar: bool = True) -> None:
+    """Detiene el pool de hashing (se vuelve a crear si se usa de nuevo)."""
+    global _pool_hash
+    with _lock_pool:
+        pool, _pool_hash = _pool_hash, None
+    if pool is not None:
+        pool.shutdown(wait=esperar)
+
+atexit.register(cerrar_pool_hash)
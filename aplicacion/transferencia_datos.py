@@ -0,0 +1,250 @@
+# aplicacion/transferencia_datos.py
+# ==============================================================
+# IMPORTACIÓN / EXPORTACIÓN MASIVA (CSV y JSON Lines)
+# --------------------------------------------------------------
+# Entidades: empleados, departamentos, proyectos, turnos, usuarios.
+#
+# - Exportar: se lee de los DAO por bloques (cursor de servidor, iter_*)
+#   y se escribe con I/O con buffer. La memoria no depende del tamaño
+#   de la tabla.
+# - Importar: el archivo se lee fila a fila, cada fila se valida y se
+#   convierte a objeto de dominio, y las válidas se insertan por lotes
+#   (INSERT multi-fila, un commit por lote; ver importacion_lotes).
+#   Las filas inválidas se informan como rechazadas sin detener la
+#   importación.
+# - Las claves primarias no se importan: las genera la BD (AUTO_INCREMENT).
+# ==============================================================
+
+import csv
+import json
+import time
+from datetime import date, datetime
+from decimal import Decimal
+
+from aplicacion import gestion_empleado
+from aplicacion.gestiondepartamento import gestiondepartamento
+from aplicacion.gestionproyecto import gestionProyecto
+from aplicacion.gestion_empleado import _parse_fecha
+from aplicacion.importacion_lotes import importar_por_lotes
+from aplicacion.validadores import ALLOWED_ROLES
+from dominio.departamento import Departamento
+from dominio.proyecto import Proyecto
+from dominio.registrodeturno import RegistroDeTurno
+from dominio.usuario import Usuario
+from persistencia import empleadoDAO
+from persistencia.departamentoDAO import DepartamentoDAO
+from persistencia.proyectoDAO import ProyectoDAO
+from persistencia.registrarturnoDAO import registroturnoDAO
+from persistencia.usuarioDAO import UsuarioDAO
+
+FORMATOS = ("csv", "jsonl")
+TAMANO_BUFFER = 1 << 20  # 1 MiB de buffer de escritura/lectura
+
+# Columnas que se exportan por entidad (y que se esperan al importar)
+COLUMNAS = {
+    "empleados": ("id_empleado", "nombre", "direccion", "telefono", "correo",
+                  "fecha_inicio", "salario", "usuario", "tipo_empleado"),
+    "departamentos": ("id_departamento", "nombre", "tipo_departamento"),
+    "proyectos": ("id_proyecto", "nombre", "descripcion", "fecha_inicio"),
+    "turnos": ("id_registro", "id_empleado", "fecha", "cantidad_horas", "tareas_realizadas"),
+    "usuarios": ("id", "username", "password_hash", "nombre_completo", "rol", "activo"),
+}
+ENTIDADES = tuple(COLUMNAS)
+
+
+# --------------------------------------------------------------
+# Utilidades
+# --------------------------------------------------------------
+
+def formato_por_extension(ruta: str) -> str:
+    """Deduce el formato a partir de la extensión (.csv / .jsonl / .ndjson)."""
+    r = ruta.lower()
+    if r.endswith(".csv"):
+        return "csv"
+    if r.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    raise ValueError("No se pudo deducir el formato; usa extensión .csv/.jsonl o indica el formato.")
+
+def _serializar(valor):
+    """Convierte un valor de la BD a algo representable en CSV/JSON."""
+    if isinstance(valor, datetime):
+        return valor.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(valor, date):
+        return valor.isoformat()
+    if isinstance(valor, Decimal):
+        return float(valor)
+    if isinstance(valor, bool):
+        return int(valor)
+    return valor
+
+def _texto(fila: dict, campo: str) -> str:
+    v = fila.get(campo)
+    return "" if v is None else str(v).strip()
+
+
+# --------------------------------------------------------------
+# Lectores por bloques (exportación)
+# --------------------------------------------------------------
+
+def _bloques_empleados(tamano_bloque: int):
+    # iter_empleados usa las claves de la UI; las pasamos a las de importación
+    for bloque in empleadoDAO.iter_empleados(tamano_bloque):
+        yield [{
+            "id_empleado": r["id_empleado"],
+            "nombre": r["nombre"],
+            "direccion": r["direccion"],
+            "telefono": r["telefono"],
+            "correo": r["correo"],
+            "fecha_inicio": r["fecha_inicio_contrato"],
+            "salario": r["salario"],
+            "usuario": r["usuario"],
+            "tipo_empleado": r["tipoempleado"],
+        } for r in bloque]
+
+EXPORTADORES = {
+    "empleados": _bloques_empleados,
+    "departamentos": DepartamentoDAO.iter_departamentos,
+    "proyectos": ProyectoDAO.iter_proyectos,
+    "turnos": registroturnoDAO.iter_turnos,
+    "usuarios": lambda tamano_bloque: UsuarioDAO().iter_usuarios(tamano_bloque),
+}
+
+
+# --------------------------------------------------------------
+# Conversores fila -> objeto de dominio (importación)
+# Lanzan ValueError con un mensaje claro si la fila no es válida.
+# --------------------------------------------------------------
+
+def _a_departamento(fila: dict) -> Departamento:
+    nombre = _texto(fila, "nombre")
+    if len(nombre) < 3:
+        raise ValueError("El nombre debe tener al menos 3 caracteres.")
+    tipo_txt = _texto(fila, "tipo_departamento").lower()
+    for tipo in Departamento.TipoDepartamento:
+        if tipo_txt in (tipo.value.lower(), tipo.name):
+            return Departamento(id_departamento=0, nombre=nombre, tipo_departamento=tipo)
+    raise ValueError(f"Tipo de departamento inválido: '{fila.get('tipo_departamento')}'.")
+
+def _a_proyecto(fila: dict) -> Proyecto:
+    nombre = _texto(fila, "nombre")
+    if not nombre:
+        raise ValueError("El nombre del proyecto es obligatorio.")
+    return Proyecto(None, nombre, _texto(fila, "descripcion"), _parse_fecha(_texto(fila, "fecha_inicio")))
+
+def _a_turno(fila: dict) -> RegistroDeTurno:
+    try:
+        id_empleado = int(_texto(fila, "id_empleado"))
+        horas = int(float(_texto(fila, "cantidad_horas")))
+    except ValueError:
+        raise ValueError("id_empleado y cantidad_horas deben ser numéricos.")
+    if id_empleado <= 0 or horas < 0:
+        raise ValueError("id_empleado debe ser positivo y cantidad_horas no negativa.")
+    return RegistroDeTurno(None, id_empleado, _parse_fecha(_texto(fila, "fecha")),
+                           horas, _texto(fila, "tareas_realizadas"))
+
+def _a_usuario(fila: dict) -> Usuario:
+    username = _texto(fila, "username")
+    password_hash = _texto(fila, "password_hash")
+    rol = _texto(fila, "rol").lower() or "usuario"
+    if len(username) < 3:
+        raise ValueError("Username vacío o demasiado corto.")
+    if not password_hash.startswith("$2"):
+        raise ValueError("password_hash no es un hash bcrypt.")
+    if rol not in ALLOWED_ROLES:
+        raise ValueError(f"Rol inválido: '{rol}'.")
+    activo = _texto(fila, "activo").lower() not in ("0", "false", "no", "n")
+    return Usuario(username=username, password_hash=password_hash,
+                   nombre_completo=_texto(fila, "nombre_completo"), rol=rol, activo=activo)
+
+IMPORTADORES = {
+    "empleados": gestion_empleado.importar_empleados,
+    "departamentos": lambda filas, tamano_lote: importar_por_lotes(
+        filas, _a_departamento, DepartamentoDAO.guardar_departamentos_lote, tamano_lote),
+    "proyectos": lambda filas, tamano_lote: importar_por_lotes(
+        filas, _a_proyecto, ProyectoDAO.guardar_proyectos_lote, tamano_lote),
+    "turnos": lambda filas, tamano_lote: importar_por_lotes(
+        filas, _a_turno, registroturnoDAO.guardar_turnos_lote, tamano_lote),
+    "usuarios": lambda filas, tamano_lote: importar_por_lotes(
+        filas, _a_usuario, UsuarioDAO().crear_lote, tamano_lote),
+}
+
+
+# --------------------------------------------------------------
+# API pública
+# --------------------------------------------------------------
+
+def _validar(entidad: str, ruta: str, formato: str | None) -> str:
+    if entidad not in COLUMNAS:
+        raise ValueError(f"Entidad desconocida: '{entidad}'. Opciones: {', '.join(ENTIDADES)}")
+    formato = formato or formato_por_extension(ruta)
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato inválido: '{formato}'. Opciones: {', '.join(FORMATOS)}")
+    return formato
+
+def exportar(entidad: str, ruta: str, formato: str | None = None, tamano_bloque: int = 1000) -> dict:
+    """
+    Exporta una entidad completa a CSV o JSONL en streaming.
+    Retorna {"filas": int, "segundos": float, "filas_por_segundo": float}.
+    """
+    formato = _validar(entidad, ruta, formato)
+    columnas = COLUMNAS[entidad]
+    total = 0
+    inicio = time.perf_counter()
+
+    with open(ruta, "w", encoding="utf-8", newline="", buffering=TAMANO_BUFFER) as f:
+        if formato == "csv":
+            escritor = csv.writer(f)
+            escritor.writerow(columnas)
+            for bloque in EXPORTADORES[entidad](tamano_bloque):
+                escritor.writerows([_serializar(fila.get(c)) for c in columnas] for fila in bloque)
+                total += len(bloque)
+        else:
+            for bloque in EXPORTADORES[entidad](tamano_bloque):
+                f.writelines(
+                    json.dumps({c: _serializar(fila.get(c)) for c in columnas}, ensure_ascii=False) + "\n"
+                    for fila in bloque
+                )
+                total += len(bloque)
+
+    segundos = time.perf_counter() - inicio
+    return {"filas": total, "segundos": segundos,
+            "filas_por_segundo": total / segundos if segundos > 0 else 0.0}
+
+def _leer_filas(f, formato: str):
+    """Genera dicts desde el archivo abierto, de a una fila."""
+    if formato == "csv":
+        yield from csv.DictReader(f)
+        return
+    for numero, linea in enumerate(f, start=1):
+        linea = linea.strip()
+        if not linea:
+            continue
+        try:
+            yield json.loads(linea)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Línea {numero}: JSON inválido ({e.msg}).")
+
+# Cachés de la capa de aplicación que una importación deja desactualizadas
+# (los empleados ya se invalidan dentro de gestion_empleado.importar_empleados)
+_INVALIDAR_TRAS_IMPORTAR = {
+    "departamentos": gestiondepartamento.limpiar_cache,
+    "proyectos": gestionProyecto.limpiar_cache,
+}
+
+def importar(entidad: str, ruta: str, formato: str | None = None, tamano_lote: int = 500) -> dict:
+    """
+    Importa una entidad desde CSV o JSONL, insertando por lotes de `tamano_lote`.
+    Retorna {"insertados", "lotes", "rechazados": [(numero_fila, motivo)],
+             "segundos", "filas_por_segundo"}.
+    """
+    formato = _validar(entidad, ruta, formato)
+    inicio = time.perf_counter()
+    with open(ruta, "r", encoding="utf-8", newline="", buffering=TAMANO_BUFFER) as f:
+        resultado = IMPORTADORES[entidad](_leer_filas(f, formato), tamano_lote)
+    if resultado["insertados"] and entidad in _INVALIDAR_TRAS_IMPORTAR:
+        _INVALIDAR_TRAS_IMPORTAR[entidad]()
+    segundos = time.perf_counter() - inicio
+    procesadas = resultado["insertados"] + len(resultado["rechazados"])
+    resultado["segundos"] = segundos
+    resultado["filas_por_segundo"] = procesadas / segundos if segundos > 0 else 0.0
+    return resultado
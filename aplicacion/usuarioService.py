@@ -5,7 +5,10 @@
 # ==============================================================
 
 from persistencia.usuarioDAO import UsuarioDAO
-from aplicacion.seguridad import encriptar_password
+from persistencia.unidad_trabajo import UnidadDeTrabajo, despues_de_confirmar
+from concurrent.futures import Future
+
+from aplicacion.seguridad import encriptar_password, enviar_a_pool_hash
 from aplicacion.validadores import validar_rol, normalizar_rol
 from aplicacion.errores import DuplicadoError, NoEncontradoError
 from dominio.usuario import Usuario
@@ -17,8 +20,9 @@ class UsuarioService:
     Encapsula la lógica de negocio (hash de contraseñas, validaciones, etc.).
     """
 
-    def __init__(self):
-        self.dao = UsuarioDAO()
+    def __init__(self, dao=None):
+        # `dao` permite inyectar otro almacén (p. ej. el de los benchmarks)
+        self.dao = dao if dao is not None else UsuarioDAO()
 
     # Utilidad opcional (por si quieres pre-chequear en UI)
     def buscar_por_username(self, username: str):
@@ -31,7 +35,7 @@ class UsuarioService:
         rol = normalizar_rol(rol)
 
         # Pre-check duplicado para feedback rápido
-        if self.dao.obtener_por_username(username):
+        if self.dao.obtener_por_username(username, usar_cache=False):
             raise DuplicadoError("username", username)
 
         hash_pass = encriptar_password(password)
@@ -45,6 +49,14 @@ class UsuarioService:
         # Si por carrera aún choca, el DAO lanzará DuplicadoError
         return self.dao.crear(usuario)
 
+    def crear_usuario_async(self, username: str, password: str, nombre: str, rol: str = "usuario") -> Future:
+        """
+        Versión no bloqueante de crear_usuario: corre en el pool de hashing y
+        retorna un Future con el id (o con la excepción que corresponda).
+        Útil para dar de alta muchos usuarios en paralelo.
+        """
+        return enviar_a_pool_hash(self.crear_usuario, username, password, nombre, rol)
+
     def modificar_usuario(
         self,
         id_usuario: int,
@@ -53,14 +65,19 @@ class UsuarioService:
         nombre: str = "",
         rol: str = "",
         activo: bool = True,
+        uow: UnidadDeTrabajo | None = None,
     ) -> bool:
-        usuario_existente = self.dao.buscar_por_id(id_usuario)
+        # Con `uow` la caché de usuarios se invalida recién tras el commit de la unidad
+        kw = {} if uow is None else {"uow": uow}
+        usuario_existente = self.dao.buscar_por_id(id_usuario, **kw)
         if not usuario_existente:
             raise NoEncontradoError("Usuario")
 
-        # Si cambió username → validar duplicado
+        username_anterior = usuario_existente.username
+
+        # Si cambió username → validar duplicado (contra la BD, no la caché)
         if username and username != usuario_existente.username:
-            if self.dao.obtener_por_username(username):
+            if self.dao.obtener_por_username(username, usar_cache=False):
                 raise DuplicadoError("username", username)
             usuario_existente.username = username
 
@@ -75,10 +92,19 @@ class UsuarioService:
 
         usuario_existente.activo = bool(activo)
 
-        return self.dao.modificar(usuario_existente)
-
-    def eliminar_usuario(self, id_usuario: int) -> bool:
-        return self.dao.eliminar(id_usuario)
+        ok = self.dao.modificar(usuario_existente, **kw)
+        username_nuevo = usuario_existente.username
+        despues_de_confirmar(uow, lambda: (UsuarioDAO.invalidar_cache(username_anterior),
+                                           UsuarioDAO.invalidar_cache(username_nuevo)))
+        return ok
+
+    def eliminar_usuario(self, id_usuario: int, uow: UnidadDeTrabajo | None = None) -> bool:
+        kw = {} if uow is None else {"uow": uow}
+        usuario = self.dao.buscar_por_id(id_usuario, **kw)
+        ok = self.dao.eliminar(id_usuario, **kw)
+        if usuario:
+            despues_de_confirmar(uow, lambda: UsuarioDAO.invalidar_cache(usuario.username))
+        return ok
 
     def buscar_por_id(self, id_usuario: int):
         return self.dao.buscar_por_id(id_usuario)
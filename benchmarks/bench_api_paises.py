@@ -0,0 +1,114 @@
+# benchmarks/bench_api_paises.py
+# ==============================================================
+# Benchmark: requests.get suelto vs Session con keep-alive
+# --------------------------------------------------------------
+# Levanta un servidor HTTP/1.1 local que imita /alpha/{code} y mide
+# la latencia de N llamadas:
+#   - "sin_sesion": requests.get (una conexión TCP nueva por llamada)
+#   - "con_sesion": ApiPaisesService (Session + pool keep-alive, sin caché)
+# El servidor cuenta cuántas conexiones TCP se abrieron en cada caso.
+# (Contra restcountries.com el ahorro es mayor: además se evita el TLS.)
+#
+# Uso:
+#   python -m benchmarks.bench_api_paises --llamadas 500
+# ==============================================================
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from api.api_paises import ApiPaisesService
+
+_PAIS = json.dumps([{
+    "name": {"common": "Chile", "official": "Republic of Chile"},
+    "cca2": "CL", "cca3": "CHL", "region": "Americas",
+}]).encode("utf-8")
+
+
+class _ServidorStub(ThreadingHTTPServer):
+    daemon_threads = True
+    conexiones = 0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # permite keep-alive
+    disable_nagle_algorithm = True  # cabecera y cuerpo van en writes separados
+
+    def setup(self):
+        super().setup()
+        self.server.conexiones += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_PAIS)))
+        self.end_headers()
+        self.wfile.write(_PAIS)
+
+
+def _percentil(muestras: list, p: float) -> float:
+    orden = sorted(muestras)
+    return orden[min(len(orden) - 1, int(p * len(orden)))]
+
+
+def _medir(nombre: str, llamar, llamadas: int, servidor: _ServidorStub) -> dict:
+    servidor.conexiones = 0
+    latencias = []
+    inicio = time.perf_counter()
+    for _ in range(llamadas):
+        t = time.perf_counter()
+        llamar()
+        latencias.append((time.perf_counter() - t) * 1000)
+    total = time.perf_counter() - inicio
+    return {
+        "caso": nombre,
+        "llamadas": llamadas,
+        "conexiones_tcp": servidor.conexiones,
+        "total_s": round(total, 4),
+        "p50_ms": round(_percentil(latencias, 0.50), 3),
+        "p95_ms": round(_percentil(latencias, 0.95), 3),
+        "llamadas_por_s": round(llamadas / total, 1) if total else 0.0,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de keep-alive para ApiPaisesService.")
+    parser.add_argument("--llamadas", type=int, default=300)
+    parser.add_argument("--json", action="store_true", help="Imprime el resultado como JSON.")
+    args = parser.parse_args(argv)
+
+    servidor = _ServidorStub(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{servidor.server_port}"
+
+    try:
+        sin_sesion = _medir(
+            "sin_sesion",
+            lambda: requests.get(f"{base}/alpha/CL", headers=ApiPaisesService.HEADERS, timeout=8).json(),
+            args.llamadas, servidor,
+        )
+        service = ApiPaisesService(base, usar_cache=False)
+        con_sesion = _medir("con_sesion", lambda: service.buscar_por_codigo("CL"), args.llamadas, servidor)
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+
+    resultados = [sin_sesion, con_sesion]
+    if args.json:
+        print(json.dumps(resultados, indent=2))
+    else:
+        for r in resultados:
+            print(f"{r['caso']:<11} conexiones={r['conexiones_tcp']:<5} total={r['total_s']:.3f}s "
+                  f"p50={r['p50_ms']:.3f}ms p95={r['p95_ms']:.3f}ms ({r['llamadas_por_s']:.0f} llamadas/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
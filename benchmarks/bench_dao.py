@@ -0,0 +1,364 @@
+# benchmarks/bench_dao.py
+# ==============================================================
+# Micro-benchmark de los DAO con un dataset sintético reproducible
+# --------------------------------------------------------------
+# 1) Pobla empleado, departamento, PROYECTO, REGISTRODETURNO y usuarios
+#    con N filas sintéticas cada una (semilla fija => mismos datos).
+#    Los tamaños se recorren de menor a mayor y solo se inserta la
+#    diferencia, así 1k -> 100k -> 1M no vuelve a empezar de cero.
+# 2) Para cada tamaño mide cada función DAO: latencia (p50/media),
+#    operaciones/s, filas devueltas por segundo y pico de memoria de
+#    Python (tracemalloc, en una pasada aparte para no distorsionar tiempos).
+# 3) Con dos o más tamaños arma la curva de escalado: el exponente k de
+#    t ~ N^k entre tamaños consecutivos (≈0 constante, ≈1 lineal, >1 peor).
+#
+# IMPORTANTE: vacía las tablas de la BD indicada en --bd. Por eso se
+# niega a usar la BD de la aplicación (DB_NAME) salvo con --forzar.
+# La BD debe existir; las tablas e índices se crean con persistencia.migraciones.
+#
+# Uso:
+#   python -m benchmarks.bench_dao --bd empresa_bench --tamanos 1000,100000,1000000
+#   python -m benchmarks.bench_dao --bd empresa_bench --tamanos 1000,10000 --filtro empleado --json
+# ==============================================================
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+TAMANO_LOTE_SEMILLA = 5000
+HASH_FIJO = "$2b$04$C6UzMDM.H6dfI/f/IKcEeO5u1sRr9fPm.Q9V5y3pPq6n1JjRy5m7K"  # no se verifica
+FECHA_BASE = datetime(2015, 1, 1)
+TABLAS = ("REGISTRODETURNO", "RESUMEN_HORAS_DIA", "RESUMEN_HORAS_MES", "PROYECTO_EMPLEADO",
+          "empleado", "departamento", "PROYECTO", "usuarios")
+
+
+# --------------------------------------------------------------
+# Generación determinista: la fila i siempre es la misma
+# --------------------------------------------------------------
+
+def _rng(semilla: int, entidad: str, i: int) -> random.Random:
+    return random.Random(f"{semilla}:{entidad}:{i}")
+
+def _empleados(semilla: int, desde: int, hasta: int):
+    from dominio.empleado import Empleado
+    tipos = list(Empleado.TipoEmpleado)
+    for i in range(desde, hasta):
+        r = _rng(semilla, "empleado", i)
+        yield Empleado(
+            None, f"Nombre {r.randrange(100000):05d} Apellido{i}", f"Calle {r.randrange(1, 9999)}",
+            r.randrange(900000000, 999999999), f"empleado{i}@bench.local",
+            FECHA_BASE + timedelta(days=r.randrange(3650)), r.randrange(500000, 5000000),
+            f"emp{i:07d}", r.choice(tipos),
+        )
+
+def _departamentos(semilla: int, desde: int, hasta: int):
+    from dominio.departamento import Departamento
+    tipos = list(Departamento.TipoDepartamento)
+    for i in range(desde, hasta):
+        r = _rng(semilla, "departamento", i)
+        yield Departamento(0, f"Depto {r.randrange(100000):05d}-{i}", r.choice(tipos))
+
+def _proyectos(semilla: int, desde: int, hasta: int):
+    from dominio.proyecto import Proyecto
+    for i in range(desde, hasta):
+        r = _rng(semilla, "proyecto", i)
+        yield Proyecto(None, f"Proyecto {r.randrange(100000):05d}-{i}", f"Descripción sintética {i}",
+                       FECHA_BASE + timedelta(days=r.randrange(3650)))
+
+def _usuarios(semilla: int, desde: int, hasta: int):
+    from dominio.usuario import Usuario
+    for i in range(desde, hasta):
+        r = _rng(semilla, "usuario", i)
+        yield Usuario(username=f"user{i:07d}", password_hash=HASH_FIJO,
+                      nombre_completo=f"Usuario {i}", rol=r.choice(("admin", "usuario")), activo=True)
+
+def _turnos(semilla: int, desde: int, hasta: int, ids_empleado: tuple):
+    from dominio.registrodeturno import RegistroDeTurno
+    lo, hi = ids_empleado
+    for i in range(desde, hasta):
+        r = _rng(semilla, "turno", i)
+        yield RegistroDeTurno(None, r.randint(lo, hi), date(2024, 1, 1) + timedelta(days=r.randrange(365)),
+                              r.randint(1, 12), f"Tareas {i}")
+
+
+# --------------------------------------------------------------
+# Acceso directo a la BD (solo para poblar / contar)
+# --------------------------------------------------------------
+
+def _fila(sql: str, params=None):
+    from persistencia.conexion import Conexion
+    with Conexion().usar_conexion() as cx:
+        with cx.cursor() as cur:
+            cur.execute(sql, params)
+            return cur.fetchone()
+
+def _rango_ids(tabla: str, columna: str) -> tuple:
+    f = _fila(f"SELECT MIN({columna}) AS lo, MAX({columna}) AS hi FROM {tabla}")
+    return f["lo"], f["hi"]
+
+def _vaciar_tablas() -> None:
+    from persistencia.conexion import Conexion
+    with Conexion().usar_conexion() as cx:
+        with cx.cursor() as cur:
+            cur.execute("SET FOREIGN_KEY_CHECKS = 0")
+            try:
+                for tabla in TABLAS:
+                    cur.execute(f"TRUNCATE TABLE {tabla}")
+            finally:
+                cur.execute("SET FOREIGN_KEY_CHECKS = 1")
+        cx.commit()
+
+def _en_lotes(iterable, tamano: int):
+    lote = []
+    for x in iterable:
+        lote.append(x)
+        if len(lote) >= tamano:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+def _poblar(semilla: int, desde: int, hasta: int) -> float:
+    """Inserta las filas [desde, hasta) de cada tabla. Retorna los segundos empleados."""
+    from persistencia import empleadoDAO
+    from persistencia.departamentoDAO import DepartamentoDAO
+    from persistencia.proyectoDAO import ProyectoDAO
+    from persistencia.registrarturnoDAO import registroturnoDAO
+    from persistencia.usuarioDAO import UsuarioDAO
+
+    inicio = time.perf_counter()
+    pasos = (
+        (_empleados, empleadoDAO.insert_empleados_lote),
+        (_departamentos, DepartamentoDAO.guardar_departamentos_lote),
+        (_proyectos, ProyectoDAO.guardar_proyectos_lote),
+        (_usuarios, UsuarioDAO().crear_lote),
+    )
+    for generar, insertar in pasos:
+        for lote in _en_lotes(generar(semilla, desde, hasta), TAMANO_LOTE_SEMILLA):
+            insertar(lote)
+
+    ids = _rango_ids("empleado", "id_empleado")
+    for lote in _en_lotes(_turnos(semilla, desde, hasta, ids), TAMANO_LOTE_SEMILLA):
+        registroturnoDAO.guardar_turnos_lote(lote)
+    return time.perf_counter() - inicio
+
+
+# --------------------------------------------------------------
+# Casos a medir
+# --------------------------------------------------------------
+
+def _llamada(fn, *generadores):
+    """
+    Caso simple: en cada repetición se generan los argumentos (fuera de la
+    medición) y se retorna la función a medir, sin argumentos.
+    """
+    def preparar():
+        args = [g() for g in generadores]
+        return lambda: fn(*args)
+    return preparar
+
+def _consumir(generador):
+    """Caso que recorre un generador de bloques completo; retorna las filas leídas."""
+    return lambda: lambda: sum(len(b) for b in generador())
+
+def _casos(semilla: int, n: int) -> list:
+    """Lista de (nombre, preparar); preparar() retorna la función a medir."""
+    from functools import partial
+    from persistencia import empleadoDAO
+    from persistencia.departamentoDAO import DepartamentoDAO
+    from persistencia.proyectoDAO import ProyectoDAO
+    from persistencia.registrarturnoDAO import registroturnoDAO
+    from persistencia.usuarioDAO import UsuarioDAO
+
+    r = random.Random(f"{semilla}:casos:{n}")
+    usuarios = UsuarioDAO()
+
+    def al_azar(tabla, columna):
+        lo, hi = _rango_ids(tabla, columna)
+        return lambda: r.randint(lo, hi)
+
+    def texto(plantilla):
+        return lambda: plantilla.format(r.randrange(1000))
+
+    # Cursor a mitad de la tabla para medir una página "profunda" con keyset
+    medio = _fila("SELECT nombre, id_empleado FROM empleado ORDER BY nombre, id_empleado LIMIT 1 OFFSET %s",
+                  (n // 2,))
+
+    def insert_empleado():
+        # Mide el INSERT y deja la tabla como estaba (el borrado no se mide)
+        emp = next(_empleados(semilla, n + 10**8, n + 10**8 + 1))
+        insertados = []
+        fn = lambda: insertados.append(empleadoDAO.insert_empleado(emp))
+        fn.limpiar = lambda: [empleadoDAO.eliminar_empleado_por_id(i) for i in insertados]
+        return fn
+
+    return [
+        ("empleadoDAO.insert_empleado", insert_empleado),
+        ("empleadoDAO.buscar_empleado_detalle_por_id",
+         _llamada(empleadoDAO.buscar_empleado_detalle_por_id, al_azar("empleado", "id_empleado"))),
+        ("empleadoDAO.listar_empleados[primera_pagina]", _llamada(partial(empleadoDAO.listar_empleados, limit=20))),
+        ("empleadoDAO.listar_empleados[pagina_media]",
+         _llamada(partial(empleadoDAO.listar_empleados, medio["nombre"], medio["id_empleado"], limit=20))),
+        ("empleadoDAO.listar_empleados[completo]", _llamada(empleadoDAO.listar_empleados)),
+        ("empleadoDAO.iter_empleados", _consumir(partial(empleadoDAO.iter_empleados, 1000))),
+        ("empleadoDAO.buscar_empleados_por_nombre",
+         _llamada(empleadoDAO.buscar_empleados_por_nombre, texto("Nombre {:03d}"))),
+        ("DepartamentoDAO.obtener_departamento_por_id",
+         _llamada(DepartamentoDAO.obtener_departamento_por_id, al_azar("departamento", "id_departamento"))),
+        ("DepartamentoDAO.listar_departamentos[primera_pagina]",
+         _llamada(partial(DepartamentoDAO.listar_departamentos, limit=20))),
+        ("DepartamentoDAO.buscar_departamentos_por_nombre",
+         _llamada(DepartamentoDAO.buscar_departamentos_por_nombre, texto("Depto {:03d}"))),
+        ("ProyectoDAO.obtener_proyecto_por_id",
+         _llamada(ProyectoDAO.obtener_proyecto_por_id, al_azar("PROYECTO", "id_proyecto"))),
+        ("ProyectoDAO.listar_proyectos[primera_pagina]", _llamada(partial(ProyectoDAO.listar_proyectos, limit=20))),
+        ("ProyectoDAO.listar_proyectos[completo]", _llamada(ProyectoDAO.listar_proyectos)),
+        ("ProyectoDAO.buscar_proyectos_por_nombre",
+         _llamada(ProyectoDAO.buscar_proyectos_por_nombre, texto("Proyecto {:03d}"))),
+        ("registroturnoDAO.buscar_por_id",
+         _llamada(registroturnoDAO.buscar_por_id, al_azar("REGISTRODETURNO", "id_registro"))),
+        ("registroturnoDAO.iter_turnos", _consumir(partial(registroturnoDAO.iter_turnos, 1000))),
+        ("UsuarioDAO.obtener_por_username",
+         _llamada(partial(usuarios.obtener_por_username, usar_cache=False), lambda: f"user{r.randrange(n):07d}")),
+        ("UsuarioDAO.listar_todos", _llamada(usuarios.listar_todos)),
+    ]
+
+
+def _filas(resultado) -> int:
+    if isinstance(resultado, int) and not isinstance(resultado, bool):
+        return resultado  # los _consumir retornan el conteo
+    if isinstance(resultado, (list, tuple)):
+        return len(resultado)
+    return 1 if resultado is not None else 0
+
+def _medir_caso(preparar, repeticiones: int) -> dict:
+    tiempos, filas = [], 0
+    for _ in range(repeticiones):
+        fn = preparar()
+        t = time.perf_counter()
+        resultado = fn()
+        tiempos.append(time.perf_counter() - t)
+        filas = _filas(resultado)
+        getattr(fn, "limpiar", lambda: None)()
+
+    # Pico de memoria en una pasada aparte (tracemalloc enlentece la ejecución)
+    fn = preparar()
+    tracemalloc.start()
+    try:
+        fn()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        getattr(fn, "limpiar", lambda: None)()
+
+    tiempos.sort()
+    p50 = tiempos[len(tiempos) // 2]
+    media = sum(tiempos) / len(tiempos)
+    return {
+        "p50_ms": round(p50 * 1000, 3),
+        "media_ms": round(media * 1000, 3),
+        "ops_por_s": round(1 / media, 2) if media else 0.0,
+        "filas": filas,
+        "filas_por_s": round(filas / media, 1) if media else 0.0,
+        "pico_memoria_kb": round(pico / 1024, 1),
+    }
+
+def _curva(resultados: list) -> dict:
+    """Por caso: [(n, p50_ms)] y exponentes de escalado entre tamaños consecutivos."""
+    curvas = {}
+    for r in resultados:
+        for caso, m in r["casos"].items():
+            curvas.setdefault(caso, {"puntos": [], "exponentes": []})["puntos"].append((r["n"], m["p50_ms"]))
+    for c in curvas.values():
+        pts = c["puntos"]
+        for (n1, t1), (n2, t2) in zip(pts, pts[1:]):
+            if n2 > n1 and t1 > 0 and t2 > 0:
+                c["exponentes"].append(round(math.log(t2 / t1) / math.log(n2 / n1), 2))
+        c["no_lineal"] = any(k > 1.2 for k in c["exponentes"])
+    return curvas
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmark de DAO con dataset sintético.")
+    parser.add_argument("--bd", default="empresa_bench", help="BD donde se poblarán los datos (se vacía).")
+    parser.add_argument("--forzar", action="store_true", help="Permite usar la BD de la aplicación.")
+    parser.add_argument("--tamanos", default="1000,100000,1000000", help="Filas por tabla, separadas por coma.")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--filtro", default="", help="Solo casos cuyo nombre contenga este texto.")
+    parser.add_argument("--json", action="store_true", help="Imprime el resultado como JSON.")
+    parser.add_argument("--salida", help="Además guarda el JSON en este archivo.")
+    args = parser.parse_args(argv)
+
+    tamanos = sorted({int(t) for t in args.tamanos.split(",") if t.strip()})
+    if not tamanos or tamanos[0] < 1:
+        parser.error("--tamanos debe contener enteros positivos.")
+
+    # La BD se elige antes de importar config/persistencia (leen DB_NAME al cargar)
+    from dotenv import load_dotenv
+    load_dotenv()
+    if args.bd == os.getenv("DB_NAME") and not args.forzar:
+        parser.error(f"'{args.bd}' es la BD de la aplicación; usa otra o agrega --forzar.")
+    os.environ["DB_NAME"] = args.bd
+
+    silencio = io.StringIO()  # algunos DAO imprimen mensajes por cada operación
+    resultados, actual = [], 0
+    from persistencia import migraciones
+    with contextlib.redirect_stdout(silencio):
+        migraciones.migrar()
+        _vaciar_tablas()
+    for n in tamanos:
+        print(f"Poblando hasta {n:,} filas por tabla...", file=sys.stderr)
+        with contextlib.redirect_stdout(silencio):
+            seg_poblar = _poblar(args.semilla, actual, n)
+        actual = n
+
+        casos = {}
+        for nombre, preparar in _casos(args.semilla, n):
+            if args.filtro and args.filtro.lower() not in nombre.lower():
+                continue
+            print(f"  {nombre} (n={n:,})", file=sys.stderr)
+            with contextlib.redirect_stdout(silencio):
+                casos[nombre] = _medir_caso(preparar, args.repeticiones)
+        resultados.append({"n": n, "segundos_poblado": round(seg_poblar, 2), "casos": casos})
+
+    salida = {
+        "benchmark": "dao",
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "bd": args.bd,
+        "semilla": args.semilla,
+        "repeticiones": args.repeticiones,
+        "resultados": resultados,
+        "escalado": _curva(resultados),
+    }
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(salida, f, indent=2)
+    if args.json:
+        print(json.dumps(salida, indent=2))
+        return 0
+
+    for r in resultados:
+        print(f"\n=== n = {r['n']:,} (poblado en {r['segundos_poblado']} s) ===")
+        print(f"{'caso':<52} {'p50 ms':>10} {'ops/s':>10} {'filas':>9} {'pico KB':>10}")
+        for caso, m in r["casos"].items():
+            print(f"{caso:<52} {m['p50_ms']:>10.3f} {m['ops_por_s']:>10.1f} {m['filas']:>9} {m['pico_memoria_kb']:>10.1f}")
+    if len(resultados) > 1:
+        print("\n=== Escalado (exponente k de t ~ N^k) ===")
+        for caso, c in salida["escalado"].items():
+            marca = "  <-- no lineal" if c["no_lineal"] else ""
+            print(f"{caso:<52} {c['exponentes']}{marca}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,143 @@
+# benchmarks/bench_hidratacion.py
+# ==============================================================
+# Benchmark: hidratación de filas de empleado (sin BD)
+# --------------------------------------------------------------
+# Genera N filas sintéticas con la forma que entrega PyMySQL (dicts de
+# DictCursor y tuplas de Cursor) y compara, por estrategia:
+#   - dict_copia        : _fila_a_dict por fila (lo que hacen hoy los DAO)
+#   - objeto_init       : Empleado(...) llamando a __init__ campo por campo
+#   - hidratador_dict   : empleadoDAO.HIDRATADOR.muchos(filas dict)
+#   - hidratador_tupla  : empleadoDAO.HIDRATADOR.muchos(filas tupla, tuplas=True)
+# Reporta la mediana del tiempo, filas/s y los bytes por resultado
+# (tracemalloc), incluidos los de una clase Empleado con __dict__
+# (como era antes de __slots__) como referencia.
+#
+# Uso:
+#   python -m benchmarks.bench_hidratacion --filas 100000 --repeticiones 5
+#   python -m benchmarks.bench_hidratacion --json --salida hidratacion.json
+# ==============================================================
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+
+from dominio.empleado import Empleado
+from persistencia import empleadoDAO
+
+COLUMNAS = ("id_empleado", "nombre", "direccion", "numero_telefono", "correo_electronico",
+            "fecha_inicio_contrato", "salario", "usuario", "tipo_empleado")
+TIPOS = [t.value for t in Empleado.TipoEmpleado]
+
+
+class _EmpleadoConDict(Empleado):
+    """Misma clase pero con __dict__ por instancia (sin __slots__ propios)."""
+
+
+def _filas(n: int) -> list:
+    base = date(2015, 1, 1)
+    return [
+        (i, f"Empleado {i}", f"Calle {i % 997} #{i}", f"9{i:08d}", f"empleado{i}@empresa.cl",
+         base + timedelta(days=i % 3650), Decimal(500000 + (i % 1000) * 1000),
+         f"emp{i}", TIPOS[i % len(TIPOS)])
+        for i in range(1, n + 1)
+    ]
+
+def _con_init(clase):
+    def construir(filas):
+        tipo = Empleado.TipoEmpleado
+        return [
+            clase(r["id_empleado"], r["nombre"], r["direccion"], r["numero_telefono"],
+                  r["correo_electronico"], empleadoDAO._to_datetime(r["fecha_inicio_contrato"]),
+                  float(r["salario"]), r["usuario"], tipo(r["tipo_empleado"]))
+            for r in filas
+        ]
+    return construir
+
+def _medir(fn, filas, repeticiones: int) -> dict:
+    tiempos = []
+    for _ in range(repeticiones):
+        t = time.perf_counter()
+        fn(filas)
+        tiempos.append(time.perf_counter() - t)
+    mediana = statistics.median(tiempos)
+
+    # Memoria: lo que queda vivo tras hidratar (resultados + valores convertidos)
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    resultado = fn(filas)
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del resultado
+    return {
+        "mediana_ms": round(mediana * 1000, 2),
+        "filas_por_s": round(len(filas) / mediana) if mediana else None,
+        "bytes_por_fila": round((despues - antes) / len(filas), 1),
+    }
+
+def _commit_actual() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de hidratación fila -> objeto.")
+    parser.add_argument("--filas", type=int, default=100_000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Imprime el resultado como JSON.")
+    parser.add_argument("--salida", help="Además guarda el JSON en este archivo.")
+    args = parser.parse_args(argv)
+    if args.filas < 1 or args.repeticiones < 1:
+        parser.error("--filas y --repeticiones deben ser positivos.")
+
+    tuplas = _filas(args.filas)
+    dicts = [dict(zip(COLUMNAS, t)) for t in tuplas]
+    hidratador = empleadoDAO.HIDRATADOR
+
+    casos = {
+        "dict_copia": (lambda f: [empleadoDAO._fila_a_dict(r) for r in f], dicts),
+        "objeto_init_con_dict": (_con_init(_EmpleadoConDict), dicts),
+        "objeto_init": (_con_init(Empleado), dicts),
+        "hidratador_dict": (hidratador.muchos, dicts),
+        "hidratador_tupla": (lambda f: hidratador.muchos(f, tuplas=True), tuplas),
+    }
+    resultados = {}
+    for nombre, (fn, filas) in casos.items():
+        resultados[nombre] = _medir(fn, filas, args.repeticiones)
+
+    resultado = {
+        "benchmark": "hidratacion",
+        "commit": _commit_actual(),
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "filas": args.filas,
+        "repeticiones": args.repeticiones,
+        "casos": resultados,
+    }
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, indent=2)
+    if args.json:
+        print(json.dumps(resultado, indent=2))
+    else:
+        base = resultados["dict_copia"]["mediana_ms"]
+        print(f"{args.filas:,} filas, mediana de {args.repeticiones} repeticiones")
+        for nombre, r in resultados.items():
+            print(f"{nombre:<22} {r['mediana_ms']:>9.2f} ms  {r['filas_por_s']:>10,} filas/s  "
+                  f"{r['bytes_por_fila']:>7.1f} B/fila  x{base / r['mediana_ms']:.2f} vs dict_copia")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,279 @@
+# benchmarks/bench_login.py
+# ==============================================================
+# Benchmark: rendimiento de login y alta de usuarios
+# --------------------------------------------------------------
+# Ejecuta UsuarioService.crear_usuario y AuthService.login con N hilos
+# en paralelo y reporta, por fase:
+#   - latencia total p50/p95/p99
+#   - separada en "bd" (tiempo dentro del DAO) y "hash" (el resto:
+#     bcrypt + validaciones, que es prácticamente solo bcrypt)
+#   - operaciones por segundo
+#
+# Backends:
+#   - sqlite  (por defecto): archivo temporal, sin servidor; sirve para
+#     comparar commits en cualquier máquina.
+#   - mariadb: UsuarioDAO real contra la BD de .env. Los usuarios de
+#     prueba llevan el prefijo "bench_" y se borran al terminar.
+#
+# Uso:
+#   python -m benchmarks.bench_login --usuarios 50 --logins 500 --concurrencia 8 --rondas 10
+#   python -m benchmarks.bench_login --backend mariadb --json --salida login.json
+# ==============================================================
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from aplicacion import config
+from aplicacion.authService import AuthService
+from aplicacion.usuarioService import UsuarioService
+from dominio.usuario import Usuario
+
+PASSWORD = "Bench#2024"
+
+
+class _UsuarioDAOSQLite:
+    """Sustituto mínimo de UsuarioDAO sobre SQLite (una conexión por hilo)."""
+
+    def __init__(self, ruta: str) -> None:
+        self.ruta = ruta
+        self._local = threading.local()
+        cx = self._cx()
+        cx.execute("PRAGMA journal_mode=WAL")
+        cx.execute(
+            """
+            CREATE TABLE IF NOT EXISTS usuarios (
+                id              INTEGER PRIMARY KEY AUTOINCREMENT,
+                username        TEXT NOT NULL UNIQUE,
+                password_hash   TEXT NOT NULL,
+                nombre_completo TEXT,
+                rol             TEXT NOT NULL,
+                activo          INTEGER NOT NULL DEFAULT 1
+            )
+            """
+        )
+        cx.commit()
+
+    def _cx(self) -> sqlite3.Connection:
+        cx = getattr(self._local, "cx", None)
+        if cx is None:
+            cx = sqlite3.connect(self.ruta, timeout=30)
+            cx.row_factory = sqlite3.Row
+            self._local.cx = cx
+        return cx
+
+    def obtener_por_username(self, username: str, usar_cache: bool = True):
+        f = self._cx().execute(
+            "SELECT id, username, password_hash, nombre_completo, rol, activo FROM usuarios WHERE username = ?",
+            (username,),
+        ).fetchone()
+        return Usuario(**dict(f)) if f else None
+
+    def crear(self, usuario: Usuario) -> int:
+        cx = self._cx()
+        cur = cx.execute(
+            "INSERT INTO usuarios (username, password_hash, nombre_completo, rol, activo) VALUES (?, ?, ?, ?, ?)",
+            (usuario.username, usuario.password_hash, usuario.nombre_completo, usuario.rol, int(usuario.activo)),
+        )
+        cx.commit()
+        return cur.lastrowid
+
+    def actualizar_password_hash(self, id_usuario: int, hash_nuevo: str, hash_anterior: str) -> bool:
+        cx = self._cx()
+        cur = cx.execute(
+            "UPDATE usuarios SET password_hash = ? WHERE id = ? AND password_hash = ?",
+            (hash_nuevo, id_usuario, hash_anterior),
+        )
+        cx.commit()
+        return cur.rowcount > 0
+
+    def eliminar(self, id_usuario: int) -> bool:
+        cx = self._cx()
+        cur = cx.execute("DELETE FROM usuarios WHERE id = ?", (id_usuario,))
+        cx.commit()
+        return cur.rowcount > 0
+
+
+class _DAOMedido:
+    """
+    Envuelve un DAO y acumula, por hilo, el tiempo pasado dentro de él.
+    Con usar_cache=False fuerza que cada búsqueda llegue a la BD.
+    """
+
+    def __init__(self, dao, usar_cache: bool) -> None:
+        self._dao = dao
+        self._usar_cache = usar_cache
+        self._local = threading.local()
+
+    def reiniciar(self) -> None:
+        self._local.segundos = 0.0
+
+    def segundos(self) -> float:
+        return getattr(self._local, "segundos", 0.0)
+
+    def _medir(self, fn, *args, **kwargs):
+        t = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._local.segundos = self.segundos() + (time.perf_counter() - t)
+
+    def obtener_por_username(self, username: str, usar_cache: bool = True):
+        return self._medir(self._dao.obtener_por_username, username,
+                           usar_cache=usar_cache and self._usar_cache)
+
+    def __getattr__(self, nombre):
+        atributo = getattr(self._dao, nombre)
+        if not callable(atributo):
+            return atributo
+        return lambda *a, **kw: self._medir(atributo, *a, **kw)
+
+
+def _percentil(muestras: list, p: float) -> float:
+    if not muestras:
+        return 0.0
+    orden = sorted(muestras)
+    return orden[min(len(orden) - 1, int(p * len(orden)))]
+
+def _resumen(muestras: list) -> dict:
+    return {
+        "p50_ms": round(_percentil(muestras, 0.50), 3),
+        "p95_ms": round(_percentil(muestras, 0.95), 3),
+        "p99_ms": round(_percentil(muestras, 0.99), 3),
+        "media_ms": round(sum(muestras) / len(muestras), 3) if muestras else 0.0,
+    }
+
+def _ejecutar_fase(nombre: str, operacion, argumentos: list, dao: _DAOMedido, concurrencia: int) -> dict:
+    """Corre `operacion(*args)` para cada elemento de `argumentos` con `concurrencia` hilos."""
+    total_ms, bd_ms, errores = [], [], []
+    lock = threading.Lock()
+
+    def _una(args):
+        dao.reiniciar()
+        t = time.perf_counter()
+        try:
+            operacion(*args)
+            error = None
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        total = (time.perf_counter() - t) * 1000
+        with lock:
+            total_ms.append(total)
+            bd_ms.append(dao.segundos() * 1000)
+            if error:
+                errores.append(error)
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrencia) as ex:
+        list(ex.map(_una, argumentos))
+    segundos = time.perf_counter() - inicio
+
+    return {
+        "fase": nombre,
+        "operaciones": len(argumentos),
+        "errores": len(errores),
+        "primer_error": errores[0] if errores else None,
+        "total_s": round(segundos, 4),
+        "ops_por_s": round(len(argumentos) / segundos, 2) if segundos else 0.0,
+        "total": _resumen(total_ms),
+        "bd": _resumen(bd_ms),
+        "hash": _resumen([t - b for t, b in zip(total_ms, bd_ms)]),
+    }
+
+def _commit_actual() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de login / alta de usuarios.")
+    parser.add_argument("--backend", choices=("sqlite", "mariadb"), default="sqlite")
+    parser.add_argument("--usuarios", type=int, default=20, help="Usuarios a crear.")
+    parser.add_argument("--logins", type=int, default=200, help="Logins a ejecutar (repartidos entre los usuarios).")
+    parser.add_argument("--concurrencia", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--rondas", type=int, default=config.BCRYPT_ROUNDS, help="Costo bcrypt (log2).")
+    parser.add_argument("--usar-cache", action="store_true",
+                        help="Deja activa la caché de usuarios (por defecto cada login consulta la BD).")
+    parser.add_argument("--json", action="store_true", help="Imprime el resultado como JSON.")
+    parser.add_argument("--salida", help="Además guarda el JSON en este archivo.")
+    args = parser.parse_args(argv)
+
+    # El costo de hash sigue a config: así crear_usuario genera hashes con --rondas
+    # y login no dispara rehash en segundo plano durante la medición.
+    config.BCRYPT_ROUNDS = args.rondas
+
+    tmp = None
+    if args.backend == "sqlite":
+        tmp = tempfile.TemporaryDirectory(prefix="bench_login_")
+        base = _UsuarioDAOSQLite(os.path.join(tmp.name, "usuarios.sqlite3"))
+    else:
+        from persistencia.usuarioDAO import UsuarioDAO
+        base = UsuarioDAO()
+
+    dao = _DAOMedido(base, args.usar_cache)
+    usuarios_srv = UsuarioService(dao=dao)
+    auth = AuthService(dao=dao)
+    prefijo = f"bench_{os.getpid()}_"
+    nombres = [f"{prefijo}{i}" for i in range(args.usuarios)]
+
+    try:
+        crear = _ejecutar_fase(
+            "crear_usuario",
+            lambda u: usuarios_srv.crear_usuario(u, PASSWORD, "Usuario Benchmark"),
+            [(u,) for u in nombres], dao, args.concurrencia,
+        )
+        login = _ejecutar_fase(
+            "login",
+            lambda u: auth.login(u, PASSWORD),
+            [(nombres[i % len(nombres)],) for i in range(args.logins)], dao, args.concurrencia,
+        )
+    finally:
+        for u in nombres:
+            existente = base.obtener_por_username(u, usar_cache=False)
+            if existente:
+                base.eliminar(existente.id)
+        if tmp is not None:
+            tmp.cleanup()
+
+    resultado = {
+        "benchmark": "login",
+        "commit": _commit_actual(),
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "backend": args.backend,
+        "rondas_bcrypt": args.rondas,
+        "concurrencia": args.concurrencia,
+        "usar_cache": args.usar_cache,
+        "fases": [crear, login],
+    }
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, indent=2)
+    if args.json:
+        print(json.dumps(resultado, indent=2))
+    else:
+        print(f"backend={args.backend} rondas={args.rondas} concurrencia={args.concurrencia} "
+              f"cache={'sí' if args.usar_cache else 'no'}")
+        for r in resultado["fases"]:
+            print(f"{r['fase']:<14} {r['operaciones']} ops en {r['total_s']:.3f}s "
+                  f"({r['ops_por_s']:.1f} ops/s, errores={r['errores']})")
+            for parte in ("total", "bd", "hash"):
+                m = r[parte]
+                print(f"   {parte:<5} p50={m['p50_ms']:.3f}ms p95={m['p95_ms']:.3f}ms p99={m['p99_ms']:.3f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+# cli_datos.py
+# ============================================================
+# Importación / exportación masiva desde la línea de comandos
+# (sin pasar por los menús interactivos).
+#
+# Ejemplos:
+#   python cli_datos.py exportar empleados empleados.csv
+#   python cli_datos.py exportar turnos turnos.jsonl --bloque 5000
+#   python cli_datos.py importar proyectos proyectos.csv --lote 1000
+# ============================================================
+
+import argparse
+from aplicacion import transferencia_datos as td
+
+MAX_RECHAZOS_MOSTRADOS = 20
+
+def _crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Exporta/importa empleados, departamentos, proyectos, turnos y usuarios (CSV o JSONL)."
+    )
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    exp = sub.add_parser("exportar", help="Exporta una entidad a archivo.")
+    exp.add_argument("entidad", choices=td.ENTIDADES)
+    exp.add_argument("archivo", help="Ruta de salida (.csv o .jsonl)")
+    exp.add_argument("--formato", choices=td.FORMATOS, help="Por defecto se deduce de la extensión.")
+    exp.add_argument("--bloque", type=int, default=1000, help="Filas leídas de la BD por bloque.")
+
+    imp = sub.add_parser("importar", help="Importa una entidad desde archivo.")
+    imp.add_argument("entidad", choices=td.ENTIDADES)
+    imp.add_argument("archivo", help="Ruta de entrada (.csv o .jsonl)")
+    imp.add_argument("--formato", choices=td.FORMATOS, help="Por defecto se deduce de la extensión.")
+    imp.add_argument("--lote", type=int, default=500, help="Filas por INSERT/commit.")
+    return parser
+
+def main(argv=None) -> int:
+    args = _crear_parser().parse_args(argv)
+    try:
+        if args.comando == "exportar":
+            r = td.exportar(args.entidad, args.archivo, args.formato, args.bloque)
+            print(f"  Exportadas {r['filas']} filas de {args.entidad} a {args.archivo}")
+        else:
+            r = td.importar(args.entidad, args.archivo, args.formato, args.lote)
+            print(f"  Insertadas {r['insertados']} filas de {args.entidad} en {r['lotes']} lote(s)")
+            for numero_lote, motivo in r.get("errores_lote", []):
+                print(f"⚠ Lote {numero_lote} rechazado por la BD, reintentado fila por fila: {motivo}")
+            if r["rechazados"]:
+                print(f"⚠ {len(r['rechazados'])} fila(s) rechazada(s):")
+                for numero, motivo in r["rechazados"][:MAX_RECHAZOS_MOSTRADOS]:
+                    print(f"   - fila {numero}: {motivo}")
+                if len(r["rechazados"]) > MAX_RECHAZOS_MOSTRADOS:
+                    print(f"   ... y {len(r['rechazados']) - MAX_RECHAZOS_MOSTRADOS} más")
+    except (ValueError, OSError) as e:
+        print(f"❌ {e}")
+        return 1
+    except Exception as e:
+        print(f"💥 Error inesperado: {e}")
+        return 1
+
+    print(f"  Tiempo: {r['segundos']:.2f} s | Rendimiento: {r['filas_por_segundo']:,.0f} filas/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -17,6 +17,8 @@ class Departamento:
     No contiene lógica de BD; solo datos y comportamiento básico.
     """
 
+    __slots__ = ("id_departamento", "nombre", "tipo_departamento")
+
     class TipoDepartamento(Enum):
         """
         Enumeración de tipos válidos de departamento.
@@ -18,6 +18,13 @@ class Empleado:
     No contiene lógica de BD; solo datos y comportamiento básico.
     """
 
+    # Atributos fijos en __slots__: las instancias no llevan __dict__, lo que
+    # reduce bastante la memoria cuando se cargan muchos empleados a la vez.
+    __slots__ = (
+        "id_empleado", "nombre", "direccion", "numero_telefono", "correo_electronico",
+        "fecha_inicio_contrato", "salario", "usuario", "tipo_empleado",
+    )
+
     class TipoEmpleado(Enum):
         """
         Enumeración con los tipos válidos de empleado.
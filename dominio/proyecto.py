@@ -5,7 +5,9 @@
 # Representa un proyecto de la organización.
 # Incluye:
 #   - Atributos básicos (id, nombre, descripción, fecha_inicio).
-#   - Relación con Empleado(s) asignados (lista en memoria).
+#   - Relación con Empleado(s) asignados (dict en memoria indexado por
+#     id_empleado: pertenencia, alta y baja en O(1)). La persistencia de
+#     las asignaciones vive en persistencia.proyectoEmpleadoDAO.
 #   - Métodos utilitarios: crear/editar/eliminar (a nivel de dominio),
 #     asignar y desasignar empleados.
 # Nota: aquí NO hay acceso a BD; eso vive en la capa de persistencia (DAO).
@@ -20,6 +22,8 @@ class Proyecto:
     No maneja SQL ni conexiones; solo datos y comportamiento básico.
     """
 
+    __slots__ = ("id_proyecto", "nombre", "descripcion", "fecha_inicio", "empleados_asignados")
+
     def __init__(
         self,
         id_proyecto: int,
@@ -46,8 +50,8 @@ class Proyecto:
         self.descripcion = descripcion
         self.fecha_inicio = fecha_inicio
 
-        # Relación a nivel de dominio (en memoria): lista de Empleado asignados
-        self.empleados_asignados: list[Empleado] = []
+        # Relación a nivel de dominio (en memoria): id_empleado -> Empleado asignado
+        self.empleados_asignados: dict[int, Empleado] = {}
 
     # ----------------------------------------------------------
     # Representación legible
@@ -139,22 +143,79 @@ class Proyecto:
     # ----------------------------------------------------------
     # Relación con Empleados: asignar / desasignar
     # ----------------------------------------------------------
+    @staticmethod
+    def _clave(empleado) -> int:
+        """
+        Clave del empleado en empleados_asignados: su id. Para consultar o
+        desasignar se acepta también el id directamente.
+        """
+        if isinstance(empleado, Empleado):
+            clave = empleado.obtener_id()
+            if clave is None:
+                raise ValueError(f"El empleado '{empleado.nombre}' no tiene id (aún no está guardado).")
+            return clave
+        return int(empleado)
+
+    def esta_asignado(self, empleado) -> bool:
+        """True si el empleado (objeto o id) está asignado al proyecto."""
+        return self._clave(empleado) in self.empleados_asignados
+
+    def ids_empleados_asignados(self) -> set:
+        """Ids de los empleados asignados."""
+        return set(self.empleados_asignados)
+
+    def obtener_empleados_asignados(self) -> list:
+        """Empleados asignados, en el orden en que se asignaron."""
+        return list(self.empleados_asignados.values())
+
+    @staticmethod
+    def _exigir_empleado(empleado) -> None:
+        # Se guarda el objeto (no solo el id) para que obtener_empleados_asignados entregue Empleados
+        if not isinstance(empleado, Empleado):
+            raise TypeError(f"Solo se pueden asignar objetos Empleado (se recibió {type(empleado).__name__}).")
+
     def asignar_empleado(self, empleado: Empleado) -> None:
         """
         Asigna un empleado al proyecto, si no estaba ya asignado.
+        Lanza TypeError si no recibe un Empleado.
         """
-        if empleado not in self.empleados_asignados:
-            self.empleados_asignados.append(empleado)
+        self._exigir_empleado(empleado)
+        clave = self._clave(empleado)
+        if clave not in self.empleados_asignados:
+            self.empleados_asignados[clave] = empleado
             print(f"Empleado '{empleado.nombre}' asignado a proyecto '{self.nombre}'.")
         else:
             print(f"Empleado '{empleado.nombre}' ya estaba asignado a este proyecto.")
 
-    def desasignar_empleado(self, empleado: Empleado) -> None:
+    def desasignar_empleado(self, empleado) -> None:
         """
-        Desasigna un empleado del proyecto, si estaba asignado.
+        Desasigna un empleado (objeto o id) del proyecto, si estaba asignado.
         """
-        if empleado in self.empleados_asignados:
-            self.empleados_asignados.remove(empleado)
-            print(f"Empleado '{empleado.nombre}' desasignado de proyecto '{self.nombre}'.")
+        clave = self._clave(empleado)
+        quitado = self.empleados_asignados.pop(clave, None)
+        if quitado is not None:
+            print(f"Empleado '{quitado.nombre}' desasignado de proyecto '{self.nombre}'.")
         else:
-            print(f"Empleado '{empleado.nombre}' no está asignado a este proyecto.")
+            nombre = f"'{empleado.nombre}'" if isinstance(empleado, Empleado) else f"con ID {clave}"
+            print(f"Empleado {nombre} no está asignado a este proyecto.")
+
+    def asignar_empleados(self, empleados) -> int:
+        """
+        Asigna varios Empleado sin mensajes por cada uno. Retorna cuántos eran nuevos.
+        Lanza TypeError (sin asignar ninguno) si alguno no es un Empleado.
+        """
+        empleados = list(empleados)
+        for empleado in empleados:
+            self._exigir_empleado(empleado)
+        antes = len(self.empleados_asignados)
+        for empleado in empleados:
+            self.empleados_asignados.setdefault(self._clave(empleado), empleado)
+        return len(self.empleados_asignados) - antes
+
+    def desasignar_empleados(self, empleados) -> int:
+        """Desasigna varios empleados (objetos o ids). Retorna cuántos estaban asignados."""
+        quitados = 0
+        for empleado in empleados:
+            if self.empleados_asignados.pop(self._clave(empleado), None) is not None:
+                quitados += 1
+        return quitados
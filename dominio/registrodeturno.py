@@ -17,6 +17,8 @@ class RegistroDeTurno:
     Clase de dominio (sin lógica de BD) para modelar un registro de turno.
     """
 
+    __slots__ = ("id_registro", "id_empleado", "fecha", "cantidad_horas", "tareas_realizadas")
+
     def __init__(
         self,
         id_registro: int,
@@ -1,6 +1,8 @@
 # dominio/usuario.py
 
 class Usuario:
+    __slots__ = ("id", "username", "password_hash", "nombre_completo", "rol", "activo")
+
     def __init__(self, id=None, username="", password_hash="", nombre_completo="", rol="usuario", activo=True):
         self.id = id
         self.username = username
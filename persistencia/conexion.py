@@ -2,18 +2,289 @@
 # ==============================================================
 # CONEXIÓN A BD (MySQL/MariaDB) con PyMySQL
 # Lee credenciales desde .env vía aplicacion.config
+# --------------------------------------------------------------
+# Las conexiones se reutilizan a través de un pool compartido
+# (PoolConexiones), así cada consulta evita pagar el handshake
+# TCP + autenticación. Los DAO siguen usando:
+#     cx = con.obtener_conexion()   -> pide una conexión al pool
+#     con.cerrar_conexion(cx)       -> la devuelve al pool
+# o bien el context manager:
+#     with con.usar_conexion() as cx:
+#         ...
+# Si reciben una UnidadDeTrabajo (persistencia.unidad_trabajo), la
+# conexión que entregan es la de la unidad: sus commit/close no hacen
+# nada y la transacción se confirma una sola vez al salir del `with`.
 # ==============================================================
 
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
 import pymysql
 import pymysql.cursors
 from aplicacion import config
 
+
+class PoolConexiones:
+    """
+    Pool de conexiones acotado y thread-safe.
+    - min_conexiones     : conexiones que se mantienen abiertas aunque estén ociosas.
+    - max_conexiones     : tope de conexiones abiertas a la vez (en uso + libres).
+    - tiempo_inactividad : segundos tras los cuales una conexión libre se cierra
+                           (sin bajar nunca del mínimo).
+    - tiempo_espera      : segundos que se espera por una conexión si el pool está lleno.
+    Antes de entregar una conexión reutilizada se le hace ping para verificar que sigue viva.
+    """
+
+    def __init__(self, fabrica, min_conexiones: int = 1, max_conexiones: int = 10,
+                 tiempo_inactividad: float = 300, tiempo_espera: float = 10) -> None:
+        if max_conexiones < 1:
+            raise ValueError("max_conexiones debe ser al menos 1.")
+        self._fabrica = fabrica
+        self.max_conexiones = max_conexiones
+        self.min_conexiones = max(0, min(min_conexiones, max_conexiones))
+        self.tiempo_inactividad = tiempo_inactividad
+        self.tiempo_espera = tiempo_espera
+
+        self._cond = threading.Condition()
+        self._libres = deque()     # (conexion, instante_ultimo_uso); el final es la más reciente
+        self._prestadas = set()    # conexiones entregadas y aún no devueltas
+        self._reservas = 0         # huecos reservados mientras se abre una conexión nueva
+        self._cerrado = False
+        self._stats = {
+            "checkouts": 0,    # conexiones entregadas
+            "esperas": 0,      # veces que hubo que esperar por una conexión libre
+            "creaciones": 0,   # conexiones nuevas abiertas contra la BD
+            "descartes": 0,    # conexiones cerradas (muertas, ociosas o descartadas)
+            "timeouts": 0,     # esperas que terminaron sin conexión
+        }
+
+    # ----------------------------------------------------------
+    # Utilidades internas (se llaman con el lock tomado)
+    # ----------------------------------------------------------
+    def _total(self) -> int:
+        return len(self._libres) + len(self._prestadas) + self._reservas
+
+    def _cerrar_inactivas(self) -> list:
+        """Saca del pool las conexiones libres que superaron el tiempo de inactividad."""
+        vencidas = []
+        limite = time.monotonic() - self.tiempo_inactividad
+        while self._libres and self._total() > self.min_conexiones and self._libres[0][1] < limite:
+            vencidas.append(self._libres.popleft()[0])
+        self._stats["descartes"] += len(vencidas)
+        return vencidas
+
+    @staticmethod
+    def _cerrar(conexion) -> None:
+        try:
+            conexion.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _esta_viva(conexion) -> bool:
+        try:
+            conexion.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    # ----------------------------------------------------------
+    # API pública
+    # ----------------------------------------------------------
+    def precalentar(self) -> None:
+        """Abre conexiones hasta llegar al mínimo configurado."""
+        while True:
+            with self._cond:
+                if self._cerrado or self._total() >= self.min_conexiones:
+                    return
+                self._reservas += 1
+            try:
+                conexion = self._fabrica()
+            except Exception:
+                with self._cond:
+                    self._reservas -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._reservas -= 1
+                self._stats["creaciones"] += 1
+                self._libres.append((conexion, time.monotonic()))
+                self._cond.notify()
+
+    def obtener(self):
+        """
+        Entrega una conexión lista para usar.
+        Reutiliza una libre (verificada con ping) o abre una nueva si hay cupo;
+        si el pool está lleno espera hasta `tiempo_espera` segundos.
+        """
+        limite = time.monotonic() + self.tiempo_espera
+        while True:
+            # Las vencidas de todas las vueltas de espera se cierran fuera del lock,
+            # también si se sale por TimeoutError o por pool cerrado.
+            vencidas = []
+            try:
+                with self._cond:
+                    espero = False
+                    while True:
+                        if self._cerrado:
+                            raise RuntimeError("El pool de conexiones está cerrado.")
+                        vencidas.extend(self._cerrar_inactivas())
+                        if self._libres:
+                            conexion = self._libres.pop()[0]
+                            self._prestadas.add(conexion)
+                            break
+                        if self._total() < self.max_conexiones:
+                            conexion = None
+                            self._reservas += 1
+                            break
+                        if not espero:
+                            self._stats["esperas"] += 1
+                            espero = True
+                        restante = limite - time.monotonic()
+                        if restante <= 0:
+                            self._stats["timeouts"] += 1
+                            raise TimeoutError(
+                                f"No hay conexiones libres en el pool (máximo {self.max_conexiones})."
+                            )
+                        self._cond.wait(restante)
+            finally:
+                for cx in vencidas:
+                    self._cerrar(cx)
+
+            if conexion is None:
+                return self._abrir_nueva()
+
+            # Conexión reutilizada: comprobamos que siga viva antes de entregarla
+            if self._esta_viva(conexion):
+                with self._cond:
+                    self._stats["checkouts"] += 1
+                return conexion
+            self.descartar(conexion)
+
+    def _abrir_nueva(self):
+        try:
+            conexion = self._fabrica()
+        except Exception:
+            with self._cond:
+                self._reservas -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._reservas -= 1
+            self._prestadas.add(conexion)
+            self._stats["creaciones"] += 1
+            self._stats["checkouts"] += 1
+        return conexion
+
+    def devolver(self, conexion) -> None:
+        """
+        Devuelve una conexión al pool.
+        Se hace rollback para cerrar cualquier transacción abierta (incluido
+        el snapshot de un SELECT) y no contaminar al siguiente usuario.
+        """
+        if conexion is None:
+            return
+        try:
+            conexion.rollback()
+            sana = bool(conexion.open)
+        except Exception:
+            sana = False
+
+        with self._cond:
+            if conexion not in self._prestadas:
+                return  # ya devuelta o ajena al pool
+            self._prestadas.discard(conexion)
+            if sana and not self._cerrado:
+                self._libres.append((conexion, time.monotonic()))
+                conexion = None
+            else:
+                self._stats["descartes"] += 1
+            self._cond.notify()
+        if conexion is not None:
+            self._cerrar(conexion)
+
+    def descartar(self, conexion) -> None:
+        """Cierra una conexión prestada sin devolverla al pool (p.ej. quedó en estado dudoso)."""
+        if conexion is None:
+            return
+        with self._cond:
+            if conexion in self._prestadas:
+                self._prestadas.discard(conexion)
+                self._stats["descartes"] += 1
+                self._cond.notify()
+        self._cerrar(conexion)
+
+    @contextmanager
+    def conexion(self):
+        """Context manager: `with pool.conexion() as cx:` devuelve la conexión al salir."""
+        cx = self.obtener()
+        try:
+            yield cx
+        finally:
+            self.devolver(cx)
+
+    def estadisticas(self) -> dict:
+        """Copia de los contadores del pool más su ocupación actual."""
+        with self._cond:
+            datos = dict(self._stats)
+            datos["libres"] = len(self._libres)
+            datos["en_uso"] = len(self._prestadas)
+            datos["abiertas"] = len(self._libres) + len(self._prestadas)
+            datos["min_conexiones"] = self.min_conexiones
+            datos["max_conexiones"] = self.max_conexiones
+        return datos
+
+    def cerrar(self) -> None:
+        """Cierra las conexiones libres; las prestadas se cierran al devolverse."""
+        with self._cond:
+            self._cerrado = True
+            libres = [cx for cx, _ in self._libres]
+            self._libres.clear()
+            self._stats["descartes"] += len(libres)
+            self._cond.notify_all()
+        for cx in libres:
+            self._cerrar(cx)
+
+
+class ConexionCompartida:
+    """
+    Envoltorio de la conexión de una UnidadDeTrabajo que se entrega a los DAO.
+    commit() y close() no hacen nada (confirma la unidad al terminar);
+    rollback() no deshace en el momento, marca la unidad para que se deshaga
+    entera al salir. Todo lo demás (cursor, ping, ...) va a la conexión real.
+    """
+
+    __slots__ = ("_real", "_al_fallar")
+
+    def __init__(self, real, al_fallar) -> None:
+        self._real = real
+        self._al_fallar = al_fallar
+
+    def __getattr__(self, nombre):
+        return getattr(self._real, nombre)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        self._al_fallar()
+
+    def close(self) -> None:
+        pass
+
+
 class Conexion:
     """
     Administra la conexión a la BD usando credenciales del .env.
     Entrega cursor tipo diccionario (DictCursor).
+    Todas las instancias comparten un único PoolConexiones (se crea en el primer uso).
     """
 
+    _pool = None
+    _pool_lock = threading.Lock()
+
     def __init__(self):
         self.host       = config.DB_HOST
         self.user       = config.DB_USER
@@ -21,7 +292,7 @@ class Conexion:
         self.base_datos = config.DB_NAME
         self.port       = config.DB_PORT
 
-    def obtener_conexion(self):
+    def _crear_conexion(self):
         try:
             conexion = pymysql.Connect(
                 host        = self.host,
@@ -37,9 +308,109 @@ class Conexion:
             print(f"ERROR AL CONECTAR A LA BD: {e}")
             raise
 
+    def _obtener_pool(self) -> PoolConexiones:
+        if Conexion._pool is None:
+            with Conexion._pool_lock:
+                if Conexion._pool is None:
+                    pool = PoolConexiones(
+                        self._crear_conexion,
+                        min_conexiones     = config.DB_POOL_MIN,
+                        max_conexiones     = config.DB_POOL_MAX,
+                        tiempo_inactividad = config.DB_POOL_IDLE_TIMEOUT,
+                        tiempo_espera      = config.DB_POOL_CHECKOUT_TIMEOUT,
+                    )
+                    Conexion._pool = pool
+                    pool.precalentar()
+        return Conexion._pool
+
+    def obtener_conexion(self, uow=None):
+        """
+        Pide una conexión al pool (la crea si hace falta).
+        Con `uow` (UnidadDeTrabajo abierta) entrega la conexión compartida de la unidad.
+        """
+        if uow is not None:
+            if not uow.activa:
+                raise RuntimeError("La unidad de trabajo no está abierta: usar dentro de "
+                                   "'with UnidadDeTrabajo() as uow'.")
+            return uow.conexion
+        return self._obtener_pool().obtener()
+
     def cerrar_conexion(self, conexion):
+        """Devuelve la conexión al pool (no la cierra físicamente). Ignora las de una UnidadDeTrabajo."""
+        if isinstance(conexion, ConexionCompartida):
+            return
+        try:
+            if conexion:
+                self._obtener_pool().devolver(conexion)
+        except Exception:
+            pass
+
+    def descartar_conexion(self, conexion):
+        """Cierra la conexión y la saca del pool (p.ej. un cursor de servidor a medio leer)."""
+        if isinstance(conexion, ConexionCompartida):
+            return
         try:
             if conexion:
-                conexion.close()
+                self._obtener_pool().descartar(conexion)
         except Exception:
             pass
+
+    @contextmanager
+    def usar_conexion(self):
+        """
+        Context manager para usar una conexión del pool:
+            with con.usar_conexion() as cx:
+                with cx.cursor() as cur: ...
+        """
+        cx = self.obtener_conexion()
+        try:
+            yield cx
+        finally:
+            self.cerrar_conexion(cx)
+
+    def iterar_en_bloques(self, sql: str, params=None, tamano_bloque: int = 500, tuplas: bool = False):
+        """
+        Ejecuta un SELECT con cursor de servidor (SSDictCursor) y entrega las filas
+        en listas de hasta `tamano_bloque` elementos. El resultado no se materializa
+        completo en memoria, así que sirve para tablas de cualquier tamaño.
+        Con tuplas=True usa SSCursor: filas como tuplas, sin armar un dict por fila
+        (útil cuando el consumidor vuelca columnas numéricas a arreglos).
+        Si el consumidor abandona el generador a medias, la conexión se descarta:
+        un cursor de servidor sin leer hasta el final no se puede reutilizar.
+        """
+        if tamano_bloque < 1:
+            raise ValueError("tamano_bloque debe ser al menos 1.")
+        cx = self.obtener_conexion()
+        completo = False
+        try:
+            cur = cx.cursor(pymysql.cursors.SSCursor if tuplas else pymysql.cursors.SSDictCursor)
+            cur.execute(sql, params)
+            while True:
+                filas = cur.fetchmany(tamano_bloque)
+                if not filas:
+                    break
+                yield filas
+            cur.close()
+            completo = True
+        finally:
+            if completo:
+                self.cerrar_conexion(cx)
+            else:
+                self.descartar_conexion(cx)
+
+    @classmethod
+    def estadisticas_pool(cls) -> dict:
+        """Contadores del pool compartido (checkouts, esperas, creaciones, ...)."""
+        if cls._pool is None:
+            return {"checkouts": 0, "esperas": 0, "creaciones": 0, "descartes": 0,
+                    "timeouts": 0, "libres": 0, "en_uso": 0, "abiertas": 0,
+                    "min_conexiones": config.DB_POOL_MIN, "max_conexiones": config.DB_POOL_MAX}
+        return cls._pool.estadisticas()
+
+    @classmethod
+    def cerrar_pool(cls) -> None:
+        """Cierra el pool compartido; el próximo uso crea uno nuevo."""
+        with cls._pool_lock:
+            pool, cls._pool = cls._pool, None
+        if pool is not None:
+            pool.cerrar()
@@ -8,21 +8,33 @@
 # - Devuelve filas como diccionarios (gracias a DictCursor en Conexion).
 # ==============================================================
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator
+from persistencia import empleadoDAO
 from persistencia.conexion import Conexion
+from persistencia.hidratador import Hidratador, enum_o_texto
+from persistencia.paginacion import clausula_keyset
+from persistencia.texto_completo import consulta_booleana, patron_prefijo
+from persistencia.unidad_trabajo import UnidadDeTrabajo
 from dominio.departamento import Departamento
 
 # Instancia reutilizable para obtener/cerrar conexiones
 con = Conexion()
 
+# Filas de `departamento` -> objetos Departamento (tipo como Enum)
+HIDRATADOR = Hidratador(
+    Departamento,
+    {"id_departamento": "id_departamento", "nombre": "nombre", "tipo_departamento": "tipo_departamento"},
+    conversores={"tipo_departamento": enum_o_texto(Departamento.TipoDepartamento)},
+)
+
 class DepartamentoDAO:
     """DAO para la tabla 'departamento'."""
 
     # ============================= C (CREATE) =============================
     @staticmethod
-    def guardar_departamento(departamento: Departamento) -> None:
+    def guardar_departamento(departamento: Departamento, uow: Optional[UnidadDeTrabajo] = None) -> int:
         """
-        Inserta un nuevo departamento en la BD.
+        Inserta un nuevo departamento en la BD y retorna su ID.
         Recibe un objeto de dominio `Departamento` y toma:
           - nombre (str)
           - tipo_departamento (Enum) -> se guarda su .value (texto)
@@ -36,12 +48,14 @@ class DepartamentoDAO:
             departamento.obtener_tipo_departamento().value  # guardamos el texto del Enum
         )
 
-        cx = con.obtener_conexion()
+        cx = con.obtener_conexion(uow)
         try:
             with cx.cursor() as cur:
                 cur.execute(sql, valores)
+                nuevo_id = cur.lastrowid
                 cx.commit()   # confirmamos la transacción
                 print("SE HA INSERTADO CORRECTAMENTE")
+                return nuevo_id
         except Exception as e:
             cx.rollback()    # deshacemos cambios si algo falla
             print(f"Error al insertar departamento: {e}")
@@ -49,9 +63,44 @@ class DepartamentoDAO:
         finally:
             con.cerrar_conexion(cx)
 
+    # ======================= C (CREATE por lotes) ========================
+    @staticmethod
+    def guardar_departamentos_lote(departamentos: List[Departamento],
+                                   uow: Optional[UnidadDeTrabajo] = None) -> int:
+        """
+        Inserta varios departamentos en una sola transacción.
+        executemany se traduce en un INSERT multi-fila (VALUES (...), (...)).
+        Retorna la cantidad de filas insertadas; si algo falla, rollback del lote completo.
+        """
+        if not departamentos:
+            return 0
+        sql = """
+            INSERT INTO departamento (nombre, tipo_departamento)
+            VALUES (%s, %s)
+        """
+        valores = [
+            (d.obtener_nombre(), d.obtener_tipo_departamento().value)
+            for d in departamentos
+        ]
+
+        cx = con.obtener_conexion(uow)
+        try:
+            with cx.cursor() as cur:
+                cur.executemany(sql, valores)
+                insertados = cur.rowcount
+            cx.commit()
+            return insertados
+        except Exception as e:
+            cx.rollback()
+            print(f"Error al insertar lote de departamentos: {e}")
+            raise
+        finally:
+            con.cerrar_conexion(cx)
+
     # ===================== R (READ: obtener por ID) ======================
     @staticmethod
-    def obtener_departamento_por_id(id_departamento: int) -> Optional[Dict]:
+    def obtener_departamento_por_id(id_departamento: int,
+                                    uow: Optional[UnidadDeTrabajo] = None) -> Optional[Dict]:
         """
         Obtiene un departamento por su ID.
         Retorna:
@@ -63,7 +112,7 @@ class DepartamentoDAO:
             FROM departamento
             WHERE id_departamento = %s
         """
-        cx = con.obtener_conexion()
+        cx = con.obtener_conexion(uow)
         try:
             with cx.cursor() as cur:
                 cur.execute(sql, (id_departamento,))
@@ -73,27 +122,98 @@ class DepartamentoDAO:
 
     # ===================== R (READ: listar todos) ========================
     @staticmethod
-    def listar_departamentos() -> List[Dict]:
+    def listar_departamentos(after_nombre: Optional[str] = None, after_id: Optional[int] = None,
+                             limit: Optional[int] = None,
+                             uow: Optional[UnidadDeTrabajo] = None) -> List[Dict]:
         """
-        Lista todos los departamentos, ordenados por nombre.
+        Lista departamentos ordenados por (nombre, id_departamento).
         Retorna una lista de dicts.
+        Sin argumentos devuelve todos. Con `limit` devuelve una página por keyset:
+        after_nombre/after_id son el nombre e id de la última fila de la página anterior.
         """
-        sql = """
+        where_sql, limit_sql, params = clausula_keyset(
+            "nombre", "id_departamento", after_nombre, after_id, limit
+        )
+        sql = f"""
             SELECT id_departamento, nombre, tipo_departamento
             FROM departamento
-            ORDER BY nombre
+            {where_sql}
+            ORDER BY nombre, id_departamento
+            {limit_sql}
         """
-        cx = con.obtener_conexion()
+        cx = con.obtener_conexion(uow)
         try:
             with cx.cursor() as cur:
-                cur.execute(sql)
+                cur.execute(sql, params)
                 return cur.fetchall()  # lista de dicts
         finally:
             con.cerrar_conexion(cx)
 
+    # ============ R (READ: listar con dotación y salarios) ===============
+    @staticmethod
+    def listar_departamentos_con_resumen(after_nombre: Optional[str] = None, after_id: Optional[int] = None,
+                                         limit: Optional[int] = None,
+                                         uow: Optional[UnidadDeTrabajo] = None) -> List[Dict]:
+        """
+        Como listar_departamentos(), pero cada dict trae además:
+          - empleados      : cantidad de empleados del departamento
+          - total_salarios : suma de sus salarios (0 si no tiene empleados)
+        Todo en UNA consulta: primero se elige la página de departamentos y
+        luego se agregan solo sus empleados con el índice (id_departamento, salario),
+        en vez de una consulta por departamento.
+        """
+        where_sql, limit_sql, params = clausula_keyset(
+            "nombre", "id_departamento", after_nombre, after_id, limit
+        )
+        sql = f"""
+            SELECT d.id_departamento, d.nombre, d.tipo_departamento,
+                   COUNT(e.id_empleado) AS empleados,
+                   COALESCE(SUM(e.salario), 0) AS total_salarios
+            FROM (
+                SELECT id_departamento, nombre, tipo_departamento
+                FROM departamento
+                {where_sql}
+                ORDER BY nombre, id_departamento
+                {limit_sql}
+            ) d
+            LEFT JOIN empleado e ON e.id_departamento = d.id_departamento
+            GROUP BY d.id_departamento, d.nombre, d.tipo_departamento
+            ORDER BY d.nombre, d.id_departamento
+        """
+        cx = con.obtener_conexion(uow)
+        try:
+            with cx.cursor() as cur:
+                cur.execute(sql, params)
+                return [dict(f, empleados=int(f["empleados"]), total_salarios=float(f["total_salarios"]))
+                        for f in cur.fetchall()]
+        finally:
+            con.cerrar_conexion(cx)
+
+    # ================ R (READ: recorrer en bloques) ======================
+    @staticmethod
+    def iter_departamentos(tamano_bloque: int = 500) -> Iterator[List[Dict]]:
+        """
+        Variante en streaming de listar_departamentos().
+        Usa un cursor de servidor (SSDictCursor) y entrega listas de hasta
+        `tamano_bloque` dicts, sin cargar la tabla completa en memoria.
+        """
+        sql = """
+            SELECT id_departamento, nombre, tipo_departamento
+            FROM departamento
+            ORDER BY nombre
+        """
+        yield from con.iterar_en_bloques(sql, tamano_bloque=tamano_bloque)
+
+    @staticmethod
+    def iter_departamentos_objetos(tamano_bloque: int = 500) -> Iterator[List[Departamento]]:
+        """Como iter_departamentos(), pero en bloques de objetos Departamento (filas-tupla hidratadas)."""
+        sql = f"SELECT {HIDRATADOR.columnas_sql()} FROM departamento ORDER BY nombre"
+        for bloque in con.iterar_en_bloques(sql, tamano_bloque=tamano_bloque, tuplas=True):
+            yield HIDRATADOR.muchos(bloque, tuplas=True)
+
     # ================= R (READ: buscar por nombre LIKE) ==================
     @staticmethod
-    def buscar_departamentos_por_nombre(nombre: str) -> List[Dict]:
+    def buscar_departamentos_por_nombre(nombre: str, uow: Optional[UnidadDeTrabajo] = None) -> List[Dict]:
         """
         Busca departamentos cuyo nombre contenga el texto dado (LIKE %texto%).
         Comparación case-insensitive usando UPPER().
@@ -105,7 +225,7 @@ class DepartamentoDAO:
             ORDER BY nombre
         """
         patron = f"%{(nombre or '').strip()}%"  # normalizamos entrada
-        cx = con.obtener_conexion()
+        cx = con.obtener_conexion(uow)
         try:
             with cx.cursor() as cur:
                 cur.execute(sql, (patron,))
@@ -113,9 +233,60 @@ class DepartamentoDAO:
         finally:
             con.cerrar_conexion(cx)
 
+    # ================= R (READ: buscar por prefijo, con índice) ==================
+    @staticmethod
+    def buscar_departamentos_por_prefijo(texto: str, limit: int = 50,
+                                         uow: Optional[UnidadDeTrabajo] = None) -> List[Dict]:
+        """
+        Departamentos cuyo nombre empieza por `texto` (LIKE 'texto%'), como mucho `limit`.
+        Sin UPPER() sobre la columna para que pueda usar ix_departamento_nombre
+        (la collation de la tabla ya compara sin distinguir mayúsculas).
+        """
+        sql = """
+            SELECT id_departamento, nombre, tipo_departamento
+            FROM departamento
+            WHERE nombre LIKE %s
+            ORDER BY nombre, id_departamento
+            LIMIT %s
+        """
+        cx = con.obtener_conexion(uow)
+        try:
+            with cx.cursor() as cur:
+                cur.execute(sql, (patron_prefijo(texto), int(limit)))
+                return cur.fetchall()
+        finally:
+            con.cerrar_conexion(cx)
+
+    # ================= R (READ: búsqueda FULLTEXT) ==================
+    @staticmethod
+    def buscar_departamentos_texto(texto: str, limit: int = 50,
+                                   uow: Optional[UnidadDeTrabajo] = None) -> Optional[List[Dict]]:
+        """
+        Busca departamentos con el índice FULLTEXT sobre nombre, por relevancia.
+        Retorna None si el texto no tiene términos indexables (muy cortos).
+        """
+        consulta = consulta_booleana(texto)
+        if consulta is None:
+            return None
+        sql = """
+            SELECT id_departamento, nombre, tipo_departamento,
+                   MATCH(nombre) AGAINST (%s IN BOOLEAN MODE) AS relevancia
+            FROM departamento
+            WHERE MATCH(nombre) AGAINST (%s IN BOOLEAN MODE)
+            ORDER BY relevancia DESC, nombre, id_departamento
+            LIMIT %s
+        """
+        cx = con.obtener_conexion(uow)
+        try:
+            with cx.cursor() as cur:
+                cur.execute(sql, (consulta, consulta, int(limit)))
+                return [dict(f, relevancia=float(f["relevancia"])) for f in cur.fetchall()]
+        finally:
+            con.cerrar_conexion(cx)
+
     # ============================= U (UPDATE) ============================
     @staticmethod
-    def actualizar_departamento(departamento: Departamento) -> None:
+    def actualizar_departamento(departamento: Departamento, uow: Optional[UnidadDeTrabajo] = None) -> None:
         """
         Actualiza nombre y tipo_departamento de un registro existente.
         Recibe un objeto `Departamento` con:
@@ -134,7 +305,7 @@ class DepartamentoDAO:
             departamento.obtener_id_departamento()
         )
 
-        cx = con.obtener_conexion()
+        cx = con.obtener_conexion(uow)
         try:
             with cx.cursor() as cur:
                 cur.execute(sql, valores)
@@ -149,17 +320,23 @@ class DepartamentoDAO:
 
     # ============================= D (DELETE) ============================
     @staticmethod
-    def eliminar_departamento(id_departamento: int) -> None:
+    def eliminar_departamento(id_departamento: int, uow: Optional[UnidadDeTrabajo] = None) -> None:
         """
         Elimina físicamente un departamento por su ID.
+        Sus empleados quedan sin departamento (misma transacción).
         Nota: eliminación física borra el registro definitivamente.
               Si necesitas auditoría/histórico, considera eliminación lógica.
         """
         sql = "DELETE FROM departamento WHERE id_departamento = %s"
 
-        cx = con.obtener_conexion()
+        cx = con.obtener_conexion(uow)
         try:
             with cx.cursor() as cur:
+                # Mismo orden de bloqueo que empleadoDAO.asignar_departamento
+                # (departamento y después empleados): sin bloqueos cruzados
+                cur.execute("SELECT id_departamento FROM departamento WHERE id_departamento = %s FOR UPDATE",
+                            (id_departamento,))
+                empleadoDAO.quitar_departamento(cur, id_departamento)
                 cur.execute(sql, (id_departamento,))
             cx.commit()
             print(f"SE HA ELIMINADO EL DEPARTAMENTO CON EL ID: {id_departamento}")
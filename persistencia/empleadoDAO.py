@@ -1,7 +1,12 @@
 # persistencia/empleadoDAO.py
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator
 from datetime import datetime, date
 from persistencia.conexion import Conexion
+from persistencia.hidratador import Hidratador, enum_o_texto
+from persistencia.paginacion import clausula_keyset
+from persistencia.proyectoEmpleadoDAO import ProyectoEmpleadoDAO
+from persistencia.texto_completo import consulta_booleana, patron_prefijo
+from persistencia.unidad_trabajo import UnidadDeTrabajo
 from dominio.empleado import Empleado
 
 # ----------------- Helpers -----------------
@@ -12,36 +17,76 @@ def _to_datetime(value):
         return datetime.combine(value, datetime.min.time())
     return value  # podría venir None o str (según driver)
 
+def _fila_a_dict(r: Dict) -> Dict:
+    """Convierte una fila de la tabla empleado al dict que usan las capas superiores."""
+    return {
+        "id_empleado": r["id_empleado"],
+        "nombre": r["nombre"],
+        "direccion": r["direccion"],
+        "correo": r["correo_electronico"],
+        "telefono": r["numero_telefono"],
+        "tipoempleado": r["tipo_empleado"],
+        "fecha_inicio_contrato": _to_datetime(r["fecha_inicio_contrato"]),
+        "salario": float(r["salario"]),
+        "usuario": r["usuario"],
+    }
+
+# Filas de la tabla empleado -> objetos Empleado. El teléfono queda como
+# texto (VARCHAR): convertirlo a int perdería ceros a la izquierda o el "+".
+HIDRATADOR = Hidratador(
+    Empleado,
+    {
+        "id_empleado": "id_empleado",
+        "nombre": "nombre",
+        "direccion": "direccion",
+        "numero_telefono": "numero_telefono",
+        "correo_electronico": "correo_electronico",
+        "fecha_inicio_contrato": "fecha_inicio_contrato",
+        "salario": "salario",
+        "usuario": "usuario",
+        "tipo_empleado": "tipo_empleado",
+    },
+    conversores={
+        "fecha_inicio_contrato": _to_datetime,
+        "salario": float,
+        "tipo_empleado": enum_o_texto(Empleado.TipoEmpleado),
+    },
+)
+
 # ----------------- C (Create) -----------------
-def insert_empleado(emp: Empleado) -> int:
-    """
-    Inserta un empleado y devuelve el ID generado.
-    """
-    sql = """
-        INSERT INTO empleado
-        (nombre, direccion, numero_telefono, correo_electronico,
-         fecha_inicio_contrato, salario, usuario, tipo_empleado)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-    """
+_SQL_INSERT = """
+    INSERT INTO empleado
+    (nombre, direccion, numero_telefono, correo_electronico,
+     fecha_inicio_contrato, salario, usuario, tipo_empleado)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+def _valores_insert(emp: Empleado) -> tuple:
+    """Arma la tupla de valores del INSERT a partir del objeto de dominio."""
     tel_txt = str(emp.numero_telefono) if emp.numero_telefono is not None else None
     fic = emp.fecha_inicio_contrato
     if isinstance(fic, date) and not isinstance(fic, datetime):
         fic = datetime.combine(fic, datetime.min.time())
     tipo_txt = emp.tipo_empleado.value if hasattr(emp.tipo_empleado, "value") else str(emp.tipo_empleado)
+    return (
+        emp.nombre.strip(),
+        emp.direccion.strip(),
+        tel_txt,
+        emp.correo_electronico.strip(),
+        fic,
+        float(emp.salario),
+        emp.usuario.strip(),
+        tipo_txt
+    )
 
-    con = Conexion().obtener_conexion()
+def insert_empleado(emp: Empleado, uow: Optional[UnidadDeTrabajo] = None) -> int:
+    """
+    Inserta un empleado y devuelve el ID generado.
+    """
+    con = Conexion().obtener_conexion(uow)
     try:
         with con.cursor() as cur:
-            cur.execute(sql, (
-                emp.nombre.strip(),
-                emp.direccion.strip(),
-                tel_txt,
-                emp.correo_electronico.strip(),
-                fic,
-                float(emp.salario),
-                emp.usuario.strip(),
-                tipo_txt
-            ))
+            cur.execute(_SQL_INSERT, _valores_insert(emp))
             new_id = cur.lastrowid
         con.commit()
         return new_id
@@ -51,65 +96,143 @@ def insert_empleado(emp: Empleado) -> int:
     finally:
         Conexion().cerrar_conexion(con)
 
+def insert_empleados_lote(empleados: List[Empleado], uow: Optional[UnidadDeTrabajo] = None) -> int:
+    """
+    Inserta varios empleados en UNA transacción y con una sola conexión.
+    Usa executemany, que PyMySQL reescribe como INSERT multi-fila
+    (VALUES (...), (...), ...), partiéndolo solo si supera el tamaño máximo de sentencia.
+    Devuelve la cantidad de filas insertadas. Si falla, se hace rollback del lote completo.
+    """
+    if not empleados:
+        return 0
+    valores = [_valores_insert(emp) for emp in empleados]
+    con = Conexion().obtener_conexion(uow)
+    try:
+        with con.cursor() as cur:
+            cur.executemany(_SQL_INSERT, valores)
+            affected = cur.rowcount
+        con.commit()
+        return affected
+    except Exception:
+        con.rollback()
+        raise
+    finally:
+        Conexion().cerrar_conexion(con)
+
 # ----------------- R (Read) -----------------
-def buscar_empleado_detalle_por_id(id_empleado: int) -> Optional[Dict]:
+def buscar_empleado_detalle_por_id(id_empleado: int, uow: Optional[UnidadDeTrabajo] = None) -> Optional[Dict]:
     sql = """
     SELECT id_empleado, nombre, direccion, numero_telefono, correo_electronico,
            fecha_inicio_contrato, salario, usuario, tipo_empleado
     FROM empleado
     WHERE id_empleado=%s
     """
-    con = Conexion().obtener_conexion()
+    con = Conexion().obtener_conexion(uow)
     try:
         with con.cursor() as cur:
             cur.execute(sql, (id_empleado,))
             r = cur.fetchone()
             if not r:
                 return None
-            return {
-                "id_empleado": r["id_empleado"],
-                "nombre": r["nombre"],
-                "direccion": r["direccion"],
-                "correo": r["correo_electronico"],
-                "telefono": r["numero_telefono"],
-                "tipoempleado": r["tipo_empleado"],
-                "fecha_inicio_contrato": _to_datetime(r["fecha_inicio_contrato"]),
-                "salario": float(r["salario"]),
-                "usuario": r["usuario"],
-            }
+            return _fila_a_dict(r)
+    finally:
+        Conexion().cerrar_conexion(con)
+
+def listar_empleados(after_nombre: Optional[str] = None, after_id: Optional[int] = None,
+                     limit: Optional[int] = None, uow: Optional[UnidadDeTrabajo] = None) -> List[Dict]:
+    """
+    Lista empleados ordenados por (nombre, id_empleado).
+    Sin argumentos devuelve todos. Con `limit` devuelve una página usando
+    paginación por keyset: pasa el nombre e id de la última fila de la página
+    anterior en after_nombre/after_id para obtener la siguiente.
+    """
+    where_sql, limit_sql, params = clausula_keyset("nombre", "id_empleado", after_nombre, after_id, limit)
+    sql = f"""
+    SELECT id_empleado, nombre, direccion, numero_telefono, correo_electronico,
+           fecha_inicio_contrato, salario, usuario, tipo_empleado
+    FROM empleado
+    {where_sql}
+    ORDER BY nombre, id_empleado
+    {limit_sql}
+    """
+    con = Conexion().obtener_conexion(uow)
+    try:
+        with con.cursor() as cur:
+            cur.execute(sql, params)
+            return [_fila_a_dict(r) for r in cur.fetchall()]
     finally:
         Conexion().cerrar_conexion(con)
 
-def listar_empleados() -> List[Dict]:
+def iter_empleados(tamano_bloque: int = 500) -> Iterator[List[Dict]]:
+    """
+    Variante en streaming de listar_empleados().
+    Usa un cursor de servidor y entrega bloques de hasta `tamano_bloque` empleados,
+    así la memoria se mantiene plana aunque la tabla tenga cientos de miles de filas.
+    """
     sql = """
     SELECT id_empleado, nombre, direccion, numero_telefono, correo_electronico,
            fecha_inicio_contrato, salario, usuario, tipo_empleado
     FROM empleado
     ORDER BY nombre
     """
-    con = Conexion().obtener_conexion()
+    for bloque in Conexion().iterar_en_bloques(sql, tamano_bloque=tamano_bloque):
+        yield [_fila_a_dict(r) for r in bloque]
+
+def obtener_empleado(id_empleado: int, uow: Optional[UnidadDeTrabajo] = None) -> Optional[Empleado]:
+    """Como buscar_empleado_detalle_por_id, pero retorna el objeto de dominio."""
+    sql = f"SELECT {HIDRATADOR.columnas_sql()} FROM empleado WHERE id_empleado=%s"
+    con = Conexion().obtener_conexion(uow)
+    try:
+        with con.cursor() as cur:
+            cur.execute(sql, (id_empleado,))
+            r = cur.fetchone()
+            return HIDRATADOR.desde_dict(r) if r else None
+    finally:
+        Conexion().cerrar_conexion(con)
+
+def iter_empleados_objetos(tamano_bloque: int = 500) -> Iterator[List[Empleado]]:
+    """
+    Como iter_empleados(), pero en bloques de objetos Empleado.
+    Lee tuplas (SSCursor) y las hidrata directo, sin dicts intermedios.
+    """
+    sql = f"SELECT {HIDRATADOR.columnas_sql()} FROM empleado ORDER BY nombre"
+    for bloque in Conexion().iterar_en_bloques(sql, tamano_bloque=tamano_bloque, tuplas=True):
+        yield HIDRATADOR.muchos(bloque, tuplas=True)
+
+def iter_columnas_analitica(tamano_bloque: int = 10000) -> Iterator[List[tuple]]:
+    """
+    Bloques de tuplas (id_empleado, salario, dias_desde_1970, tipo_empleado) para
+    armar columnas en memoria (aplicacion.analitica_empleados). La fecha de inicio
+    de contrato ya viene como días desde 1970-01-01 (None si no tiene).
+    """
+    sql = """
+    SELECT id_empleado, salario,
+           DATEDIFF(fecha_inicio_contrato, '1970-01-01') AS dias_inicio,
+           tipo_empleado
+    FROM empleado
+    ORDER BY id_empleado
+    """
+    yield from Conexion().iterar_en_bloques(sql, tamano_bloque=tamano_bloque, tuplas=True)
+
+def listar_empleados_de_departamento(id_departamento: int,
+                                     uow: Optional[UnidadDeTrabajo] = None) -> List[Dict]:
+    """Empleados de un departamento, ordenados por nombre (índice id_departamento)."""
+    sql = """
+    SELECT id_empleado, nombre, direccion, numero_telefono, correo_electronico,
+           fecha_inicio_contrato, salario, usuario, tipo_empleado
+    FROM empleado
+    WHERE id_departamento=%s
+    ORDER BY nombre, id_empleado
+    """
+    con = Conexion().obtener_conexion(uow)
     try:
         with con.cursor() as cur:
-            cur.execute(sql)
-            rows = cur.fetchall()
-            out: List[Dict] = []
-            for r in rows:
-                out.append({
-                    "id_empleado": r["id_empleado"],
-                    "nombre": r["nombre"],
-                    "direccion": r["direccion"],
-                    "correo": r["correo_electronico"],
-                    "telefono": r["numero_telefono"],
-                    "tipoempleado": r["tipo_empleado"],
-                    "fecha_inicio_contrato": _to_datetime(r["fecha_inicio_contrato"]),
-                    "salario": float(r["salario"]),
-                    "usuario": r["usuario"],
-                })
-            return out
+            cur.execute(sql, (int(id_departamento),))
+            return [_fila_a_dict(r) for r in cur.fetchall()]
     finally:
         Conexion().cerrar_conexion(con)
 
-def buscar_empleados_por_nombre(texto: str) -> List[Dict]:
+def buscar_empleados_por_nombre(texto: str, uow: Optional[UnidadDeTrabajo] = None) -> List[Dict]:
     sql = """
     SELECT id_empleado, nombre, direccion, numero_telefono, correo_electronico,
            fecha_inicio_contrato, salario, usuario, tipo_empleado
@@ -117,32 +240,69 @@ def buscar_empleados_por_nombre(texto: str) -> List[Dict]:
     WHERE nombre LIKE %s
     ORDER BY nombre
     """
-    con = Conexion().obtener_conexion()
+    con = Conexion().obtener_conexion(uow)
     try:
         with con.cursor() as cur:
             cur.execute(sql, (f"%{texto.strip()}%",))
-            rows = cur.fetchall()
-            out: List[Dict] = []
-            for r in rows:
-                out.append({
-                    "id_empleado": r["id_empleado"],
-                    "nombre": r["nombre"],
-                    "direccion": r["direccion"],
-                    "correo": r["correo_electronico"],
-                    "telefono": r["numero_telefono"],
-                    "tipoempleado": r["tipo_empleado"],
-                    "fecha_inicio_contrato": _to_datetime(r["fecha_inicio_contrato"]),
-                    "salario": float(r["salario"]),
-                    "usuario": r["usuario"],
-                })
-            return out
+            return [_fila_a_dict(r) for r in cur.fetchall()]
+    finally:
+        Conexion().cerrar_conexion(con)
+
+def buscar_empleados_por_prefijo(texto: str, limit: int = 50,
+                                uow: Optional[UnidadDeTrabajo] = None) -> List[Dict]:
+    """
+    Empleados cuyo nombre empieza por `texto` (LIKE 'texto%'), como mucho `limit`.
+    Usa el índice ix_empleado_nombre (rango), no recorre la tabla.
+    """
+    sql = """
+    SELECT id_empleado, nombre, direccion, numero_telefono, correo_electronico,
+           fecha_inicio_contrato, salario, usuario, tipo_empleado
+    FROM empleado
+    WHERE nombre LIKE %s
+    ORDER BY nombre, id_empleado
+    LIMIT %s
+    """
+    con = Conexion().obtener_conexion(uow)
+    try:
+        with con.cursor() as cur:
+            cur.execute(sql, (patron_prefijo(texto), int(limit)))
+            return [_fila_a_dict(r) for r in cur.fetchall()]
+    finally:
+        Conexion().cerrar_conexion(con)
+
+def buscar_empleados_texto(texto: str, limit: int = 50,
+                           uow: Optional[UnidadDeTrabajo] = None) -> Optional[List[Dict]]:
+    """
+    Búsqueda por texto con el índice FULLTEXT (nombre, correo, usuario),
+    ordenada por relevancia (clave extra "relevancia" en cada dict).
+    Retorna None si el texto no tiene términos indexables (muy cortos);
+    si la BD no tiene el índice se propaga el error de MySQL.
+    """
+    consulta = consulta_booleana(texto)
+    if consulta is None:
+        return None
+    sql = """
+    SELECT id_empleado, nombre, direccion, numero_telefono, correo_electronico,
+           fecha_inicio_contrato, salario, usuario, tipo_empleado,
+           MATCH(nombre, correo_electronico, usuario) AGAINST (%s IN BOOLEAN MODE) AS relevancia
+    FROM empleado
+    WHERE MATCH(nombre, correo_electronico, usuario) AGAINST (%s IN BOOLEAN MODE)
+    ORDER BY relevancia DESC, nombre, id_empleado
+    LIMIT %s
+    """
+    con = Conexion().obtener_conexion(uow)
+    try:
+        with con.cursor() as cur:
+            cur.execute(sql, (consulta, consulta, int(limit)))
+            return [dict(_fila_a_dict(r), relevancia=float(r["relevancia"])) for r in cur.fetchall()]
     finally:
         Conexion().cerrar_conexion(con)
 
 # ----------------- U (Update) -----------------
 def editar_empleado_por_id(id_empleado: int, nombre: str, direccion: str,
                            telefono: str, correo: str, fecha_inicio: str | datetime,
-                           salario: int | float, usuario: str, tipo_empleado: str) -> int:
+                           salario: int | float, usuario: str, tipo_empleado: str,
+                           uow: Optional[UnidadDeTrabajo] = None) -> int:
     """
     Devuelve cantidad de filas afectadas.
     fecha_inicio: str 'YYYY-MM-DD HH:MM:SS' / 'YYYY-MM-DD' o datetime.
@@ -166,7 +326,7 @@ def editar_empleado_por_id(id_empleado: int, nombre: str, direccion: str,
         fecha_inicio_contrato=%s, salario=%s, usuario=%s, tipo_empleado=%s
     WHERE id_empleado=%s
     """
-    con = Conexion().obtener_conexion()
+    con = Conexion().obtener_conexion(uow)
     try:
         with con.cursor() as cur:
             cur.execute(sql, (
@@ -189,15 +349,68 @@ def editar_empleado_por_id(id_empleado: int, nombre: str, direccion: str,
     finally:
         Conexion().cerrar_conexion(con)
 
+def asignar_departamento(ids_empleados: List[int], id_departamento: Optional[int],
+                         uow: Optional[UnidadDeTrabajo] = None) -> int:
+    """
+    Mueve varios empleados al departamento indicado (None = sin departamento)
+    en UNA transacción. Devuelve la cantidad de filas que cambiaron.
+    No hay FK sobre empleado.id_departamento: el departamento se comprueba y se
+    bloquea (FOR UPDATE) en esta misma transacción, así un eliminar_departamento
+    concurrente espera al commit (y luego deja sin departamento a estos empleados)
+    o ya lo borró y acá se rechaza. Lanza ValueError, sin mover a nadie, si el
+    departamento o alguno de los empleados no existe.
+    """
+    ids = list(dict.fromkeys(int(i) for i in ids_empleados))
+    if not ids:
+        return 0
+    depto = int(id_departamento) if id_departamento is not None else None
+    con = Conexion().obtener_conexion(uow)
+    try:
+        affected = 0
+        with con.cursor() as cur:
+            if depto is not None:
+                cur.execute("SELECT id_departamento FROM departamento WHERE id_departamento=%s FOR UPDATE",
+                            (depto,))
+                if cur.fetchone() is None:
+                    raise ValueError(f"No existe el departamento con ID {depto}.")
+            existentes = set()
+            for i in range(0, len(ids), 1000):
+                tramo = ids[i:i + 1000]
+                marcas = ", ".join(["%s"] * len(tramo))
+                cur.execute(f"SELECT id_empleado FROM empleado WHERE id_empleado IN ({marcas}) FOR UPDATE",
+                            tramo)
+                existentes.update(f["id_empleado"] for f in cur.fetchall())
+            faltan = [i for i in ids if i not in existentes]
+            if faltan:
+                raise ValueError(f"No existen los empleados con ID: {', '.join(map(str, faltan))}.")
+            for i in range(0, len(ids), 1000):
+                tramo = ids[i:i + 1000]
+                marcas = ", ".join(["%s"] * len(tramo))
+                cur.execute(f"UPDATE empleado SET id_departamento=%s WHERE id_empleado IN ({marcas})",
+                            (depto, *tramo))
+                affected += cur.rowcount
+        con.commit()
+        return affected
+    except Exception:
+        con.rollback()
+        raise
+    finally:
+        Conexion().cerrar_conexion(con)
+
+def quitar_departamento(cur, id_departamento: int) -> None:
+    """Deja sin departamento a sus empleados, con el cursor de la transacción que lo elimina."""
+    cur.execute("UPDATE empleado SET id_departamento=NULL WHERE id_departamento=%s", (int(id_departamento),))
+
 # ----------------- D (Delete físico) -----------------
-def eliminar_empleado_por_id(id_empleado: int) -> int:
+def eliminar_empleado_por_id(id_empleado: int, uow: Optional[UnidadDeTrabajo] = None) -> int:
     """
-    Eliminación FÍSICA. Devuelve filas afectadas (0/1).
+    Eliminación FÍSICA (también quita sus asignaciones a proyectos). Devuelve filas afectadas (0/1).
     """
     sql = "DELETE FROM empleado WHERE id_empleado=%s"
-    con = Conexion().obtener_conexion()
+    con = Conexion().obtener_conexion(uow)
     try:
         with con.cursor() as cur:
+            ProyectoEmpleadoDAO.eliminar_de_empleado(cur, int(id_empleado))
             cur.execute(sql, (int(id_empleado),))
             affected = cur.rowcount
         con.commit()
@@ -0,0 +1,92 @@
+# persistencia/hidratador.py
+# ==============================================================
+# Hidratación fila -> objeto de dominio
+# --------------------------------------------------------------
+# Un Hidratador se arma una sola vez por DAO (a nivel de módulo) con el
+# mapeo atributo -> columna y, opcionalmente, un conversor por atributo.
+# Al construirse genera y compila el código de dos funciones:
+#   desde_dict(fila)  para filas de DictCursor / SSDictCursor
+#   desde_tupla(fila) para filas de Cursor / SSCursor (por posición)
+# que crean el objeto sin pasar por __init__ y asignan cada slot
+# directamente. Así no hay bucles ni getattr/setattr por campo en cada
+# fila, ni un dict intermedio.
+#
+# Uso:
+#   HIDRATADOR = Hidratador(Usuario, {"id": "id", "username": "username", ...},
+#                           conversores={"activo": bool})
+#   usuario  = HIDRATADOR.desde_dict(cur.fetchone())
+#   usuarios = HIDRATADOR.muchos(cur.fetchall())
+# ==============================================================
+
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+class Hidratador:
+    """Convierte filas de la BD en instancias de `clase` con código generado."""
+
+    def __init__(self, clase: type, columnas: Dict[str, str],
+                 conversores: Optional[Dict[str, Callable]] = None,
+                 fabricas: Optional[Dict[str, Callable]] = None) -> None:
+        """
+        clase       : clase de dominio (con __slots__ o no).
+        columnas    : {atributo: columna}; el orden define las posiciones de las filas-tupla.
+        conversores : {atributo: función} aplicada al valor de la columna (p. ej. un Enum).
+        fabricas    : {atributo: función sin argumentos} para slots sin columna (p. ej. list).
+        Los demás slots que no estén en `columnas` quedan en None.
+        """
+        conversores = conversores or {}
+        fabricas = fabricas or {}
+        desconocidos = set(conversores) - set(columnas)
+        if desconocidos:
+            raise ValueError(f"Conversores para atributos sin columna: {sorted(desconocidos)}")
+        self.clase = clase
+        self.columnas = dict(columnas)
+        self.conversores = dict(conversores)
+
+        slots = [s for c in reversed(clase.__mro__) for s in getattr(c, "__slots__", ())]
+        faltantes = [s for s in slots if s not in self.columnas and s != "__weakref__"]
+
+        espacio = {"_nuevo": object.__new__, "_clase": clase}
+        lineas_dict, lineas_tupla = [], []
+        for i, (atributo, columna) in enumerate(self.columnas.items()):
+            valor_dict, valor_tupla = f"f[{columna!r}]", f"f[{i}]"
+            if atributo in self.conversores:
+                espacio[f"_c{i}"] = self.conversores[atributo]
+                valor_dict, valor_tupla = f"_c{i}({valor_dict})", f"_c{i}({valor_tupla})"
+            lineas_dict.append(f"    o.{atributo} = {valor_dict}")
+            lineas_tupla.append(f"    o.{atributo} = {valor_tupla}")
+        resto = []
+        for j, s in enumerate(faltantes):
+            if s in fabricas:
+                espacio[f"_f{j}"] = fabricas[s]
+                resto.append(f"    o.{s} = _f{j}()")
+            else:
+                resto.append(f"    o.{s} = None")
+
+        codigo = "\n".join(
+            ["def desde_dict(f):", "    o = _nuevo(_clase)", *lineas_dict, *resto, "    return o",
+             "def desde_tupla(f):", "    o = _nuevo(_clase)", *lineas_tupla, *resto, "    return o"]
+        )
+        exec(compile(codigo, f"<hidratador {clase.__name__}>", "exec"), espacio)
+        self.desde_dict = espacio["desde_dict"]
+        self.desde_tupla = espacio["desde_tupla"]
+
+    def __repr__(self) -> str:
+        return f"Hidratador({self.clase.__name__}, {list(self.columnas)})"
+
+    def muchos(self, filas: Iterable, tuplas: bool = False) -> List:
+        """Lista de objetos a partir de filas dict (por defecto) o tuplas."""
+        return list(map(self.desde_tupla if tuplas else self.desde_dict, filas))
+
+    def columnas_sql(self) -> str:
+        """Lista de columnas para el SELECT, en el orden que espera desde_tupla."""
+        return ", ".join(self.columnas.values())
+
+
+def enum_o_texto(enum_cls) -> Callable:
+    """
+    Conversor texto -> miembro del Enum (por .value). Un valor que no está en el
+    Enum se deja como texto, igual que lo mostraban hasta ahora los DAO.
+    """
+    por_valor = {m.value: m for m in enum_cls}
+    return lambda v: por_valor.get(v, v)
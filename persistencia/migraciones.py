@@ -0,0 +1,425 @@
+# persistencia/migraciones.py
+# ==============================================================
+# Migraciones versionadas del esquema
+# --------------------------------------------------------------
+# - Cada migración tiene un número de versión, una descripción y una
+#   función que recibe el cursor. Se aplican en orden y la versión
+#   alcanzada queda registrada en la tabla `schema_version`.
+# - Son idempotentes: las tablas se crean con IF NOT EXISTS y los
+#   índices solo si no existe ya uno equivalente (information_schema),
+#   así sirven tanto para una BD vacía como para una ya en producción.
+# - `verificar()` revisa que estén los índices esperados y corre EXPLAIN
+#   sobre las consultas típicas de los DAO para detectar recorridos
+#   completos de tabla.
+#
+# Uso:
+#   python -m persistencia.migraciones estado
+#   python -m persistencia.migraciones migrar
+#   python -m persistencia.migraciones verificar
+# ==============================================================
+
+import argparse
+from typing import Dict, List, Optional
+
+from persistencia import resumen_horas
+from persistencia.conexion import Conexion
+
+con = Conexion()
+
+_OPCIONES_TABLA = "ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+
+
+# --------------------------------------------------------------
+# Utilidades de esquema
+# --------------------------------------------------------------
+
+def _indices_existentes(cur, tabla: str) -> Dict[str, Dict]:
+    """índice -> {"columnas": [...], "unico": bool, "tipo": "BTREE"|"FULLTEXT"|...} de una tabla."""
+    cur.execute(
+        """
+        SELECT index_name, column_name, non_unique, index_type
+        FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = %s
+        ORDER BY index_name, seq_in_index
+        """,
+        (tabla,),
+    )
+    indices: Dict[str, Dict] = {}
+    for f in cur.fetchall():
+        f = {k.lower(): v for k, v in f.items()}
+        ix = indices.setdefault(f["index_name"], {"columnas": [], "unico": not f["non_unique"],
+                                                  "tipo": (f["index_type"] or "").upper()})
+        ix["columnas"].append(f["column_name"].lower())
+    return indices
+
+def _indice_equivalente(cur, tabla: str, columnas: List[str], unico: bool = False) -> Optional[str]:
+    """Nombre de un índice que ya cubre `columnas` como prefijo (y es único si se pide)."""
+    buscadas = [c.lower() for c in columnas]
+    for nombre, ix in _indices_existentes(cur, tabla).items():
+        if ix["tipo"] == "FULLTEXT":
+            continue
+        if ix["columnas"][:len(buscadas)] == buscadas and (ix["unico"] or not unico):
+            if not unico or len(ix["columnas"]) == len(buscadas):
+                return nombre
+    return None
+
+def _crear_indice_si_falta(cur, tabla: str, nombre: str, columnas: List[str], unico: bool = False) -> bool:
+    """Crea el índice si no hay uno equivalente. Retorna True si lo creó."""
+    if _indice_equivalente(cur, tabla, columnas, unico):
+        return False
+    tipo = "UNIQUE INDEX" if unico else "INDEX"
+    cur.execute(f"CREATE {tipo} {nombre} ON {tabla} ({', '.join(columnas)})")
+    return True
+
+def _crear_fulltext_si_falta(cur, tabla: str, nombre: str, columnas: List[str]) -> bool:
+    """Crea un índice FULLTEXT salvo que ya exista uno con exactamente esas columnas."""
+    buscadas = sorted(c.lower() for c in columnas)
+    for ix in _indices_existentes(cur, tabla).values():
+        if ix["tipo"] == "FULLTEXT" and sorted(ix["columnas"]) == buscadas:
+            return False
+    cur.execute(f"CREATE FULLTEXT INDEX {nombre} ON {tabla} ({', '.join(columnas)})")
+    return True
+
+
+def _columna_existe(cur, tabla: str, columna: str) -> bool:
+    cur.execute(
+        """
+        SELECT 1 AS ok FROM information_schema.columns
+        WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s
+        """,
+        (tabla, columna),
+    )
+    return cur.fetchone() is not None
+
+
+# --------------------------------------------------------------
+# Migraciones
+# --------------------------------------------------------------
+
+def _v1_tablas(cur) -> None:
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS empleado (
+            id_empleado           INT AUTO_INCREMENT PRIMARY KEY,
+            nombre                VARCHAR(100) NOT NULL,
+            direccion             VARCHAR(200),
+            numero_telefono       VARCHAR(20),
+            correo_electronico    VARCHAR(120),
+            fecha_inicio_contrato DATETIME,
+            salario               DECIMAL(12, 2) NOT NULL DEFAULT 0,
+            usuario               VARCHAR(50),
+            tipo_empleado         VARCHAR(30) NOT NULL
+        ) {_OPCIONES_TABLA}
+    """)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS departamento (
+            id_departamento   INT AUTO_INCREMENT PRIMARY KEY,
+            nombre            VARCHAR(100) NOT NULL,
+            tipo_departamento VARCHAR(50) NOT NULL
+        ) {_OPCIONES_TABLA}
+    """)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS PROYECTO (
+            id_proyecto  INT AUTO_INCREMENT PRIMARY KEY,
+            nombre       VARCHAR(100) NOT NULL,
+            descripcion  TEXT,
+            fecha_inicio DATETIME
+        ) {_OPCIONES_TABLA}
+    """)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS REGISTRODETURNO (
+            id_registro       INT AUTO_INCREMENT PRIMARY KEY,
+            id_empleado       INT NOT NULL,
+            fecha             DATE NOT NULL,
+            cantidad_horas    INT NOT NULL DEFAULT 0,
+            tareas_realizadas TEXT
+        ) {_OPCIONES_TABLA}
+    """)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS usuarios (
+            id              INT AUTO_INCREMENT PRIMARY KEY,
+            username        VARCHAR(50) NOT NULL,
+            password_hash   VARCHAR(255) NOT NULL,
+            nombre_completo VARCHAR(120),
+            rol             VARCHAR(20) NOT NULL DEFAULT 'usuario',
+            activo          TINYINT(1) NOT NULL DEFAULT 1
+        ) {_OPCIONES_TABLA}
+    """)
+
+# Índices que necesitan las consultas de los DAO: (tabla, nombre, columnas, único)
+# - nombre: ORDER BY nombre / paginación keyset (nombre, id) / LIKE 'texto%'.
+#   En InnoDB el índice secundario ya incluye la PK, así que (nombre) cubre (nombre, id).
+# - usuarios.username: login y validación de duplicados (DuplicadoError usa el 1062).
+# - REGISTRODETURNO (id_empleado, fecha): turnos de un empleado por rango de fechas.
+INDICES = [
+    ("empleado", "ix_empleado_nombre", ["nombre"], False),
+    ("departamento", "ix_departamento_nombre", ["nombre"], False),
+    ("PROYECTO", "ix_proyecto_nombre", ["nombre"], False),
+    ("usuarios", "ux_usuarios_username", ["username"], True),
+    ("REGISTRODETURNO", "ix_turno_empleado_fecha", ["id_empleado", "fecha"], False),
+]
+
+def _v2_indices(cur) -> None:
+    for tabla, nombre, columnas, unico in INDICES:
+        _crear_indice_si_falta(cur, tabla, nombre, columnas, unico)
+
+# Índices FULLTEXT para la búsqueda por texto (MATCH ... AGAINST). Las columnas
+# deben coincidir exactamente con las del MATCH de cada DAO.
+INDICES_FULLTEXT = [
+    ("empleado", "ft_empleado", ["nombre", "correo_electronico", "usuario"]),
+    ("PROYECTO", "ft_proyecto", ["nombre", "descripcion"]),
+    ("departamento", "ft_departamento", ["nombre"]),
+]
+
+def _v3_fulltext(cur) -> None:
+    for tabla, nombre, columnas in INDICES_FULLTEXT:
+        _crear_fulltext_si_falta(cur, tabla, nombre, columnas)
+
+# Índice cubriente para los reportes de horas (aplicacion.reportes_turnos):
+# rango por fecha de todos los empleados, agrupado por empleado, sin leer la tabla.
+INDICES_REPORTES = [
+    ("REGISTRODETURNO", "ix_turno_fecha_empleado_horas", ["fecha", "id_empleado", "cantidad_horas"], False),
+]
+
+def _v4_indices_reportes(cur) -> None:
+    for tabla, nombre, columnas, unico in INDICES_REPORTES:
+        _crear_indice_si_falta(cur, tabla, nombre, columnas, unico)
+
+# Resúmenes materializados de horas (persistencia.resumen_horas). Se crean y se
+# pueblan con lo que ya haya en REGISTRODETURNO; después los mantiene el DAO.
+def _v5_resumen_horas(cur) -> None:
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS RESUMEN_HORAS_DIA (
+            id_empleado INT NOT NULL,
+            fecha       DATE NOT NULL,
+            horas       BIGINT NOT NULL DEFAULT 0,
+            turnos      INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (id_empleado, fecha),
+            KEY ix_resumen_dia_fecha (fecha, id_empleado, horas)
+        ) {_OPCIONES_TABLA}
+    """)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS RESUMEN_HORAS_MES (
+            id_empleado INT NOT NULL,
+            anio_mes    INT NOT NULL,
+            horas       BIGINT NOT NULL DEFAULT 0,
+            turnos      INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (id_empleado, anio_mes),
+            KEY ix_resumen_mes_anio_mes (anio_mes, id_empleado, horas)
+        ) {_OPCIONES_TABLA}
+    """)
+    resumen_horas.poblar(cur)
+
+# Asignación de empleados a proyectos (muchos a muchos). La PK (id_proyecto,
+# id_empleado) sirve para "empleados de un proyecto" y evita duplicados; el
+# índice inverso (id_empleado, id_proyecto) para "proyectos de un empleado".
+def _v6_proyecto_empleado(cur) -> None:
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS PROYECTO_EMPLEADO (
+            id_proyecto      INT NOT NULL,
+            id_empleado      INT NOT NULL,
+            fecha_asignacion DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (id_proyecto, id_empleado),
+            KEY ix_proyecto_empleado_empleado (id_empleado, id_proyecto)
+        ) {_OPCIONES_TABLA}
+    """)
+
+# Departamento de cada empleado (NULL = sin departamento). El índice
+# (id_departamento, salario) cubre el conteo y la suma de salarios por
+# departamento, así el listado con totales no lee las filas de empleado.
+INDICES_DEPARTAMENTO = [
+    ("empleado", "ix_empleado_departamento_salario", ["id_departamento", "salario"], False),
+]
+
+def _v7_empleado_departamento(cur) -> None:
+    if not _columna_existe(cur, "empleado", "id_departamento"):
+        cur.execute("ALTER TABLE empleado ADD COLUMN id_departamento INT NULL")
+    for tabla, nombre, columnas, unico in INDICES_DEPARTAMENTO:
+        _crear_indice_si_falta(cur, tabla, nombre, columnas, unico)
+
+# (versión, descripción, función). Agregar siempre al final con versión mayor.
+MIGRACIONES = [
+    (1, "Tablas base (empleado, departamento, PROYECTO, REGISTRODETURNO, usuarios)", _v1_tablas),
+    (2, "Índices para búsquedas por nombre, username y turnos por empleado/fecha", _v2_indices),
+    (3, "Índices FULLTEXT para búsqueda por texto en empleado, PROYECTO y departamento", _v3_fulltext),
+    (4, "Índice cubriente de REGISTRODETURNO para reportes de horas por rango de fechas", _v4_indices_reportes),
+    (5, "Resúmenes materializados de horas por empleado (día y mes)", _v5_resumen_horas),
+    (6, "Tabla PROYECTO_EMPLEADO (asignaciones) con índice inverso por empleado", _v6_proyecto_empleado),
+    (7, "Columna empleado.id_departamento con índice (id_departamento, salario)", _v7_empleado_departamento),
+]
+
+
+# --------------------------------------------------------------
+# Control de versiones
+# --------------------------------------------------------------
+
+def _asegurar_tabla_version(cur) -> None:
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version     INT PRIMARY KEY,
+            descripcion VARCHAR(200) NOT NULL,
+            aplicada_en DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+        ) {_OPCIONES_TABLA}
+    """)
+
+def version_actual() -> int:
+    """Última versión aplicada (0 si la BD nunca se migró)."""
+    with con.usar_conexion() as cx:
+        with cx.cursor() as cur:
+            _asegurar_tabla_version(cur)
+            cur.execute("SELECT COALESCE(MAX(version), 0) AS v FROM schema_version")
+            v = cur.fetchone()["v"]
+        cx.commit()
+        return int(v)
+
+def pendientes() -> List[tuple]:
+    actual = version_actual()
+    return [(v, d) for v, d, _ in MIGRACIONES if v > actual]
+
+def migrar(hasta: Optional[int] = None) -> List[int]:
+    """
+    Aplica en orden las migraciones pendientes (hasta la versión `hasta`, si se indica).
+    Retorna las versiones aplicadas. Si una falla, se detiene y relanza el error:
+    las anteriores quedan registradas (el DDL de MySQL no es transaccional).
+    """
+    aplicadas = []
+    actual = version_actual()
+    for version, descripcion, funcion in MIGRACIONES:
+        if version <= actual or (hasta is not None and version > hasta):
+            continue
+        cx = con.obtener_conexion()
+        try:
+            with cx.cursor() as cur:
+                funcion(cur)
+                cur.execute(
+                    "INSERT INTO schema_version (version, descripcion) VALUES (%s, %s)",
+                    (version, descripcion),
+                )
+            cx.commit()
+            aplicadas.append(version)
+        except Exception as e:
+            cx.rollback()
+            print(f"Error al aplicar la migración {version} ({descripcion}): {e}")
+            raise
+        finally:
+            con.cerrar_conexion(cx)
+    return aplicadas
+
+
+# --------------------------------------------------------------
+# Verificación de índices
+# --------------------------------------------------------------
+
+# Consultas representativas de los DAO: (descripción, tabla, SQL, parámetros)
+CONSULTAS_VERIFICACION = [
+    ("empleados ordenados por nombre (paginación)", "empleado",
+     "SELECT id_empleado, nombre FROM empleado ORDER BY nombre, id_empleado LIMIT 20", None),
+    ("empleados por prefijo de nombre", "empleado",
+     "SELECT id_empleado FROM empleado WHERE nombre LIKE %s ORDER BY nombre", ("a%",)),
+    ("departamentos ordenados por nombre", "departamento",
+     "SELECT id_departamento, nombre FROM departamento ORDER BY nombre, id_departamento LIMIT 20", None),
+    ("proyectos ordenados por nombre", "PROYECTO",
+     "SELECT id_proyecto, nombre FROM PROYECTO ORDER BY nombre, id_proyecto LIMIT 20", None),
+    ("usuario por username (login)", "usuarios",
+     "SELECT id FROM usuarios WHERE username = %s", ("admin",)),
+    ("turnos de un empleado por rango de fechas", "REGISTRODETURNO",
+     "SELECT id_registro FROM REGISTRODETURNO WHERE id_empleado = %s "
+     "AND fecha >= %s AND fecha < %s + INTERVAL 1 DAY",
+     (1, "2024-01-01", "2024-12-31")),
+    ("proyectos de un empleado (índice inverso)", "PROYECTO_EMPLEADO",
+     "SELECT id_proyecto FROM PROYECTO_EMPLEADO WHERE id_empleado = %s", (1,)),
+    ("empleados y salarios por departamento", "empleado",
+     "SELECT id_departamento, COUNT(*), SUM(salario) FROM empleado "
+     "WHERE id_departamento = %s GROUP BY id_departamento", (1,)),
+    ("horas por empleado en un rango de fechas (reportes)", "REGISTRODETURNO",
+     "SELECT id_empleado, SUM(cantidad_horas) FROM REGISTRODETURNO "
+     "WHERE fecha >= %s AND fecha < %s + INTERVAL 1 DAY GROUP BY id_empleado",
+     ("2024-01-01", "2024-01-31")),
+]
+
+def indices_faltantes() -> List[Dict]:
+    """Índices de INDICES / INDICES_FULLTEXT sin un equivalente en la BD."""
+    faltan = []
+    with con.usar_conexion() as cx:
+        with cx.cursor() as cur:
+            for tabla, nombre, columnas, unico in INDICES + INDICES_REPORTES + INDICES_DEPARTAMENTO:
+                if not _indice_equivalente(cur, tabla, columnas, unico):
+                    faltan.append({"tabla": tabla, "indice": nombre, "columnas": columnas, "unico": unico})
+            for tabla, nombre, columnas in INDICES_FULLTEXT:
+                existentes = _indices_existentes(cur, tabla).values()
+                if not any(ix["tipo"] == "FULLTEXT" and sorted(ix["columnas"]) == sorted(columnas)
+                           for ix in existentes):
+                    faltan.append({"tabla": tabla, "indice": nombre, "columnas": columnas,
+                                   "unico": False, "fulltext": True})
+    return faltan
+
+def verificar() -> Dict:
+    """
+    Retorna {"faltantes": [...], "explain": [...]}. En "explain" cada consulta
+    trae el plan resumido y `sin_indice=True` si MySQL no tiene ningún índice
+    utilizable para ella (possible_keys vacío y recorrido completo o filesort).
+    Con tablas casi vacías el optimizador puede preferir un recorrido completo
+    aunque exista el índice; por eso se informan ambas cosas.
+    """
+    planes = []
+    with con.usar_conexion() as cx:
+        with cx.cursor() as cur:
+            for descripcion, tabla, sql, params in CONSULTAS_VERIFICACION:
+                cur.execute("EXPLAIN " + sql, params)
+                for f in cur.fetchall():
+                    f = {k.lower(): v for k, v in f.items()}
+                    if (f.get("table") or "").lower() != tabla.lower():
+                        continue
+                    extra = f.get("extra") or ""
+                    planes.append({
+                        "consulta": descripcion,
+                        "tabla": tabla,
+                        "tipo": f.get("type"),
+                        "possible_keys": f.get("possible_keys"),
+                        "key": f.get("key"),
+                        "filas_estimadas": f.get("rows"),
+                        "extra": extra,
+                        "sin_indice": f.get("key") is None and not f.get("possible_keys")
+                                      and (f.get("type") == "ALL" or "filesort" in extra.lower()),
+                    })
+    return {"faltantes": indices_faltantes(), "explain": planes}
+
+
+# --------------------------------------------------------------
+# Línea de comandos
+# --------------------------------------------------------------
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Migraciones del esquema de la BD.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    sub.add_parser("estado", help="Muestra la versión actual y las migraciones pendientes.")
+    mig = sub.add_parser("migrar", help="Aplica las migraciones pendientes.")
+    mig.add_argument("--hasta", type=int, help="Versión máxima a aplicar.")
+    sub.add_parser("verificar", help="Reporta índices faltantes (information_schema + EXPLAIN).")
+    args = parser.parse_args(argv)
+
+    if args.comando == "estado":
+        print(f"Versión actual: {version_actual()}")
+        for v, d in pendientes():
+            print(f"  pendiente v{v}: {d}")
+        return 0
+
+    if args.comando == "migrar":
+        aplicadas = migrar(args.hasta)
+        print(f"Migraciones aplicadas: {aplicadas or 'ninguna'} (versión actual: {version_actual()})")
+        return 0
+
+    resultado = verificar()
+    for f in resultado["faltantes"]:
+        unico = "FULLTEXT " if f.get("fulltext") else ("UNIQUE " if f["unico"] else "")
+        print(f"❌ Falta {unico}índice {f['indice']} en {f['tabla']}({', '.join(f['columnas'])})")
+    for p in resultado["explain"]:
+        marca = "❌" if p["sin_indice"] else "✔"
+        print(f"{marca} {p['consulta']}: type={p['tipo']} key={p['key']} "
+              f"rows={p['filas_estimadas']} {p['extra']}")
+    problemas = len(resultado["faltantes"]) + sum(p["sin_indice"] for p in resultado["explain"])
+    print("Sin problemas de índices." if not problemas else f"{problemas} problema(s) encontrado(s).")
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
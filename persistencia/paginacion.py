@@ -0,0 +1,43 @@
+# persistencia/paginacion.py
+# ==============================================================
+# Paginación por keyset ("seek") sobre (nombre, id)
+# --------------------------------------------------------------
+# En vez de OFFSET (que obliga a la BD a recorrer y descartar todas
+# las filas anteriores), cada página pide "lo que viene después de la
+# última fila vista". Con un índice sobre nombre la página N cuesta lo
+# mismo que la página 1.
+# ==============================================================
+
+from typing import Optional, Tuple
+
+
+def clausula_keyset(col_nombre: str, col_id: str,
+                    after_nombre: Optional[str], after_id: Optional[int],
+                    limit: Optional[int]) -> Tuple[str, str, tuple]:
+    """
+    Arma los fragmentos SQL para una página ordenada por (col_nombre, col_id).
+
+    Retorna (where_sql, limit_sql, params):
+      - where_sql : "WHERE ..." o "" si es la primera página.
+      - limit_sql : "LIMIT %s" o "" si limit es None (sin paginar).
+      - params    : valores para los placeholders, en orden.
+    Se usa la forma expandida (a > x OR (a = x AND b > y)) porque MySQL
+    no siempre aprovecha el índice con comparaciones de tuplas.
+    """
+    where_sql, params = "", []
+    if after_nombre is not None:
+        if after_id is None:
+            where_sql = f"WHERE {col_nombre} > %s"
+            params.append(after_nombre)
+        else:
+            where_sql = f"WHERE ({col_nombre} > %s OR ({col_nombre} = %s AND {col_id} > %s))"
+            params.extend([after_nombre, after_nombre, int(after_id)])
+
+    limit_sql = ""
+    if limit is not None:
+        limit = int(limit)
+        if limit < 1:
+            raise ValueError("limit debe ser al menos 1.")
+        limit_sql = "LIMIT %s"
+        params.append(limit)
+    return where_sql, limit_sql, tuple(params)
@@ -1,7 +1,12 @@
 # persistencia/proyectoDAO.py
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator
 from datetime import datetime, date
 from persistencia.conexion import Conexion  # Desde la capa de persistencia
+from persistencia.hidratador import Hidratador
+from persistencia.paginacion import clausula_keyset
+from persistencia.proyectoEmpleadoDAO import ProyectoEmpleadoDAO
+from persistencia.texto_completo import consulta_booleana, patron_prefijo
+from persistencia.unidad_trabajo import UnidadDeTrabajo
 from dominio.proyecto import Proyecto
 
 # Instancia de conexión
@@ -14,6 +19,25 @@ def _to_datetime(v):
         return datetime.combine(v, datetime.min.time())
     return v
 
+# Filas de PROYECTO -> objetos Proyecto. La relación con empleados no viene
+# en la fila: empleados_asignados arranca vacía, como en el constructor.
+HIDRATADOR = Hidratador(
+    Proyecto,
+    {"id_proyecto": "id_proyecto", "nombre": "nombre", "descripcion": "descripcion",
+     "fecha_inicio": "fecha_inicio"},
+    conversores={"fecha_inicio": _to_datetime},
+    fabricas={"empleados_asignados": dict},
+)
+
+def _fila_a_dict(r: Dict) -> Dict:
+    """Convierte una fila de PROYECTO al dict que usan las capas superiores."""
+    return {
+        "id_proyecto": r["id_proyecto"],
+        "nombre": r["nombre"],
+        "descripcion": r["descripcion"],
+        "fecha_inicio": _to_datetime(r["fecha_inicio"]),
+    }
+
 class ProyectoDAO:
     """
     DAO para la tabla PROYECTO.
@@ -23,8 +47,8 @@ class ProyectoDAO:
 
     # ---------------- C: Crear ----------------
     @staticmethod
-    def guardar_proyecto(proyecto: Proyecto):
-        """Inserta un proyecto en la BD."""
+    def guardar_proyecto(proyecto: Proyecto, uow: Optional[UnidadDeTrabajo] = None):
+        """Inserta un proyecto en la BD y retorna su ID (None si falló)."""
         query = """
             INSERT INTO PROYECTO (nombre, descripcion, fecha_inicio)
             VALUES (%s, %s, %s)
@@ -34,35 +58,65 @@ class ProyectoDAO:
             proyecto.obtener_descripcion(),
             proyecto.obtener_fecha_inicio(),  # datetime o date
         )
-        conexion = con.obtener_conexion()
+        conexion = con.obtener_conexion(uow)
         try:
             with conexion.cursor() as cursor:
                 cursor.execute(query, valores)
+                nuevo_id = cursor.lastrowid
             conexion.commit()
             print("SE HA INSERTADO CORRECTAMENTE")
+            return nuevo_id
         except Exception as e:
+            conexion.rollback()
             print(f"Ocurrió un error al INSERTAR un proyecto: {e}")
         finally:
             con.cerrar_conexion(conexion)
 
+    # ---------------- C: Crear por lotes ----------------
+    @staticmethod
+    def guardar_proyectos_lote(proyectos: List[Proyecto], uow: Optional[UnidadDeTrabajo] = None) -> int:
+        """
+        Inserta varios proyectos en una sola transacción (INSERT multi-fila vía executemany).
+        A diferencia de guardar_proyecto, relanza el error para que quien importa
+        pueda aislar las filas con problema. Retorna la cantidad de filas insertadas.
+        """
+        if not proyectos:
+            return 0
+        query = """
+            INSERT INTO PROYECTO (nombre, descripcion, fecha_inicio)
+            VALUES (%s, %s, %s)
+        """
+        valores = [
+            (p.obtener_nombre(), p.obtener_descripcion(), p.obtener_fecha_inicio())
+            for p in proyectos
+        ]
+        conexion = con.obtener_conexion(uow)
+        try:
+            with conexion.cursor() as cursor:
+                cursor.executemany(query, valores)
+                insertados = cursor.rowcount
+            conexion.commit()
+            return insertados
+        except Exception as e:
+            conexion.rollback()
+            print(f"Ocurrió un error al INSERTAR un lote de proyectos: {e}")
+            raise
+        finally:
+            con.cerrar_conexion(conexion)
+
     # ---------------- R: Leer (detalle por ID) ----------------
     @staticmethod
-    def obtener_proyecto_por_id(id_proyecto: int) -> Optional[Dict]:
+    def obtener_proyecto_por_id(id_proyecto: int, uow: Optional[UnidadDeTrabajo] = None) -> Optional[Dict]:
         """Retorna un dict con los datos del proyecto o None si no existe."""
         query = "SELECT id_proyecto, nombre, descripcion, fecha_inicio FROM PROYECTO WHERE id_proyecto = %s"
-        conexion = con.obtener_conexion()
+        conexion = con.obtener_conexion(uow)
         try:
             with conexion.cursor() as cursor:
                 cursor.execute(query, (id_proyecto,))
                 r = cursor.fetchone()
                 if not r:
                     return None
-                return {
-                    "id_proyecto": r["id_proyecto"],
-                    "nombre": r["nombre"],
-                    "descripcion": r["descripcion"],
-                    "fecha_inicio": _to_datetime(r["fecha_inicio"]),
-                }
+                return _fila_a_dict(r)
         except Exception as e:
             print(f"Ocurrió un error al SELECCIONAR por ID: {e}")
             return None
@@ -71,36 +125,40 @@ class ProyectoDAO:
 
     # ---------------- U: Actualizar ----------------
     @staticmethod
-    def actualizar_proyecto(nombre: str, descripcion: str, fecha_inicio, id_proyecto: int):
+    def actualizar_proyecto(nombre: str, descripcion: str, fecha_inicio, id_proyecto: int,
+                            uow: Optional[UnidadDeTrabajo] = None):
         """Actualiza nombre, descripción y fecha_inicio por ID."""
         query = """
             UPDATE PROYECTO
             SET nombre = %s, descripcion = %s, fecha_inicio = %s
             WHERE id_proyecto = %s
         """
-        conexion = con.obtener_conexion()
+        conexion = con.obtener_conexion(uow)
         try:
             with conexion.cursor() as cursor:
                 cursor.execute(query, (nombre, descripcion, fecha_inicio, id_proyecto))
             conexion.commit()
             print("SE HA ACTUALIZADO CORRECTAMENTE")
         except Exception as e:
+            conexion.rollback()
             print(f"ERROR AL REALIZAR CAMBIOS: {e}")
         finally:
             con.cerrar_conexion(conexion)
 
     # ---------------- D: Eliminar ----------------
     @staticmethod
-    def eliminar_proyecto(id_proyecto: int):
-        """Eliminación FÍSICA del proyecto por ID."""
+    def eliminar_proyecto(id_proyecto: int, uow: Optional[UnidadDeTrabajo] = None):
+        """Eliminación FÍSICA del proyecto por ID (junto con sus asignaciones de empleados)."""
         query = "DELETE FROM PROYECTO WHERE id_proyecto = %s"
-        conexion = con.obtener_conexion()
+        conexion = con.obtener_conexion(uow)
         try:
             with conexion.cursor() as cursor:
+                ProyectoEmpleadoDAO.eliminar_de_proyecto(cursor, id_proyecto)
                 cursor.execute(query, (id_proyecto,))
             conexion.commit()
             print(f"SE HA ELIMINADO EL PROYECTO CON EL ID: {id_proyecto}")
         except Exception as e:
+            conexion.rollback()
             print(f"Error al ELIMINAR un proyecto: {e}")
         finally:
             con.cerrar_conexion(conexion)
@@ -108,23 +166,26 @@ class ProyectoDAO:
     # ============== NUEVOS ==============
 
     @staticmethod
-    def listar_proyectos() -> List[Dict]:
-        """Lista todos los proyectos."""
-        query = "SELECT id_proyecto, nombre, descripcion, fecha_inicio FROM PROYECTO ORDER BY nombre"
-        conexion = con.obtener_conexion()
+    def listar_proyectos(after_nombre: Optional[str] = None, after_id: Optional[int] = None,
+                         limit: Optional[int] = None, uow: Optional[UnidadDeTrabajo] = None) -> List[Dict]:
+        """
+        Lista proyectos ordenados por (nombre, id_proyecto).
+        Sin argumentos devuelve todos; con `limit` devuelve una página por keyset
+        (after_nombre/after_id = última fila de la página anterior).
+        """
+        where_sql, limit_sql, params = clausula_keyset("nombre", "id_proyecto", after_nombre, after_id, limit)
+        query = f"""
+            SELECT id_proyecto, nombre, descripcion, fecha_inicio
+            FROM PROYECTO
+            {where_sql}
+            ORDER BY nombre, id_proyecto
+            {limit_sql}
+        """
+        conexion = con.obtener_conexion(uow)
         try:
             with conexion.cursor() as cursor:
-                cursor.execute(query)
-                rows = cursor.fetchall()
-                out: List[Dict] = []
-                for r in rows:
-                    out.append({
-                        "id_proyecto": r["id_proyecto"],
-                        "nombre": r["nombre"],
-                        "descripcion": r["descripcion"],
-                        "fecha_inicio": _to_datetime(r["fecha_inicio"]),
-                    })
-                return out
+                cursor.execute(query, params)
+                return [_fila_a_dict(r) for r in cursor.fetchall()]
         except Exception as e:
             print(f"Error al LISTAR proyectos: {e}")
             return []
@@ -132,7 +193,24 @@ class ProyectoDAO:
             con.cerrar_conexion(conexion)
 
     @staticmethod
-    def buscar_proyectos_por_nombre(texto: str) -> List[Dict]:
+    def iter_proyectos(tamano_bloque: int = 500) -> Iterator[List[Dict]]:
+        """
+        Variante en streaming de listar_proyectos(): cursor de servidor y
+        bloques de hasta `tamano_bloque` proyectos (memoria constante).
+        """
+        query = "SELECT id_proyecto, nombre, descripcion, fecha_inicio FROM PROYECTO ORDER BY nombre"
+        for bloque in con.iterar_en_bloques(query, tamano_bloque=tamano_bloque):
+            yield [_fila_a_dict(r) for r in bloque]
+
+    @staticmethod
+    def iter_proyectos_objetos(tamano_bloque: int = 500) -> Iterator[List[Proyecto]]:
+        """Como iter_proyectos(), pero en bloques de objetos Proyecto (filas-tupla hidratadas)."""
+        query = f"SELECT {HIDRATADOR.columnas_sql()} FROM PROYECTO ORDER BY nombre"
+        for bloque in con.iterar_en_bloques(query, tamano_bloque=tamano_bloque, tuplas=True):
+            yield HIDRATADOR.muchos(bloque, tuplas=True)
+
+    @staticmethod
+    def buscar_proyectos_por_nombre(texto: str, uow: Optional[UnidadDeTrabajo] = None) -> List[Dict]:
         """Busca proyectos por nombre usando LIKE."""
         query = """
             SELECT id_proyecto, nombre, descripcion, fecha_inicio
@@ -140,22 +218,63 @@ class ProyectoDAO:
             WHERE nombre LIKE %s
             ORDER BY nombre
         """
-        conexion = con.obtener_conexion()
+        conexion = con.obtener_conexion(uow)
         try:
             with conexion.cursor() as cursor:
                 cursor.execute(query, (f"%{texto.strip()}%",))
-                rows = cursor.fetchall()
-                out: List[Dict] = []
-                for r in rows:
-                    out.append({
-                        "id_proyecto": r["id_proyecto"],
-                        "nombre": r["nombre"],
-                        "descripcion": r["descripcion"],
-                        "fecha_inicio": _to_datetime(r["fecha_inicio"]),
-                    })
-                return out
+                return [_fila_a_dict(r) for r in cursor.fetchall()]
         except Exception as e:
             print(f"Error al BUSCAR proyectos por nombre: {e}")
             return []
         finally:
             con.cerrar_conexion(conexion)
+
+    @staticmethod
+    def buscar_proyectos_por_prefijo(texto: str, limit: int = 50,
+                                     uow: Optional[UnidadDeTrabajo] = None) -> List[Dict]:
+        """
+        Proyectos cuyo nombre empieza por `texto` (LIKE 'texto%'), como mucho `limit`.
+        Usa el índice ix_proyecto_nombre; los errores se propagan (ver buscar_proyectos_texto).
+        """
+        query = """
+            SELECT id_proyecto, nombre, descripcion, fecha_inicio
+            FROM PROYECTO
+            WHERE nombre LIKE %s
+            ORDER BY nombre, id_proyecto
+            LIMIT %s
+        """
+        conexion = con.obtener_conexion(uow)
+        try:
+            with conexion.cursor() as cursor:
+                cursor.execute(query, (patron_prefijo(texto), int(limit)))
+                return [_fila_a_dict(r) for r in cursor.fetchall()]
+        finally:
+            con.cerrar_conexion(conexion)
+
+    @staticmethod
+    def buscar_proyectos_texto(texto: str, limit: int = 50,
+                               uow: Optional[UnidadDeTrabajo] = None) -> Optional[List[Dict]]:
+        """
+        Búsqueda FULLTEXT en nombre y descripción, ordenada por relevancia.
+        Retorna None si el texto no tiene términos indexables. A diferencia
+        de buscar_proyectos_por_nombre, los errores se propagan para que la
+        capa de aplicación pueda usar la búsqueda alternativa.
+        """
+        consulta = consulta_booleana(texto)
+        if consulta is None:
+            return None
+        query = """
+            SELECT id_proyecto, nombre, descripcion, fecha_inicio,
+                   MATCH(nombre, descripcion) AGAINST (%s IN BOOLEAN MODE) AS relevancia
+            FROM PROYECTO
+            WHERE MATCH(nombre, descripcion) AGAINST (%s IN BOOLEAN MODE)
+            ORDER BY relevancia DESC, nombre, id_proyecto
+            LIMIT %s
+        """
+        conexion = con.obtener_conexion(uow)
+        try:
+            with conexion.cursor() as cursor:
+                cursor.execute(query, (consulta, consulta, int(limit)))
+                return [dict(_fila_a_dict(r), relevancia=float(r["relevancia"])) for r in cursor.fetchall()]
+        finally:
+            con.cerrar_conexion(conexion)
@@ -0,0 +1,235 @@
+# persistencia/proyectoEmpleadoDAO.py
+# ==============================================================
+# DAO de asignaciones Proyecto <-> Empleado (tabla PROYECTO_EMPLEADO)
+# --------------------------------------------------------------
+# - PK (id_proyecto, id_empleado): empleados de un proyecto y sin duplicados.
+# - Índice (id_empleado, id_proyecto): proyectos de un empleado sin
+#   recorrer la tabla (migración 6).
+# - Las operaciones masivas corren en UNA transacción: o quedan todas
+#   las asignaciones o ninguna.
+# - Con `uow` (persistencia.unidad_trabajo) participan de una transacción
+#   mayor y el commit lo hace la unidad.
+# - eliminar_de_proyecto / eliminar_de_empleado reciben el cursor de la
+#   transacción que borra el proyecto o el empleado, para no dejar
+#   asignaciones huérfanas.
+# ==============================================================
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from persistencia.conexion import Conexion
+from persistencia.unidad_trabajo import UnidadDeTrabajo
+
+con = Conexion()
+
+# Tope de ids por sentencia IN (...) para no armar consultas gigantes
+_MAX_IDS_POR_SENTENCIA = 1000
+
+
+def _unicos(ids: Iterable[int]) -> List[int]:
+    """Ids sin repetir, en el orden recibido."""
+    return list(dict.fromkeys(int(i) for i in ids))
+
+def _tramos(valores: List, tamano: int = _MAX_IDS_POR_SENTENCIA):
+    for i in range(0, len(valores), tamano):
+        yield valores[i:i + tamano]
+
+
+class ProyectoEmpleadoDAO:
+    """DAO para la tabla 'PROYECTO_EMPLEADO'."""
+
+    # ============================= C (CREATE) =============================
+    @staticmethod
+    def asignar_pares(pares: Iterable[Tuple[int, int]], uow: Optional[UnidadDeTrabajo] = None) -> int:
+        """
+        Asigna muchos (id_proyecto, id_empleado) en una transacción.
+        Los pares ya asignados se ignoran. Retorna cuántas asignaciones nuevas hubo.
+        """
+        filas = sorted(set((int(p), int(e)) for p, e in pares))
+        if not filas:
+            return 0
+        cx = con.obtener_conexion(uow)
+        try:
+            with cx.cursor() as cur:
+                cur.executemany(
+                    "INSERT IGNORE INTO PROYECTO_EMPLEADO (id_proyecto, id_empleado) VALUES (%s, %s)",
+                    filas,
+                )
+                nuevas = cur.rowcount
+            cx.commit()
+            return nuevas
+        except Exception as e:
+            cx.rollback()
+            print(f"ERROR AL ASIGNAR EMPLEADOS A PROYECTOS: {e}")
+            raise
+        finally:
+            con.cerrar_conexion(cx)
+
+    @staticmethod
+    def asignar(id_proyecto: int, ids_empleados: Iterable[int],
+                uow: Optional[UnidadDeTrabajo] = None) -> int:
+        """Asigna varios empleados a un proyecto en una transacción."""
+        return ProyectoEmpleadoDAO.asignar_pares(((id_proyecto, e) for e in ids_empleados), uow)
+
+    # ============================= D (DELETE) =============================
+    @staticmethod
+    def desasignar_pares(pares: Iterable[Tuple[int, int]], uow: Optional[UnidadDeTrabajo] = None) -> int:
+        """Quita muchos (id_proyecto, id_empleado) en una transacción. Retorna cuántos se quitaron."""
+        por_proyecto: Dict[int, List[int]] = {}
+        for p, e in pares:
+            por_proyecto.setdefault(int(p), []).append(int(e))
+        if not por_proyecto:
+            return 0
+        cx = con.obtener_conexion(uow)
+        try:
+            quitadas = 0
+            with cx.cursor() as cur:
+                for id_proyecto in sorted(por_proyecto):
+                    for tramo in _tramos(sorted(_unicos(por_proyecto[id_proyecto]))):
+                        marcas = ", ".join(["%s"] * len(tramo))
+                        cur.execute(
+                            f"DELETE FROM PROYECTO_EMPLEADO WHERE id_proyecto = %s AND id_empleado IN ({marcas})",
+                            (id_proyecto, *tramo),
+                        )
+                        quitadas += cur.rowcount
+            cx.commit()
+            return quitadas
+        except Exception as e:
+            cx.rollback()
+            print(f"ERROR AL DESASIGNAR EMPLEADOS DE PROYECTOS: {e}")
+            raise
+        finally:
+            con.cerrar_conexion(cx)
+
+    @staticmethod
+    def desasignar(id_proyecto: int, ids_empleados: Iterable[int],
+                   uow: Optional[UnidadDeTrabajo] = None) -> int:
+        """Quita varios empleados de un proyecto en una transacción."""
+        return ProyectoEmpleadoDAO.desasignar_pares(((id_proyecto, e) for e in ids_empleados), uow)
+
+    @staticmethod
+    def reemplazar(id_proyecto: int, ids_empleados: Iterable[int],
+                   uow: Optional[UnidadDeTrabajo] = None) -> Tuple[int, int]:
+        """
+        Deja al proyecto con exactamente esos empleados, en una transacción.
+        Solo inserta/borra la diferencia. Retorna (agregados, quitados).
+        """
+        deseados = set(_unicos(ids_empleados))
+        cx = con.obtener_conexion(uow)
+        try:
+            with cx.cursor() as cur:
+                cur.execute(
+                    "SELECT id_empleado FROM PROYECTO_EMPLEADO WHERE id_proyecto = %s FOR UPDATE",
+                    (id_proyecto,),
+                )
+                actuales = {f["id_empleado"] for f in cur.fetchall()}
+                agregar = sorted(deseados - actuales)
+                quitar = sorted(actuales - deseados)
+                if agregar:
+                    cur.executemany(
+                        "INSERT INTO PROYECTO_EMPLEADO (id_proyecto, id_empleado) VALUES (%s, %s)",
+                        [(id_proyecto, e) for e in agregar],
+                    )
+                for tramo in _tramos(quitar):
+                    marcas = ", ".join(["%s"] * len(tramo))
+                    cur.execute(
+                        f"DELETE FROM PROYECTO_EMPLEADO WHERE id_proyecto = %s AND id_empleado IN ({marcas})",
+                        (id_proyecto, *tramo),
+                    )
+            cx.commit()
+            return len(agregar), len(quitar)
+        except Exception as e:
+            cx.rollback()
+            print(f"ERROR AL ACTUALIZAR LOS EMPLEADOS DEL PROYECTO: {e}")
+            raise
+        finally:
+            con.cerrar_conexion(cx)
+
+    @staticmethod
+    def eliminar_de_proyecto(cur, id_proyecto: int) -> None:
+        """Borra las asignaciones de un proyecto con el cursor de la transacción que lo elimina."""
+        cur.execute("DELETE FROM PROYECTO_EMPLEADO WHERE id_proyecto = %s", (id_proyecto,))
+
+    @staticmethod
+    def eliminar_de_empleado(cur, id_empleado: int) -> None:
+        """Borra las asignaciones de un empleado con el cursor de la transacción que lo elimina."""
+        cur.execute("DELETE FROM PROYECTO_EMPLEADO WHERE id_empleado = %s", (id_empleado,))
+
+    # ============================= R (READ) =============================
+    @staticmethod
+    def ids_empleados(id_proyecto: int, uow: Optional[UnidadDeTrabajo] = None) -> Set[int]:
+        """Ids de los empleados asignados al proyecto (solo lee la PK)."""
+        cx = con.obtener_conexion(uow)
+        try:
+            with cx.cursor() as cur:
+                cur.execute("SELECT id_empleado FROM PROYECTO_EMPLEADO WHERE id_proyecto = %s", (id_proyecto,))
+                return {f["id_empleado"] for f in cur.fetchall()}
+        finally:
+            con.cerrar_conexion(cx)
+
+    @staticmethod
+    def empleados_de_proyecto(id_proyecto: int, uow: Optional[UnidadDeTrabajo] = None) -> List[Dict]:
+        """Empleados asignados (id, nombre, usuario, tipo y fecha de asignación), por nombre."""
+        sql = """
+            SELECT e.id_empleado, e.nombre, e.usuario, e.tipo_empleado, pe.fecha_asignacion
+            FROM PROYECTO_EMPLEADO pe
+            JOIN empleado e ON e.id_empleado = pe.id_empleado
+            WHERE pe.id_proyecto = %s
+            ORDER BY e.nombre, e.id_empleado
+        """
+        cx = con.obtener_conexion(uow)
+        try:
+            with cx.cursor() as cur:
+                cur.execute(sql, (id_proyecto,))
+                return cur.fetchall()
+        finally:
+            con.cerrar_conexion(cx)
+
+    @staticmethod
+    def proyectos_de_empleado(id_empleado: int, uow: Optional[UnidadDeTrabajo] = None) -> List[Dict]:
+        """Proyectos de un empleado (usa el índice inverso id_empleado, id_proyecto)."""
+        sql = """
+            SELECT p.id_proyecto, p.nombre, p.descripcion, p.fecha_inicio, pe.fecha_asignacion
+            FROM PROYECTO_EMPLEADO pe
+            JOIN PROYECTO p ON p.id_proyecto = pe.id_proyecto
+            WHERE pe.id_empleado = %s
+            ORDER BY p.nombre, p.id_proyecto
+        """
+        cx = con.obtener_conexion(uow)
+        try:
+            with cx.cursor() as cur:
+                cur.execute(sql, (id_empleado,))
+                return cur.fetchall()
+        finally:
+            con.cerrar_conexion(cx)
+
+    @staticmethod
+    def esta_asignado(id_proyecto: int, id_empleado: int, uow: Optional[UnidadDeTrabajo] = None) -> bool:
+        cx = con.obtener_conexion(uow)
+        try:
+            with cx.cursor() as cur:
+                cur.execute(
+                    "SELECT 1 AS ok FROM PROYECTO_EMPLEADO WHERE id_proyecto = %s AND id_empleado = %s",
+                    (id_proyecto, id_empleado),
+                )
+                return cur.fetchone() is not None
+        finally:
+            con.cerrar_conexion(cx)
+
+    @staticmethod
+    def empleados_inexistentes(ids_empleados: Iterable[int],
+                               uow: Optional[UnidadDeTrabajo] = None) -> List[int]:
+        """Ids de la lista que no existen en la tabla empleado (no hay FK que lo impida)."""
+        ids = _unicos(ids_empleados)
+        if not ids:
+            return []
+        existentes = set()
+        cx = con.obtener_conexion(uow)
+        try:
+            with cx.cursor() as cur:
+                for tramo in _tramos(ids):
+                    marcas = ", ".join(["%s"] * len(tramo))
+                    cur.execute(f"SELECT id_empleado FROM empleado WHERE id_empleado IN ({marcas})", tramo)
+                    existentes.update(f["id_empleado"] for f in cur.fetchall())
+        finally:
+            con.cerrar_conexion(cx)
+        return [i for i in ids if i not in existentes]
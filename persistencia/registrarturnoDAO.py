@@ -1,33 +1,217 @@
+import datetime
+from typing import List, Dict, Iterator, Optional
+
+import pymysql.cursors
+
+from persistencia import resumen_horas
 from persistencia.conexion import Conexion
+from persistencia.hidratador import Hidratador
+from persistencia.unidad_trabajo import UnidadDeTrabajo
 from dominio.registrodeturno import RegistroDeTurno
 from dominio.empleado import Empleado
 
 con = Conexion()
 
+HIDRATADOR = Hidratador(
+    RegistroDeTurno,
+    {c: c for c in ("id_registro", "id_empleado", "fecha", "cantidad_horas", "tareas_realizadas")},
+)
+
 class registroturnoDAO:
     @staticmethod
-    def guardar_turno(empleado:Empleado, registro_turno: RegistroDeTurno):
+    def guardar_turno(empleado:Empleado, registro_turno: RegistroDeTurno,
+                      uow: Optional[UnidadDeTrabajo] = None):
+        """
+        Inserta un turno del empleado y deja el id generado en registro_turno.
+        Actualiza los resúmenes de horas en la misma transacción.
+        Para cargas grandes usar guardar_turnos_lote o aplicacion.ingesta_turnos.
+        """
         query = "INSERT INTO REGISTRODETURNO (id_empleado, fecha, cantidad_horas, tareas_realizadas) VALUES (%s, %s, %s, %s)"
         valores = (
             empleado.obtener_id(),
             registro_turno.obtener_fecha(),
+            registro_turno.obtener_cantidad_horas(),
             registro_turno.obtener_tareas_realizadas()
         )
 
-        conexion =con.obtener_conexion()
+        conexion =con.obtener_conexion(uow)
         try:
             with conexion.cursor() as cursor:
-                cursor.execute(query,(valores))
-                conexion.commit()
-                print("Turno registrado correctamente")
+                cursor.execute(query, valores)
+                id_registro = cursor.lastrowid
+                resumen_horas.aplicar_deltas(cursor, [resumen_horas.deltas_de_turno(*valores[:3])])
+            conexion.commit()
+            registro_turno.establecer_id_registro(id_registro)
+            print("Turno registrado correctamente")
         except Exception as e:
+            conexion.rollback()
             print(f"ERROR AL REGISTRAR EL TURNO: {e}")
         finally:
             con.cerrar_conexion(conexion)
 
-    def buscar_por_id(id_registro):
+    @staticmethod
+    def guardar_turnos_lote(registros: List[RegistroDeTurno], uow: Optional[UnidadDeTrabajo] = None,
+                            informar_errores: bool = True) -> int:
+        """
+        Inserta varios turnos en una sola transacción (INSERT multi-fila vía executemany).
+        Cada RegistroDeTurno debe traer su id_empleado. Retorna las filas insertadas;
+        si algo falla hace rollback del lote y relanza el error.
+        Los resúmenes de horas reciben el delta de todo el lote en la misma transacción.
+        informar_errores=False no imprime el error (quien llama ya lo registra).
+        """
+        if not registros:
+            return 0
+        query = "INSERT INTO REGISTRODETURNO (id_empleado, fecha, cantidad_horas, tareas_realizadas) VALUES (%s, %s, %s, %s)"
+        valores = [
+            (
+                r.obtener_id_empleado(),
+                r.obtener_fecha(),
+                r.obtener_cantidad_horas(),
+                r.obtener_tareas_realizadas()
+            )
+            for r in registros
+        ]
+        conexion = con.obtener_conexion(uow)
+        try:
+            with conexion.cursor() as cursor:
+                cursor.executemany(query, valores)
+                insertados = cursor.rowcount
+                resumen_horas.aplicar_deltas(cursor, [resumen_horas.deltas_de_turno(*v[:3]) for v in valores])
+            conexion.commit()
+            return insertados
+        except Exception as e:
+            conexion.rollback()
+            if informar_errores:
+                print(f"ERROR AL REGISTRAR EL LOTE DE TURNOS: {e}")
+            raise
+        finally:
+            con.cerrar_conexion(conexion)
+
+    @staticmethod
+    def iter_turnos(tamano_bloque: int = 500) -> Iterator[List[Dict]]:
+        """Recorre todos los turnos (por id_registro) en bloques, con cursor de servidor."""
+        query = """
+            SELECT id_registro, id_empleado, fecha, cantidad_horas, tareas_realizadas
+            FROM REGISTRODETURNO
+            ORDER BY id_registro
+        """
+        yield from con.iterar_en_bloques(query, tamano_bloque=tamano_bloque)
+
+    @staticmethod
+    def iter_turnos_objetos(tamano_bloque: int = 500) -> Iterator[List[RegistroDeTurno]]:
+        """Como iter_turnos(), pero en bloques de RegistroDeTurno hidratados desde tuplas."""
+        query = f"SELECT {HIDRATADOR.columnas_sql()} FROM REGISTRODETURNO ORDER BY id_registro"
+        for bloque in con.iterar_en_bloques(query, tamano_bloque=tamano_bloque, tuplas=True):
+            yield HIDRATADOR.muchos(bloque, tuplas=True)
+
+    # ----------------------------------------------------------
+    # Agregados de horas (GROUP BY en la BD; usados por aplicacion.reportes_turnos)
+    # Las filas salen como tuplas para volcarlas directo a arreglos.
+    # Con usar_resumen=True se leen los resúmenes materializados
+    # (persistencia.resumen_horas): una fila por empleado y día/mes.
+    # ----------------------------------------------------------
+    # Clave entera del período: AAAAMMDD, semana ISO AAAASS o AAAAMM
+    EXPRESIONES_PERIODO = {
+        "dia": "YEAR(fecha) * 10000 + MONTH(fecha) * 100 + DAY(fecha)",
+        "semana": "YEARWEEK(fecha, 3)",
+        "mes": "YEAR(fecha) * 100 + MONTH(fecha)",
+    }
+
+    @staticmethod
+    def _fuente_horas(usar_resumen: bool, periodo: str, desde, hasta) -> tuple:
+        """(tabla, expresión del período, columna de horas, filtro de rango, parámetros del filtro)."""
+        expresion = registroturnoDAO.EXPRESIONES_PERIODO[periodo]
+        desde, hasta = resumen_horas._fecha_bd(desde), resumen_horas._fecha_bd(hasta)
+        if not usar_resumen:
+            # Rango semiabierto: si la columna es DATETIME, BETWEEN con fechas
+            # dejaría fuera los turnos del día `hasta` posteriores a medianoche.
+            return ("REGISTRODETURNO", expresion, "cantidad_horas",
+                    "fecha >= %s AND fecha < %s + INTERVAL 1 DAY", [desde, hasta])
+        meses_completos = (desde.day == 1 and (hasta + datetime.timedelta(days=1)).day == 1)
+        if periodo == "mes" and meses_completos:
+            return ("RESUMEN_HORAS_MES", "anio_mes", "horas", "anio_mes BETWEEN %s AND %s",
+                    [desde.year * 100 + desde.month, hasta.year * 100 + hasta.month])
+        return "RESUMEN_HORAS_DIA", expresion, "horas", "fecha BETWEEN %s AND %s", [desde, hasta]
+
+    @staticmethod
+    def iter_horas_agrupadas(periodo: str, desde, hasta, id_empleado: Optional[int] = None,
+                             minimo_horas: Optional[float] = None, usar_resumen: bool = False,
+                             tamano_bloque: int = 5000) -> Iterator[List[tuple]]:
+        """
+        Total de horas por (id_empleado, período) entre `desde` y `hasta` (inclusive).
+        Filas (id_empleado, periodo, horas) ordenadas por empleado y período.
+        Con minimo_horas solo vuelven los grupos que lo superan (HAVING).
+        """
+        if periodo not in registroturnoDAO.EXPRESIONES_PERIODO:
+            raise ValueError(f"Período inválido: {periodo!r} (dia, semana o mes).")
+        tabla, expresion, horas, filtro, params = registroturnoDAO._fuente_horas(usar_resumen, periodo, desde, hasta)
+        condiciones = [filtro]
+        if id_empleado is not None:
+            condiciones.append("id_empleado = %s")
+            params.append(id_empleado)
+        having = ""
+        if minimo_horas is not None:
+            having = f"HAVING SUM({horas}) > %s"
+            params.append(minimo_horas)
+        query = f"""
+            SELECT id_empleado, {expresion} AS periodo, SUM({horas}) AS horas
+            FROM {tabla}
+            WHERE {" AND ".join(condiciones)}
+            GROUP BY id_empleado, periodo
+            {having}
+            ORDER BY id_empleado, periodo
+        """
+        yield from con.iterar_en_bloques(query, params, tamano_bloque=tamano_bloque, tuplas=True)
+
+    @staticmethod
+    def top_empleados_por_horas(desde, hasta, n: int = 10, usar_resumen: bool = False,
+                                uow: Optional[UnidadDeTrabajo] = None) -> List[tuple]:
+        """Los `n` empleados con más horas en el rango: [(id_empleado, horas), ...] de mayor a menor."""
+        tabla, _, horas, filtro, params = registroturnoDAO._fuente_horas(usar_resumen, "mes", desde, hasta)
+        query = f"""
+            SELECT id_empleado, SUM({horas}) AS horas
+            FROM {tabla}
+            WHERE {filtro}
+            GROUP BY id_empleado
+            ORDER BY horas DESC, id_empleado
+            LIMIT %s
+        """
+        conexion = con.obtener_conexion(uow)
+        try:
+            with conexion.cursor(pymysql.cursors.Cursor) as cursor:
+                cursor.execute(query, (*params, n))
+                return list(cursor.fetchall())
+        finally:
+            con.cerrar_conexion(conexion)
+
+    @staticmethod
+    def iter_horas_por_dia_relativo(desde, hasta, id_empleado: Optional[int] = None,
+                                    usar_resumen: bool = False,
+                                    tamano_bloque: int = 20000) -> Iterator[List[tuple]]:
+        """
+        Horas por (id_empleado, día) con el día como desplazamiento entero desde `desde`
+        (DATEDIFF). Ya viene reducido por día, así las ventanas a medida se arman
+        en memoria sobre enteros sin convertir fechas fila por fila.
+        """
+        tabla, _, horas, filtro, params = registroturnoDAO._fuente_horas(usar_resumen, "dia", desde, hasta)
+        params = [resumen_horas._fecha_bd(desde)] + params
+        condiciones = [filtro]
+        if id_empleado is not None:
+            condiciones.append("id_empleado = %s")
+            params.append(id_empleado)
+        # Por el alias `dia` (DATEDIFF ignora la hora): si la columna es DATETIME
+        # sale un grupo por día y no uno por instante
+        query = f"""
+            SELECT id_empleado, DATEDIFF(fecha, %s) AS dia, SUM({horas}) AS horas
+            FROM {tabla}
+            WHERE {" AND ".join(condiciones)}
+            GROUP BY id_empleado, dia
+        """
+        yield from con.iterar_en_bloques(query, params, tamano_bloque=tamano_bloque, tuplas=True)
+
+    def buscar_por_id(id_registro, uow: Optional[UnidadDeTrabajo] = None):
         query = "SELECT * FROM REGISTRODETURNO WHERE id_registro = %s"
-        conexion = con.obtener_conexion()
+        conexion = con.obtener_conexion(uow)
         try:
             with conexion.cursor() as cursor:
                 cursor.execute(query,(id_registro,))
@@ -37,30 +221,52 @@ class registroturnoDAO:
         finally:
             con.cerrar_conexion(conexion)
     
-    def eliminar_turno(id_registro):
+    @staticmethod
+    def _turno_bloqueado(cursor, id_registro):
+        """Lee (y bloquea hasta el commit) el turno tal como está en la BD, para calcular el delta."""
+        cursor.execute(
+            "SELECT id_empleado, fecha, cantidad_horas FROM REGISTRODETURNO WHERE id_registro = %s FOR UPDATE",
+            (id_registro,),
+        )
+        return cursor.fetchone()
+
+    def eliminar_turno(id_registro, uow: Optional[UnidadDeTrabajo] = None):
         query = "DELETE FROM REGISTRODETURNO WHERE id_registro = %s"
-        conexion = con.obtener_conexion()
+        conexion = con.obtener_conexion(uow)
         try:
             with conexion.cursor() as cursor:
+                anterior = registroturnoDAO._turno_bloqueado(cursor, id_registro)
                 cursor.execute(query, (id_registro,))
-                conexion.commit()
-                print(f"REGISTRO DE TURNO CON EL ID {id_registro} ELIMINADO")
+                if anterior:
+                    resumen_horas.aplicar_deltas(cursor, [resumen_horas.deltas_de_turno(
+                        anterior["id_empleado"], anterior["fecha"], anterior["cantidad_horas"], -1)])
+            conexion.commit()
+            print(f"REGISTRO DE TURNO CON EL ID {id_registro} ELIMINADO")
         except Exception as e:
+            conexion.rollback()
             print(f"ERROR AL ELIMINAR EL TURNO: {e}")
         finally:
             con.cerrar_conexion(conexion)
     
-    def editar_turno(fecha, cantidad_horas, tareas_realizadas,id_registro):
+    def editar_turno(fecha, cantidad_horas, tareas_realizadas,id_registro,
+                     uow: Optional[UnidadDeTrabajo] = None):
         query = "UPDATE REGISTRODETURNO SET fecha = %s, cantidad_horas = %s, tareas_realizadas = %s WHERE id_registro = %s"
-        conexion = con.obtener_conexion()
+        conexion = con.obtener_conexion(uow)
         try:
             with conexion.cursor() as cursor:
+                anterior = registroturnoDAO._turno_bloqueado(cursor, id_registro)
                 cursor.execute(query,(fecha,cantidad_horas,tareas_realizadas,id_registro))
-                conexion.commit()
-                print("SE HA ACTUALIZADO CORRECTAMENTE")
+                if anterior:
+                    # Se quita el turno viejo y se suma el nuevo (puede cambiar de día o de mes)
+                    resumen_horas.aplicar_deltas(cursor, [
+                        resumen_horas.deltas_de_turno(
+                            anterior["id_empleado"], anterior["fecha"], anterior["cantidad_horas"], -1),
+                        resumen_horas.deltas_de_turno(anterior["id_empleado"], fecha, cantidad_horas),
+                    ])
+            conexion.commit()
+            print("SE HA ACTUALIZADO CORRECTAMENTE")
         except Exception as e:
+            conexion.rollback()
             print(f"ERRO AL REALIZAR CAMBIOS: {e}")
         finally:
             con.cerrar_conexion(conexion)
-
-
@@ -0,0 +1,190 @@
+# persistencia/resumen_horas.py
+# ==============================================================
+# Resúmenes materializados de horas por empleado
+# --------------------------------------------------------------
+# RESUMEN_HORAS_DIA (id_empleado, fecha) y RESUMEN_HORAS_MES
+# (id_empleado, anio_mes=AAAAMM) guardan horas y cantidad de turnos.
+# Se mantienen de forma incremental: registroturnoDAO aplica el delta
+# de cada alta / edición / baja (aplicar_deltas) con el mismo cursor y
+# en la misma transacción que el cambio en REGISTRODETURNO, así el
+# resumen nunca queda a medias.
+#
+# Los reportes leen estas tablas (un registro por empleado y día/mes)
+# en lugar de recorrer todos los turnos.
+#
+# REGISTRODETURNO.fecha puede ser DATE o DATETIME (la migración 1 usa
+# CREATE TABLE IF NOT EXISTS y respeta la tabla que ya hubiera), así que
+# todo se agrupa y se compara por DATE(fecha), nunca por la fecha cruda.
+#
+# Uso:
+#   python -m persistencia.resumen_horas verificar    # detecta diferencias
+#   python -m persistencia.resumen_horas reconstruir  # recalcula desde cero
+# ==============================================================
+
+import argparse
+import datetime
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Iterable, List
+
+from persistencia.conexion import Conexion
+
+con = Conexion()
+
+
+def _fecha_bd(fecha) -> datetime.date:
+    """El día del turno (la clave de RESUMEN_HORAS_DIA), venga como date o datetime."""
+    if isinstance(fecha, datetime.datetime):
+        return fecha.date()
+    if isinstance(fecha, datetime.date):
+        return fecha
+    return datetime.date.fromisoformat(str(fecha)[:10])
+
+def _horas_bd(horas) -> int:
+    """cantidad_horas es INT: MySQL redondea hacia afuera (7.5 -> 8), no al par."""
+    return int(Decimal(str(horas)).to_integral_value(ROUND_HALF_UP))
+
+def deltas_de_turno(id_empleado: int, fecha, cantidad_horas, signo: int = 1) -> tuple:
+    """Delta (id_empleado, fecha, horas, turnos) de sumar (signo=1) o quitar (signo=-1) un turno."""
+    return (id_empleado, _fecha_bd(fecha), signo * _horas_bd(cantidad_horas), signo)
+
+
+def aplicar_deltas(cur, deltas: Iterable[tuple]) -> None:
+    """
+    Suma los deltas (id_empleado, fecha, horas, turnos) a los resúmenes diario y mensual.
+    Se llama con el cursor de la transacción que modifica REGISTRODETURNO (no hace commit).
+    Las claves se agrupan y se ordenan para tocar cada fila una sola vez y siempre
+    en el mismo orden (menos bloqueos cruzados entre transacciones concurrentes).
+    """
+    por_dia, por_mes = {}, {}
+    for id_empleado, fecha, horas, turnos in deltas:
+        clave_mes = (id_empleado, fecha.year * 100 + fecha.month)
+        h, t = por_dia.get((id_empleado, fecha), (0, 0))
+        por_dia[(id_empleado, fecha)] = (h + horas, t + turnos)
+        h, t = por_mes.get(clave_mes, (0, 0))
+        por_mes[clave_mes] = (h + horas, t + turnos)
+
+    for tabla, columna, grupos in (("RESUMEN_HORAS_DIA", "fecha", por_dia),
+                                   ("RESUMEN_HORAS_MES", "anio_mes", por_mes)):
+        filas = [(e, p, h, t) for (e, p), (h, t) in sorted(grupos.items()) if h or t]
+        if not filas:
+            continue
+        cur.executemany(f"""
+            INSERT INTO {tabla} (id_empleado, {columna}, horas, turnos) VALUES (%s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE horas = horas + VALUES(horas), turnos = turnos + VALUES(turnos)
+        """, filas)
+        # Un día/mes sin turnos no debe quedar como fila en cero
+        vaciadas = [(e, p) for e, p, _, t in filas if t < 0]
+        if vaciadas:
+            cur.executemany(
+                f"DELETE FROM {tabla} WHERE id_empleado = %s AND {columna} = %s AND turnos <= 0",
+                vaciadas,
+            )
+
+
+# --------------------------------------------------------------
+# Reconstrucción y verificación
+# --------------------------------------------------------------
+
+_AGREGADO_DIA = """
+    SELECT id_empleado, DATE(fecha) AS fecha, SUM(cantidad_horas) AS horas, COUNT(*) AS turnos
+    FROM REGISTRODETURNO GROUP BY id_empleado, DATE(fecha)
+"""
+_AGREGADO_MES = """
+    SELECT id_empleado, YEAR(fecha) * 100 + MONTH(fecha) AS anio_mes,
+           SUM(cantidad_horas) AS horas, COUNT(*) AS turnos
+    FROM REGISTRODETURNO GROUP BY id_empleado, anio_mes
+"""
+_TABLAS = (("dia", "RESUMEN_HORAS_DIA", "fecha", _AGREGADO_DIA),
+           ("mes", "RESUMEN_HORAS_MES", "anio_mes", _AGREGADO_MES))
+
+def poblar(cur) -> None:
+    """Recalcula ambos resúmenes desde REGISTRODETURNO con el cursor dado (no hace commit)."""
+    for _, tabla, columna, agregado in _TABLAS:
+        cur.execute(f"DELETE FROM {tabla}")
+        cur.execute(f"INSERT INTO {tabla} (id_empleado, {columna}, horas, turnos) {agregado}")
+
+def reconstruir() -> Dict[str, int]:
+    """Vacía y recalcula los resúmenes en una transacción. Retorna las filas de cada uno."""
+    cx = con.obtener_conexion()
+    try:
+        with cx.cursor() as cur:
+            poblar(cur)
+            filas = {}
+            for nombre, tabla, _, _ in _TABLAS:
+                cur.execute(f"SELECT COUNT(*) AS n FROM {tabla}")
+                filas[nombre] = cur.fetchone()["n"]
+        cx.commit()
+        return filas
+    except Exception as e:
+        cx.rollback()
+        print(f"ERROR AL RECONSTRUIR LOS RESÚMENES DE HORAS: {e}")
+        raise
+    finally:
+        con.cerrar_conexion(cx)
+
+def verificar(limite: int = 100) -> Dict[str, List[Dict]]:
+    """
+    Compara los resúmenes con lo que da REGISTRODETURNO.
+    Retorna {"dia": [...], "mes": [...]} con hasta `limite` diferencias por tabla;
+    cada una trae los valores guardados (horas/turnos) y los reales (horas_reales/turnos_reales),
+    None si la fila falta de un lado.
+    """
+    diferencias = {}
+    with con.usar_conexion() as cx:
+        with cx.cursor() as cur:
+            for nombre, tabla, columna, agregado in _TABLAS:
+                cur.execute(f"""
+                    SELECT r.id_empleado, r.{columna} AS periodo, r.horas, r.turnos,
+                           t.horas AS horas_reales, t.turnos AS turnos_reales
+                    FROM {tabla} r
+                    LEFT JOIN ({agregado}) t ON t.id_empleado = r.id_empleado AND t.{columna} = r.{columna}
+                    WHERE t.id_empleado IS NULL OR t.horas <> r.horas OR t.turnos <> r.turnos
+                    UNION ALL
+                    SELECT t.id_empleado, t.{columna}, NULL, NULL, t.horas, t.turnos
+                    FROM ({agregado}) t
+                    LEFT JOIN {tabla} r ON r.id_empleado = t.id_empleado AND r.{columna} = t.{columna}
+                    WHERE r.id_empleado IS NULL
+                    LIMIT %s
+                """, (limite,))
+                diferencias[nombre] = list(cur.fetchall())
+    return diferencias
+
+
+# --------------------------------------------------------------
+# Línea de comandos
+# --------------------------------------------------------------
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Resúmenes materializados de horas por empleado.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    ver = sub.add_parser("verificar", help="Compara los resúmenes con REGISTRODETURNO.")
+    ver.add_argument("--limite", type=int, default=20, help="Diferencias a mostrar por tabla.")
+    ver.add_argument("--reparar", action="store_true", help="Reconstruye si encuentra diferencias.")
+    sub.add_parser("reconstruir", help="Recalcula los resúmenes desde cero.")
+    args = parser.parse_args(argv)
+
+    if args.comando == "reconstruir":
+        filas = reconstruir()
+        print(f"Resúmenes reconstruidos: {filas['dia']} filas diarias, {filas['mes']} mensuales.")
+        return 0
+
+    diferencias = verificar(args.limite)
+    total = 0
+    for nombre, filas in diferencias.items():
+        for f in filas:
+            print(f"❌ {nombre} empleado {f['id_empleado']} período {f['periodo']}: "
+                  f"resumen={f['horas']}h/{f['turnos']} turnos, real={f['horas_reales']}h/{f['turnos_reales']} turnos")
+        total += len(filas)
+    if not total:
+        print("Resúmenes de horas al día.")
+        return 0
+    if args.reparar:
+        reconstruir()
+        print(f"{total} diferencia(s) encontrada(s); resúmenes reconstruidos.")
+        return 0
+    print(f"{total} diferencia(s) encontrada(s). Use 'reconstruir' o 'verificar --reparar'.")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,49 @@
+# persistencia/texto_completo.py
+# ==============================================================
+# Utilidades para búsquedas FULLTEXT (MATCH ... AGAINST) en MySQL
+# --------------------------------------------------------------
+# - consulta_booleana: arma la expresión IN BOOLEAN MODE a partir del
+#   texto del usuario (cada término obligatorio y como prefijo: +term*).
+# - Los términos más cortos que innodb_ft_min_token_size (3 por defecto)
+#   no están en el índice; si no queda ninguno, la consulta no se puede
+#   responder con FULLTEXT y quien llama debe usar otra estrategia.
+# - es_error_fulltext: reconoce los errores de "no hay índice FULLTEXT"
+#   (BD sin la migración 3) para poder caer a la búsqueda alternativa.
+# - patron_prefijo: patrón LIKE 'texto%' (escapando % y _) que sí puede
+#   usar el índice sobre nombre, a diferencia de LIKE '%texto%'.
+# ==============================================================
+
+import re
+from typing import Optional
+
+import pymysql
+
+LARGO_MINIMO_TERMINO = 3
+_SEPARADORES = re.compile(r"[^\w]+", re.UNICODE)
+
+# 1191: Can't find FULLTEXT index matching the column list
+# 1214: The used table type doesn't support FULLTEXT indexes
+_ERRORES_FULLTEXT = {1191, 1214}
+
+
+def terminos(texto: str) -> list:
+    """Separa el texto en palabras (sin operadores de la sintaxis booleana)."""
+    return [t for t in _SEPARADORES.split((texto or "").lower()) if t]
+
+def consulta_booleana(texto: str) -> Optional[str]:
+    """
+    '+ana* +perez*' para "Ana Pérez". Retorna None si no queda ningún término
+    indexable (todos más cortos que LARGO_MINIMO_TERMINO).
+    """
+    validos = [t for t in terminos(texto) if len(t) >= LARGO_MINIMO_TERMINO]
+    if not validos:
+        return None
+    return " ".join(f"+{t}*" for t in validos)
+
+def patron_prefijo(texto: str) -> str:
+    """'ana%' para "ana"; los comodines que escriba el usuario se toman literales."""
+    t = (texto or "").strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{t}%"
+
+def es_error_fulltext(error: Exception) -> bool:
+    return isinstance(error, pymysql.MySQLError) and bool(error.args) and error.args[0] in _ERRORES_FULLTEXT
@@ -0,0 +1,113 @@
+# persistencia/unidad_trabajo.py
+# ==============================================================
+# Unidad de trabajo: una transacción para varias llamadas a los DAO
+# --------------------------------------------------------------
+# Cada función de los DAO pide su propia conexión y hace commit al
+# terminar. Para un flujo como "crear departamento, crear proyecto y
+# asignarle 200 empleados" eso son cientos de transacciones (y de
+# commits a disco) sin atomicidad.
+#
+# Dentro de una UnidadDeTrabajo todas las funciones que reciben `uow`
+# usan la MISMA conexión del pool; sus commit/close no hacen nada y al
+# salir del `with` se confirma todo junto (o se deshace todo si hubo
+# una excepción o algún DAO hizo rollback).
+#
+# Uso:
+#   with UnidadDeTrabajo() as uow:
+#       DepartamentoDAO.guardar_departamento(depto, uow=uow)
+#       id_proyecto = ProyectoDAO.guardar_proyecto(proyecto, uow=uow)
+#       ProyectoEmpleadoDAO.asignar(id_proyecto, ids, uow=uow)
+#
+# Los iter_* (cursor de servidor) no aceptan `uow`: mientras el cursor
+# no se lee completo la conexión no puede ejecutar otras consultas.
+#
+# Cachés: lo que hay que invalidar tras una escritura se registra con
+# uow.al_confirmar(callback) (o despues_de_confirmar(uow, callback)) y
+# se ejecuta recién después del commit. Invalidar antes dejaría que otro
+# hilo volviera a cachear filas aún sin confirmar, y tras un rollback la
+# caché quedaría con datos que nunca existieron.
+# ==============================================================
+
+from typing import Callable, Optional
+
+from persistencia.conexion import Conexion, ConexionCompartida
+
+
+class TransaccionDeshechaError(RuntimeError):
+    """La unidad terminó sin excepción pero un DAO había fallado: se deshizo todo."""
+
+
+class UnidadDeTrabajo:
+    """Context manager que comparte una conexión entre varias llamadas a los DAO."""
+
+    def __init__(self, con: Optional[Conexion] = None) -> None:
+        self._con = con or Conexion()
+        self._real = None
+        self._fallida = False
+        self._al_confirmar: list = []
+        self.conexion: Optional[ConexionCompartida] = None
+
+    def __enter__(self) -> "UnidadDeTrabajo":
+        if self._real is not None:
+            raise RuntimeError("La unidad de trabajo ya está abierta.")
+        self._real = self._con.obtener_conexion()
+        self._fallida = False
+        self._al_confirmar = []
+        self.conexion = ConexionCompartida(self._real, self._marcar_fallida)
+        return self
+
+    def __exit__(self, tipo_exc, exc, tb) -> bool:
+        real, self._real, self.conexion = self._real, None, None
+        pendientes, self._al_confirmar = self._al_confirmar, []
+        confirmar = tipo_exc is None and not self._fallida
+        try:
+            if confirmar:
+                real.commit()
+            else:
+                real.rollback()
+        except Exception:
+            self._con.descartar_conexion(real)
+            raise
+        self._con.cerrar_conexion(real)
+        if confirmar:
+            for callback in pendientes:
+                try:
+                    callback()
+                except Exception as e:
+                    # El commit ya está hecho: un fallo acá no debe deshacerlo ni ocultarlo
+                    print(f"⚠ Error al ejecutar una acción posterior al commit: {e}")
+        if tipo_exc is None and self._fallida:
+            raise TransaccionDeshechaError(
+                "Una operación de la unidad de trabajo falló; se deshicieron todos los cambios."
+            )
+        return False
+
+    def al_confirmar(self, callback: Callable[[], None]) -> None:
+        """Registra `callback()` para después del commit; si la unidad se deshace no se llama."""
+        if self._real is None:
+            raise RuntimeError("La unidad de trabajo no está abierta.")
+        self._al_confirmar.append(callback)
+
+    def _marcar_fallida(self) -> None:
+        self._fallida = True
+
+    @property
+    def activa(self) -> bool:
+        return self._real is not None
+
+    def cursor(self, *args, **kwargs):
+        """Cursor sobre la conexión de la unidad, para SQL propio dentro de la misma transacción."""
+        if self._real is None:
+            raise RuntimeError("La unidad de trabajo no está abierta.")
+        return self._real.cursor(*args, **kwargs)
+
+
+def despues_de_confirmar(uow: Optional[UnidadDeTrabajo], callback: Callable[[], None]) -> None:
+    """
+    Para los servicios: sin unidad (el DAO ya hizo su commit) llama a callback()
+    en el acto; dentro de una unidad lo deja para después de su commit.
+    """
+    if uow is None:
+        callback()
+    else:
+        uow.al_confirmar(callback)
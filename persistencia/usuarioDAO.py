@@ -4,22 +4,59 @@
 # Maneja todas las operaciones CRUD hacia la base de datos
 # ==============================================================
 
+import copy
+
 from dominio.usuario import Usuario
 from persistencia.conexion import Conexion
+from persistencia.hidratador import Hidratador
+from persistencia.unidad_trabajo import UnidadDeTrabajo
 from pymysql.err import IntegrityError
+from aplicacion import config
+from aplicacion.cache import CacheTTL
 from aplicacion.errores import DuplicadoError
 
+_HIDRATADOR = Hidratador(
+    Usuario,
+    {c: c for c in ("id", "username", "password_hash", "nombre_completo", "rol", "activo")},
+    conversores={"activo": bool},
+)
+
+
+def _clave_cache(username: str) -> str:
+    """
+    La columna username compara sin distinguir mayúsculas: "Admin" y "admin"
+    son el mismo usuario y deben compartir la entrada de la caché.
+    """
+    return (username or "").strip().casefold()
+
 
 class UsuarioDAO:
+    # Caché compartida por todas las instancias: username -> Usuario.
+    # El TTL es corto para acotar cuánto tarda en verse un cambio hecho
+    # desde otro proceso; los cambios locales se invalidan explícitamente.
+    _cache = CacheTTL(ttl=config.USUARIOS_CACHE_TTL, max_entradas=config.USUARIOS_CACHE_MAX)
+
     def __init__(self):
         self.conexion = Conexion()
 
-    def crear(self, usuario: Usuario) -> int:
+    @classmethod
+    def invalidar_cache(cls, username: str | None = None) -> None:
+        """Quita un username de la caché (o la vacía entera si no se indica)."""
+        if username is None:
+            cls._cache.limpiar()
+        else:
+            cls._cache.invalidar(_clave_cache(username))
+
+    @classmethod
+    def estadisticas_cache(cls) -> dict:
+        return cls._cache.estadisticas()
+
+    def crear(self, usuario: Usuario, uow: UnidadDeTrabajo | None = None) -> int:
         sql = """
             INSERT INTO usuarios (username, password_hash, nombre_completo, rol, activo)
             VALUES (%s, %s, %s, %s, %s)
         """
-        cx = self.conexion.obtener_conexion()
+        cx = self.conexion.obtener_conexion(uow)
         try:
             with cx.cursor() as cur:
                 cur.execute(sql, (
@@ -44,7 +81,41 @@ class UsuarioDAO:
         finally:
             self.conexion.cerrar_conexion(cx)
 
-    def modificar(self, usuario: Usuario) -> bool:
+    def crear_lote(self, usuarios: list, uow: UnidadDeTrabajo | None = None) -> int:
+        """
+        Inserta varios usuarios (con su password_hash ya calculado) en una sola
+        transacción usando executemany (INSERT multi-fila). Retorna filas insertadas.
+        """
+        if not usuarios:
+            return 0
+        sql = """
+            INSERT INTO usuarios (username, password_hash, nombre_completo, rol, activo)
+            VALUES (%s, %s, %s, %s, %s)
+        """
+        valores = [
+            (u.username, u.password_hash, u.nombre_completo, u.rol, int(bool(u.activo)))
+            for u in usuarios
+        ]
+        cx = self.conexion.obtener_conexion(uow)
+        try:
+            with cx.cursor() as cur:
+                cur.executemany(sql, valores)
+                insertados = cur.rowcount
+            cx.commit()
+            return insertados
+        except IntegrityError as e:
+            cx.rollback()
+            if getattr(e, "args", [None])[0] == 1062:
+                raise DuplicadoError("username", "(lote)")
+            raise
+        except Exception as e:
+            cx.rollback()
+            print(f"Error al crear lote de usuarios: {e}")
+            raise
+        finally:
+            self.conexion.cerrar_conexion(cx)
+
+    def modificar(self, usuario: Usuario, uow: UnidadDeTrabajo | None = None) -> bool:
         sql = """
             UPDATE usuarios
             SET username = %s,
@@ -54,7 +125,7 @@ class UsuarioDAO:
                 activo = %s
             WHERE id = %s
         """
-        cx = self.conexion.obtener_conexion()
+        cx = self.conexion.obtener_conexion(uow)
         try:
             with cx.cursor() as cur:
                 cur.execute(sql, (
@@ -79,9 +150,29 @@ class UsuarioDAO:
         finally:
             self.conexion.cerrar_conexion(cx)
 
-    def eliminar(self, id_usuario: int) -> bool:
+    def actualizar_password_hash(self, id_usuario: int, hash_nuevo: str, hash_anterior: str,
+                                 uow: UnidadDeTrabajo | None = None) -> bool:
+        """
+        Reemplaza el hash solo si sigue siendo `hash_anterior`, para no pisar
+        un cambio de contraseña hecho mientras tanto. Retorna True si actualizó.
+        """
+        sql = "UPDATE usuarios SET password_hash = %s WHERE id = %s AND password_hash = %s"
+        cx = self.conexion.obtener_conexion(uow)
+        try:
+            with cx.cursor() as cur:
+                cur.execute(sql, (hash_nuevo, id_usuario, hash_anterior))
+                cx.commit()
+                return cur.rowcount > 0
+        except Exception as e:
+            cx.rollback()
+            print(f"Error al actualizar hash de usuario: {e}")
+            raise
+        finally:
+            self.conexion.cerrar_conexion(cx)
+
+    def eliminar(self, id_usuario: int, uow: UnidadDeTrabajo | None = None) -> bool:
         sql = "DELETE FROM usuarios WHERE id = %s"
-        cx = self.conexion.obtener_conexion()
+        cx = self.conexion.obtener_conexion(uow)
         try:
             with cx.cursor() as cur:
                 cur.execute(sql, (id_usuario,))
@@ -94,63 +185,63 @@ class UsuarioDAO:
         finally:
             self.conexion.cerrar_conexion(cx)
 
-    def listar_todos(self):
+    def listar_todos(self, uow: UnidadDeTrabajo | None = None):
         sql = "SELECT id, username, password_hash, nombre_completo, rol, activo FROM usuarios ORDER BY id"
-        cx = self.conexion.obtener_conexion()
+        cx = self.conexion.obtener_conexion(uow)
         try:
             with cx.cursor() as cur:
                 cur.execute(sql)
                 filas = cur.fetchall()
-                return [
-                    Usuario(
-                        id=f["id"],
-                        username=f["username"],
-                        password_hash=f["password_hash"],
-                        nombre_completo=f["nombre_completo"],
-                        rol=f["rol"],
-                        activo=f["activo"],
-                    )
-                    for f in filas
-                ]
+                return _HIDRATADOR.muchos(filas)
         finally:
             self.conexion.cerrar_conexion(cx)
 
-    def obtener_por_username(self, username: str):
-        sql = "SELECT * FROM usuarios WHERE username = %s"
-        cx = self.conexion.obtener_conexion()
+    def iter_usuarios(self, tamano_bloque: int = 500):
+        """Recorre la tabla usuarios en bloques de dicts (cursor de servidor, memoria constante)."""
+        sql = "SELECT id, username, password_hash, nombre_completo, rol, activo FROM usuarios ORDER BY id"
+        yield from self.conexion.iterar_en_bloques(sql, tamano_bloque=tamano_bloque)
+
+    def obtener_por_username(self, username: str, usar_cache: bool = True,
+                             uow: UnidadDeTrabajo | None = None):
+        """
+        Usuario (incluido su password_hash) o None. Una sola consulta; con
+        `usar_cache` se sirve desde la caché mientras no venza el TTL.
+        Se retorna una copia para que quien la modifique no altere la caché.
+        Dentro de una unidad de trabajo se consulta siempre la BD (ve sus cambios sin confirmar).
+        """
+        if uow is not None:
+            return self._consultar_por_username(username, uow)
+        if usar_cache and self._cache.ttl > 0:
+            clave = _clave_cache(username)
+            user = self._cache.obtener(clave)
+            if user is None:
+                user = self._consultar_por_username(username)
+                if user is not None:
+                    self._cache.guardar(clave, user)
+            return copy.copy(user) if user is not None else None
+        return self._consultar_por_username(username)
+
+    def _consultar_por_username(self, username: str, uow: UnidadDeTrabajo | None = None):
+        sql = (
+            "SELECT id, username, password_hash, nombre_completo, rol, activo "
+            "FROM usuarios WHERE username = %s"
+        )
+        cx = self.conexion.obtener_conexion(uow)
         try:
             with cx.cursor() as cur:
                 cur.execute(sql, (username,))
                 f = cur.fetchone()
-                if f:
-                    return Usuario(
-                        id=f["id"],
-                        username=f["username"],
-                        password_hash=f["password_hash"],
-                        nombre_completo=f["nombre_completo"],
-                        rol=f["rol"],
-                        activo=f["activo"],
-                    )
-                return None
+                return _HIDRATADOR.desde_dict(f) if f else None
         finally:
             self.conexion.cerrar_conexion(cx)
 
-    def buscar_por_id(self, id_usuario: int):
+    def buscar_por_id(self, id_usuario: int, uow: UnidadDeTrabajo | None = None):
         sql = "SELECT * FROM usuarios WHERE id = %s"
-        cx = self.conexion.obtener_conexion()
+        cx = self.conexion.obtener_conexion(uow)
         try:
             with cx.cursor() as cur:
                 cur.execute(sql, (id_usuario,))
                 f = cur.fetchone()
-                if f:
-                    return Usuario(
-                        id=f["id"],
-                        username=f["username"],
-                        password_hash=f["password_hash"],
-                        nombre_completo=f["nombre_completo"],
-                        rol=f["rol"],
-                        activo=f["activo"],
-                    )
-                return None
+                return _HIDRATADOR.desde_dict(f) if f else None
         finally:
             self.conexion.cerrar_conexion(cx)
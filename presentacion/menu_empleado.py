@@ -1,6 +1,8 @@
 # presentacion/menu_empleado.py
 from typing import List, Dict, Optional
 from persistencia import empleadoDAO      # << importa tu DAO como módulo
+from aplicacion import gestion_empleado
+from presentacion.paginacion import navegar_paginas
 import importlib
 
 def _pausar():
@@ -114,13 +116,11 @@ def menu_empleado():
             _pausar()
 
         elif op == "3":
-            rows = empleadoDAO.listar_empleados()
-            _imprimir_listado(rows)
-            _pausar()
+            navegar_paginas(gestion_empleado.listar_empleados, "id_empleado", _imprimir_listado)
 
         elif op == "4":
             nombre = input("Nombre (o parte): ").strip()
-            rows = empleadoDAO.buscar_empleados_por_nombre(nombre)
+            rows = gestion_empleado.buscar_empleados(nombre)
             _imprimir_listado(rows)
             _pausar()
 
@@ -137,7 +137,7 @@ def menu_empleado():
 
             datos_edit = _input_edicion_con_defaults(det)
             try:
-                affected = empleadoDAO.editar_empleado_por_id(
+                affected = gestion_empleado.editar_empleado(
                     _id,
                     datos_edit[0],  # nombre
                     datos_edit[1],  # direccion
@@ -168,7 +168,7 @@ def menu_empleado():
             conf = input("¿Confirmas? (s/n): ").strip().lower()
             if conf in ("s", "si", "y", "yes"):
                 try:
-                    affected = empleadoDAO.eliminar_empleado_por_id(_id)
+                    affected = gestion_empleado.eliminar_empleado(_id)
                     print(" Eliminado." if affected else "⚠ No se eliminó ninguna fila.")
                 except Exception as e:
                     print(f" Error al eliminar: {e}")
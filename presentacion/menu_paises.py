@@ -5,6 +5,20 @@
 
 from api.api_paises import ApiPaisesService
 
+MAX_RESULTADOS = 20
+
+# Servicio compartido entre entradas al menú: el índice de países se
+# descarga una sola vez por proceso y no en cada visita.
+_service: ApiPaisesService | None = None
+
+def _obtener_service() -> ApiPaisesService:
+    global _service
+    if _service is None:
+        _service = ApiPaisesService()
+    if _service.indice is None and not _service.cargar_indice():
+        print("(No se pudo precargar el listado de países; se consultará la API en cada búsqueda.)")
+    return _service
+
 def _pausar():
     input("\nPresiona ENTER para continuar...")
 
@@ -24,7 +38,8 @@ def _imprimir_detalle(p: dict):
     print(f"Mapa (Google)    : {p['mapa_google']}")
 
 def menu_paises():
-    service = ApiPaisesService()
+    # Cargamos todos los países una vez; si no se puede, se consulta la API en cada búsqueda
+    service = _obtener_service()
 
     while True:
         print("\n==============================")
@@ -39,14 +54,14 @@ def menu_paises():
         if op == "1":
             nombre = input("Nombre del país (puede ser parcial, ej. 'chi'): ").strip()
             full = input("Coincidencia exacta? (s/n): ").strip().lower() == "s"
-            paises = service.buscar_por_nombre(nombre, full=full)
+            paises = service.buscar_por_nombre(nombre, full=full, limite=MAX_RESULTADOS)
             if not paises:
                 print("❌ No se encontraron países.")
                 _pausar(); continue
 
             # Si hay varios, listar breve y permitir elegir uno para detalle
             print("\nResultados:")
-            to_show = min(20, len(paises))
+            to_show = min(MAX_RESULTADOS, len(paises))
             for i in range(to_show):
                 p = paises[i]
                 print(f"{i+1:>2}) {p['nombre_comun']} ({p['codigo_cca3']}) - {p['region']}")
@@ -4,6 +4,8 @@ print(">> menudepartamento (con opciones 5 y 6) cargado desde:", __file__)
 from aplicacion.gestiondepartamento import gestiondepartamento
 from dominio.departamento import Departamento  # para el Enum
 
+TAMANO_PAGINA = 20
+
 def _pausar():
     input("\nPresiona ENTER para continuar...")
 
@@ -13,7 +15,23 @@ def _imprimir_listado(rows):
         return
     print("\n--- Listado de departamentos ---")
     for r in rows:
-        print(f"[{r.get('id_departamento')}] {r.get('nombre')} | {r.get('tipo_departamento')}")
+        linea = f"[{r.get('id_departamento')}] {r.get('nombre')} | {r.get('tipo_departamento')}"
+        if "empleados" in r:
+            linea += f" | {r['empleados']} empleado(s) | salarios: {r['total_salarios']:,.0f}"
+        print(linea)
+
+def _listar_paginado(bloques):
+    """Muestra los bloques de un iter_* de a una página, pidiendo confirmación para seguir."""
+    hubo_filas = False
+    for n, bloque in enumerate(bloques, start=1):
+        hubo_filas = True
+        _imprimir_listado(bloque)
+        seguir = input(f"\nPágina {n}. ENTER para ver más, 'q' para terminar: ").strip().lower()
+        if seguir == "q":
+            bloques.close()  # libera el cursor de servidor
+            break
+    if not hubo_filas:
+        _imprimir_listado([])
 
 def _seleccionar_tipo_departamento() -> Departamento.TipoDepartamento:
     print("Seleccione el tipo de departamento:")
@@ -52,6 +70,8 @@ def menudepartamento():
         print("4. Buscar Departamento por ID")
         print("5. Listar todos los Departamentos")   
         print("6. Buscar Departamentos por nombre") 
+        print("7. Asignar empleados a un Departamento")
+        print("8. Ver empleados de un Departamento")
         print("0. Volver")
         print("------------------------------------------------------------")
 
@@ -89,16 +109,42 @@ def menudepartamento():
             _pausar()
 
         elif opcion == "5":  # ← LISTAR TODOS
-            rows = gestiondepartamento.listar_departamentos()
-            _imprimir_listado(rows)
-            _pausar()
+            _listar_paginado(gestiondepartamento.iter_departamentos_con_resumen(TAMANO_PAGINA))
 
         elif opcion == "6":  # ← BUSCAR POR NOMBRE
             nombre = input("Ingrese nombre (o parte): ").strip()
-            rows = gestiondepartamento.buscar_departamentos_por_nombre(nombre)
+            rows = gestiondepartamento.buscar_departamentos(nombre)
             _imprimir_listado(rows)
             _pausar()
 
+        elif opcion == "7":
+            id_depto = _leer_id("Ingrese ID del departamento: ")
+            texto = input("IDs de empleados separados por coma (ej. 3,7,12): ").strip()
+            try:
+                ids = [int(p) for p in texto.replace(" ", "").split(",") if p]
+            except ValueError:
+                ids = []
+            if not ids:
+                print("Debes ingresar al menos un ID numérico.")
+            else:
+                try:
+                    n = gestiondepartamento.asignar_empleados(id_depto, ids)
+                    print(f"✔ {n} empleado(s) movido(s) al departamento.")
+                except ValueError as e:
+                    print(f"❌ {e}")
+            _pausar()
+
+        elif opcion == "8":
+            id_depto = _leer_id("Ingrese ID del departamento: ")
+            rows = gestiondepartamento.empleados_del_departamento(id_depto)
+            if not rows:
+                print("\nEl departamento no tiene empleados.")
+            else:
+                print(f"\n--- Empleados del departamento {id_depto} ---")
+                for r in rows:
+                    print(f"[{r['id_empleado']}] {r['nombre']} | {r['tipoempleado']} | {r['salario']:,.0f}")
+            _pausar()
+
         elif opcion == "0":
             print("Volviendo al menú principal...")
             break
@@ -1,5 +1,6 @@
 # presentacion/menuproyecto.py
 from aplicacion.gestionproyecto import gestionProyecto
+from presentacion.paginacion import navegar_paginas
 from datetime import datetime
 
 def _pausar():
@@ -15,6 +16,14 @@ def _imprimir_listado(rows):
         fi_txt = fi.strftime("%Y-%m-%d") if hasattr(fi, "strftime") else (fi or "")
         print(f"[{r.get('id_proyecto')}] {r.get('nombre')} | {r.get('descripcion') or ''} | Inicio: {fi_txt}")
 
+def _leer_ids(mensaje: str):
+    """Lee ids separados por coma; None si alguno no es un número."""
+    texto = input(mensaje).strip()
+    try:
+        return [int(p) for p in texto.replace(" ", "").split(",") if p]
+    except ValueError:
+        return None
+
 def menu_proyecto():
     while True:
         print("------------------------------------------------------------")
@@ -23,6 +32,9 @@ def menu_proyecto():
         print("3. Eliminar Proyecto")
         print("4. Listar TODOS los proyectos")          #   NUEVO
         print("5. Buscar proyectos por NOMBRE")         #   NUEVO
+        print("6. Asignar empleados a un proyecto")
+        print("7. Quitar empleados de un proyecto")
+        print("8. Ver empleados de un proyecto")
         print("0. Volver")
         print("------------------------------------------------------------")
         try:
@@ -77,16 +89,47 @@ def menu_proyecto():
             _pausar()
 
         elif opcion == 4:  #   LISTAR TODOS
-            rows = gestionProyecto.listar_todos()
-            _imprimir_listado(rows)
-            _pausar()
+            navegar_paginas(gestionProyecto.listar_todos, "id_proyecto", _imprimir_listado)
 
         elif opcion == 5:  #   BUSCAR POR NOMBRE
             nombre = input("Nombre (o parte): ").strip()
-            rows = gestionProyecto.buscar_por_nombre(nombre)
+            rows = gestionProyecto.buscar(nombre)
             _imprimir_listado(rows)
             _pausar()
 
+        elif opcion in (6, 7):
+            try:
+                id_proyecto = int(input("Ingrese el ID del proyecto: ").strip())
+            except ValueError:
+                print("ID inválido."); _pausar(); continue
+            ids = _leer_ids("IDs de empleados separados por coma (ej. 3,7,12): ")
+            if not ids:
+                print("Debes ingresar al menos un ID numérico."); _pausar(); continue
+            try:
+                if opcion == 6:
+                    n = gestionProyecto.asignar_empleados(id_proyecto, ids)
+                    print(f"✔ {n} empleado(s) asignado(s) ({len(set(ids)) - n} ya estaban).")
+                else:
+                    n = gestionProyecto.desasignar_empleados(id_proyecto, ids)
+                    print(f"✔ {n} empleado(s) quitado(s) del proyecto.")
+            except ValueError as e:
+                print(f"❌ {e}")
+            _pausar()
+
+        elif opcion == 8:
+            try:
+                id_proyecto = int(input("Ingrese el ID del proyecto: ").strip())
+            except ValueError:
+                print("ID inválido."); _pausar(); continue
+            rows = gestionProyecto.empleados_del_proyecto(id_proyecto)
+            if not rows:
+                print("\nEl proyecto no tiene empleados asignados.")
+            else:
+                print(f"\n--- Empleados del proyecto {id_proyecto} ---")
+                for r in rows:
+                    print(f"[{r['id_empleado']}] {r['nombre']} | {r.get('usuario') or ''} | {r.get('tipo_empleado') or ''}")
+            _pausar()
+
         elif opcion == 0:
             break
 
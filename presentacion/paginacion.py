@@ -0,0 +1,44 @@
+# presentacion/paginacion.py
+# ==============================================================
+# Navegación por páginas (keyset) compartida por los menús
+# ==============================================================
+
+TAMANO_PAGINA = 20
+
+def navegar_paginas(obtener_pagina, clave_id: str, imprimir_listado, tamano_pagina: int = TAMANO_PAGINA):
+    """
+    Navegación por páginas (keyset): [s]iguiente, [a]nterior, [q] salir.
+    `obtener_pagina(after_nombre, after_id, limit)` devuelve la página que sigue al cursor.
+    `imprimir_listado(rows)` muestra una página (cada menú tiene su formato).
+    Se guarda una pila con el cursor de inicio de cada página visitada,
+    así volver atrás no necesita OFFSET.
+    """
+    cursores = [(None, None)]
+    while True:
+        after_nombre, after_id = cursores[-1]
+        # Pedimos una fila extra solo para saber si existe página siguiente
+        rows = obtener_pagina(after_nombre, after_id, tamano_pagina + 1)
+        hay_siguiente = len(rows) > tamano_pagina
+        rows = rows[:tamano_pagina]
+        imprimir_listado(rows)
+        if not hay_siguiente and len(cursores) == 1:
+            input("\nPresiona ENTER para continuar...")
+            return
+
+        opciones = []
+        if hay_siguiente:
+            opciones.append("[s] siguiente")
+        if len(cursores) > 1:
+            opciones.append("[a] anterior")
+        opciones.append("[q] salir")
+        op = input(f"\nPágina {len(cursores)}. {'  '.join(opciones)}: ").strip().lower()
+
+        if op == "s" and hay_siguiente:
+            ultimo = rows[-1]
+            cursores.append((ultimo["nombre"], ultimo[clave_id]))
+        elif op == "a" and len(cursores) > 1:
+            cursores.pop()
+        elif op == "q":
+            return
+        else:
+            print("Opción no válida.")
@@ -0,0 +1,74 @@
+# tests/test_analitica_empleados.py
+# TablaEmpleados por el camino en Python puro (sin NumPy).
+
+import datetime
+import math
+
+import pytest
+
+from aplicacion import analitica_empleados
+from aplicacion.analitica_empleados import SIN_FECHA, TablaEmpleados, _dias
+
+HOY = datetime.date(2024, 1, 1)
+
+
+@pytest.fixture(autouse=True)
+def sin_numpy(monkeypatch):
+    monkeypatch.setattr(analitica_empleados, "_numpy", lambda: None)
+
+
+@pytest.fixture
+def tabla():
+    t = TablaEmpleados(categorias=["Gerente", "Operario"])
+    t.agregar_bloque([
+        (1, 1000.0, _dias(datetime.date(2023, 7, 1)), "Gerente"),
+        (2, 2000.0, _dias(datetime.date(2020, 1, 1)), "Gerente"),
+        (3, 3000.0, _dias(datetime.date(2010, 1, 1)), "Gerente"),
+        (4, 500.0, None, "Operario"),
+        (5, 800.0, _dias(datetime.date(2018, 1, 1)), "Becario"),
+    ])
+    return t
+
+
+def test_agregar_bloque(tabla):
+    assert len(tabla) == 5
+    assert tabla.categorias == ["Gerente", "Operario", "Becario"]
+    assert tabla.inicio[3] == SIN_FECHA
+
+
+def test_antiguedad(tabla):
+    anios = tabla.antiguedad_anios(HOY)
+    assert anios[0] == pytest.approx(0.5, abs=0.01)
+    assert math.isnan(anios[3])
+
+
+def test_filtrar(tabla):
+    assert list(tabla.filtrar(tipo="Gerente", salario_min=1500).id) == [2, 3]
+    assert list(tabla.filtrar(salario_max=900).id) == [4, 5]
+    assert list(tabla.filtrar(inicio_hasta=datetime.date(2019, 1, 1)).id) == [3, 5]
+    assert len(tabla.filtrar(tipo="No existe")) == 0
+
+
+def test_estadisticas_salario_por_tipo(tabla):
+    stats = tabla.estadisticas_salario_por_tipo()
+    assert set(stats) == {"Gerente", "Operario", "Becario"}
+    g = stats["Gerente"]
+    assert (g["cantidad"], g["suma"], g["media"], g["minimo"], g["maximo"]) == (3, 6000.0, 2000.0, 1000.0, 3000.0)
+    assert g["p50"] == 2000.0
+    assert g["p90"] == pytest.approx(2800.0)
+
+
+def test_histograma_antiguedad(tabla):
+    h = tabla.histograma_antiguedad(hoy=HOY)
+    assert h["tramos"] == ["0-1", "1-2", "2-5", "5-10", "10-20", "20+"]
+    assert h["conteos"] == [1, 0, 1, 1, 1, 0]
+    assert h["sin_fecha"] == 1
+
+    por_tipo = tabla.histograma_antiguedad(hoy=HOY, por_tipo=True)["conteos"]
+    assert por_tipo["Gerente"] == [1, 0, 1, 0, 1, 0]
+    assert por_tipo["Becario"] == [0, 0, 0, 1, 0, 0]
+
+
+def test_a_numpy_exige_numpy(tabla):
+    with pytest.raises(RuntimeError):
+        tabla.a_numpy()
@@ -0,0 +1,114 @@
+# tests/test_api_paises.py
+# ApiPaisesService contra un servidor HTTP local de prueba: revalidación
+# con ETag (304) y uso de la copia vencida cuando la API falla.
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from api.api_paises import ApiPaisesService
+from api.cache_api import CacheRespuestas
+
+CHILE = [{"name": {"common": "Chile", "official": "Republic of Chile"},
+          "cca2": "CL", "cca3": "CHL", "region": "Americas", "capital": ["Santiago"]}]
+ETAG = '"v1"'
+
+
+class ServidorFalso(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), Manejador)
+        self.peticiones = []   # (ruta, If-None-Match)
+        self.estado = 200      # 200 normal; 500 para simular la API caída
+
+
+class Manejador(BaseHTTPRequestHandler):
+    def do_GET(self):
+        srv = self.server
+        srv.peticiones.append((self.path, self.headers.get("If-None-Match")))
+        if srv.estado != 200:
+            self.send_response(srv.estado)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if not self.path.startswith("/alpha/CL"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        cuerpo = json.dumps(CHILE).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def servidor():
+    srv = ServidorFalso()
+    hilo = threading.Thread(target=srv.serve_forever, daemon=True)
+    hilo.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    # ttl=0: toda entrada guardada ya está vencida y obliga a revalidar
+    c = CacheRespuestas(str(tmp_path), ttl=0)
+    yield c
+    c.cerrar()
+
+
+def _servicio(servidor, cache):
+    host, puerto = servidor.server_address
+    return ApiPaisesService(f"http://{host}:{puerto}", cache=cache, timeout=2, reintentos=0, backoff=0)
+
+
+def test_revalida_con_etag_y_usa_la_copia_ante_304(servidor, cache):
+    service = _servicio(servidor, cache)
+    assert service.buscar_por_codigo("CL")["nombre_comun"] == "Chile"
+    assert service.buscar_por_codigo("CL")["nombre_comun"] == "Chile"
+    assert [inm for _, inm in servidor.peticiones] == [None, ETAG]
+
+
+def test_entrada_fresca_no_llama_a_la_red(servidor, tmp_path):
+    cache = CacheRespuestas(str(tmp_path), ttl=3600)
+    try:
+        service = _servicio(servidor, cache)
+        service.buscar_por_codigo("CL")
+        service.buscar_por_codigo("CL")
+        assert len(servidor.peticiones) == 1
+    finally:
+        cache.cerrar()
+
+
+def test_api_caida_devuelve_la_copia_vencida(servidor, cache, capsys):
+    service = _servicio(servidor, cache)
+    service.buscar_por_codigo("CL")
+    servidor.estado = 500
+    assert service.buscar_por_codigo("CL")["nombre_comun"] == "Chile"
+    assert "datos guardados en caché" in capsys.readouterr().out
+
+
+def test_sin_red_y_sin_copia_retorna_none(servidor, cache):
+    servidor.estado = 500
+    assert _servicio(servidor, cache).buscar_por_codigo("CL") is None
+
+
+def test_404_no_se_confunde_con_error(servidor, cache):
+    assert _servicio(servidor, cache).buscar_por_codigo("ZZ") is None
@@ -0,0 +1,123 @@
+# tests/test_busqueda.py
+# IndiceNgramas y el orden de estrategias de BuscadorTexto (DAO reemplazado por funciones de prueba).
+
+import pymysql
+import pytest
+
+from aplicacion.busqueda import BuscadorTexto, IndiceNgramas, normalizar
+
+FILAS = [
+    {"id": 1, "nombre": "Ana Pérez", "correo": "ana@empresa.cl"},
+    {"id": 2, "nombre": "Pedro Soto", "correo": "psoto@empresa.cl"},
+    {"id": 3, "nombre": "Juan Gómez", "correo": "juan@empresa.cl"},
+]
+
+
+@pytest.fixture
+def indice():
+    i = IndiceNgramas({"nombre": 3, "correo": 1}, "id")
+    for f in FILAS:
+        i.agregar(f)
+    return i
+
+
+def _ids(filas):
+    return [f["id"] for f in filas]
+
+
+def test_normalizar():
+    assert normalizar("Pérez GÓMEZ") == "perez gomez"
+
+
+def test_sin_tildes_y_por_prefijo(indice):
+    assert _ids(indice.buscar("perez"))[0] == 1
+    assert _ids(indice.buscar("ped"))[0] == 2
+
+
+def test_tolera_errores_de_tipeo(indice):
+    assert _ids(indice.buscar("gomes"))[0] == 3
+
+
+def test_fragmento_de_palabra(indice):
+    assert 1 in _ids(indice.buscar("erez"))
+
+
+def test_agregar_reemplaza_y_eliminar_quita(indice):
+    indice.agregar({"id": 2, "nombre": "Pedro Rojas", "correo": "projas@empresa.cl"})
+    assert len(indice) == 3
+    assert 2 not in _ids(indice.buscar("soto"))
+    indice.eliminar(2)
+    assert 2 not in _ids(indice.buscar("pedro"))
+    assert len(indice) == 2
+
+
+def test_limite_y_relevancia(indice):
+    filas = indice.buscar("empresa", limite=2)
+    assert len(filas) == 2
+    assert all("relevancia" in f for f in filas)
+
+
+class DAOFalso:
+    """Hace de DAO: registra qué estrategia se usó en cada búsqueda."""
+
+    def __init__(self, fulltext=None, error=None):
+        self.llamadas = []
+        self._fulltext = fulltext or []
+        self._error = error
+
+    def buscar_fulltext(self, texto, limite):
+        self.llamadas.append("fulltext")
+        if self._error is not None:
+            raise self._error
+        return self._fulltext
+
+    def buscar_prefijo(self, texto, limite):
+        self.llamadas.append("prefijo")
+        return [f for f in FILAS if normalizar(f["nombre"]).startswith(normalizar(texto))][:limite]
+
+    def cargar_bloques(self, tamano):
+        self.llamadas.append("carga")
+        yield list(FILAS)
+
+    def cargar_fila(self, id_):
+        return next((f for f in FILAS if f["id"] == id_), None)
+
+
+def _buscador(dao):
+    return BuscadorTexto("prueba", dao.buscar_fulltext, dao.buscar_prefijo, dao.cargar_bloques,
+                         dao.cargar_fila, "id", {"nombre": 3, "correo": 1})
+
+
+def test_fulltext_con_resultados_no_usa_otra_estrategia():
+    dao = DAOFalso(fulltext=[dict(FILAS[0], relevancia=1.0)])
+    assert _ids(_buscador(dao).buscar("ana")) == [1]
+    assert dao.llamadas == ["fulltext"]
+
+
+def test_sin_resultados_fulltext_busca_por_prefijo():
+    dao = DAOFalso()
+    filas = _buscador(dao).buscar("ped")
+    assert _ids(filas) == [2] and filas[0]["relevancia"] == 0.0
+    assert dao.llamadas == ["fulltext", "prefijo"]
+
+
+def test_sin_prefijos_usa_ngramas():
+    dao = DAOFalso()
+    assert _ids(_buscador(dao).buscar("erez"))[0] == 1
+    assert dao.llamadas == ["fulltext", "prefijo", "carga"]
+
+
+def test_error_fulltext_usa_ngramas_y_espera_para_reintentar():
+    dao = DAOFalso(error=pymysql.err.InternalError(1191, "Can't find FULLTEXT index"))
+    buscador = _buscador(dao)
+    assert _ids(buscador.buscar("juan"))[0] == 3
+    assert not buscador.fulltext_disponible
+    buscador.buscar("ana")
+    assert dao.llamadas.count("fulltext") == 1   # no se reintenta antes del plazo
+    assert dao.llamadas.count("carga") == 1      # el índice se arma una sola vez
+
+
+def test_otros_errores_se_propagan():
+    dao = DAOFalso(error=RuntimeError("se cayó la BD"))
+    with pytest.raises(RuntimeError):
+        _buscador(dao).buscar("ana")
@@ -0,0 +1,114 @@
+# tests/test_cache.py
+# CacheTTL (TTL + LRU) y bloques_con_cache, sin BD.
+
+import pytest
+
+from aplicacion import cache as modulo_cache
+from aplicacion.cache import CacheTTL, bloques_con_cache
+
+
+class Reloj:
+    """Reemplazo de time.monotonic que solo avanza cuando el test lo pide."""
+
+    def __init__(self) -> None:
+        self.ahora = 1000.0
+
+    def __call__(self) -> float:
+        return self.ahora
+
+
+@pytest.fixture
+def reloj(monkeypatch):
+    r = Reloj()
+    monkeypatch.setattr(modulo_cache.time, "monotonic", r)
+    return r
+
+
+def test_guardar_y_obtener(reloj):
+    c = CacheTTL(ttl=10)
+    c.guardar("a", 1)
+    assert c.obtener("a") == 1
+    assert c.obtener("b", "defecto") == "defecto"
+    stats = c.estadisticas()
+    assert (stats["aciertos"], stats["fallos"], stats["entradas"]) == (1, 1, 1)
+
+
+def test_vence_por_ttl(reloj):
+    c = CacheTTL(ttl=10)
+    c.guardar("a", 1)
+    reloj.ahora += 9.9
+    assert c.obtener("a") == 1
+    reloj.ahora += 0.2
+    assert c.obtener("a") is None
+    assert c.estadisticas()["entradas"] == 0
+
+
+def test_descarta_la_menos_usada(reloj):
+    c = CacheTTL(ttl=10, max_entradas=2)
+    c.guardar("a", 1)
+    c.guardar("b", 2)
+    c.obtener("a")          # "b" queda como la menos usada
+    c.guardar("c", 3)
+    assert c.obtener("b") is None
+    assert c.obtener("a") == 1 and c.obtener("c") == 3
+
+
+def test_obtener_o_cargar_llama_una_vez(reloj):
+    c = CacheTTL(ttl=10)
+    llamadas = []
+
+    def cargar():
+        llamadas.append(1)
+        return "valor"
+
+    assert c.obtener_o_cargar("k", cargar) == "valor"
+    assert c.obtener_o_cargar("k", cargar) == "valor"
+    assert len(llamadas) == 1
+
+
+def test_invalidar_si(reloj):
+    c = CacheTTL()
+    for clave in [("id", 1), ("id", 2), ("pagina", None, None, 20), ("todos",)]:
+        c.guardar(clave, clave)
+    assert c.invalidar_si(lambda clave: clave[0] != "id") == 2
+    assert c.obtener(("id", 1)) == ("id", 1)
+    assert c.obtener(("todos",)) is None
+
+
+def test_max_entradas_invalido():
+    with pytest.raises(ValueError):
+        CacheTTL(max_entradas=0)
+
+
+def _generador(filas, llamadas):
+    def generar(tamano_bloque):
+        llamadas.append(tamano_bloque)
+        for i in range(0, len(filas), tamano_bloque):
+            yield filas[i:i + tamano_bloque]
+    return generar
+
+
+def test_bloques_con_cache_guarda_listados_chicos(reloj):
+    c = CacheTTL()
+    filas = [{"id": i} for i in range(5)]
+    llamadas = []
+    generar = _generador(filas, llamadas)
+
+    primera = [f for b in bloques_con_cache(c, "todos", generar, 2, max_filas=10) for f in b]
+    segunda = [f for b in bloques_con_cache(c, "todos", generar, 2, max_filas=10) for f in b]
+    assert primera == segunda == filas
+    assert len(llamadas) == 1
+
+    # Se entregan copias: modificar el resultado no altera la caché
+    segunda[0]["id"] = 99
+    tercera = [f for b in bloques_con_cache(c, "todos", generar, 2, max_filas=10) for f in b]
+    assert tercera[0]["id"] == 0
+
+
+def test_bloques_con_cache_no_guarda_listados_grandes(reloj):
+    c = CacheTTL()
+    llamadas = []
+    generar = _generador([{"id": i} for i in range(5)], llamadas)
+    for _ in range(2):
+        list(bloques_con_cache(c, "todos", generar, 2, max_filas=3))
+    assert len(llamadas) == 2
@@ -0,0 +1,54 @@
+# tests/test_importacion_lotes.py
+# importar_por_lotes: validación por fila, lotes y reintento fila por fila.
+
+import pytest
+
+from aplicacion.importacion_lotes import importar_por_lotes
+
+
+def _convertir(fila):
+    if fila < 0:
+        raise ValueError(f"valor negativo: {fila}")
+    return fila
+
+
+class InsertarFalso:
+    """insertar_lote de prueba: rechaza (como la BD) todo lote que contenga `malo`."""
+
+    def __init__(self, malo=None):
+        self.malo = malo
+        self.lotes = []
+
+    def __call__(self, objetos):
+        self.lotes.append(list(objetos))
+        if self.malo in objetos:
+            raise RuntimeError("Duplicate entry")
+        return len(objetos)
+
+
+def test_todo_valido():
+    insertar = InsertarFalso()
+    r = importar_por_lotes(range(1, 6), _convertir, insertar, tamano_lote=2)
+    assert r == {"insertados": 5, "lotes": 3, "rechazados": [], "errores_lote": []}
+    assert insertar.lotes == [[1, 2], [3, 4], [5]]
+
+
+def test_filas_invalidas_se_rechazan_sin_detener():
+    r = importar_por_lotes([1, -2, 3], _convertir, InsertarFalso(), tamano_lote=10)
+    assert r["insertados"] == 2
+    assert r["rechazados"] == [(2, "valor negativo: -2")]
+
+
+def test_lote_rechazado_se_reintenta_fila_por_fila():
+    insertar = InsertarFalso(malo=3)
+    r = importar_por_lotes([1, 2, 3, 4], _convertir, insertar, tamano_lote=4)
+    assert r["insertados"] == 3
+    assert r["lotes"] == 1
+    assert r["rechazados"] == [(3, "Error de BD: Duplicate entry")]
+    assert r["errores_lote"] == [(1, "Error de BD: Duplicate entry")]
+    assert insertar.lotes == [[1, 2, 3, 4], [1], [2], [3], [4]]
+
+
+def test_tamano_lote_invalido():
+    with pytest.raises(ValueError):
+        importar_por_lotes([], _convertir, InsertarFalso(), tamano_lote=0)
@@ -0,0 +1,61 @@
+# tests/test_indice_paises.py
+# IndicePaises: búsquedas en memoria sobre países ya normalizados.
+
+import pytest
+
+from api.indice_paises import IndicePaises
+
+
+def _pais(comun, oficial, cca2, cca3, region):
+    return {"nombre_comun": comun, "nombre_oficial": oficial,
+            "codigo_cca2": cca2, "codigo_cca3": cca3, "region": region}
+
+
+@pytest.fixture
+def indice():
+    return IndicePaises([
+        _pais("Chile", "Republic of Chile", "CL", "CHL", "Americas"),
+        _pais("China", "People's Republic of China", "CN", "CHN", "Asia"),
+        _pais("Chad", "Republic of Chad", "TD", "TCD", "Africa"),
+        _pais("Czechia", "Czech Republic", "CZ", "CZE", "Europe"),
+        _pais("Argentina", "Argentine Republic", "AR", "ARG", "Americas"),
+    ])
+
+
+def _nombres(paises):
+    return [p["nombre_comun"] for p in paises]
+
+
+def test_por_codigo(indice):
+    assert indice.por_codigo("cl")["nombre_comun"] == "Chile"
+    assert indice.por_codigo("CHN")["nombre_comun"] == "China"
+    assert indice.por_codigo("XX") is None
+
+
+def test_listar_region(indice):
+    assert _nombres(indice.listar_region(" americas ")) == ["Chile", "Argentina"]
+
+
+def test_buscar_prefijo(indice):
+    assert _nombres(indice.buscar_prefijo("CH")) == ["Chad", "Chile", "China"]
+
+
+def test_parcial_primero_prefijos_despues_subcadena(indice):
+    assert _nombres(indice.buscar_nombre("chi")) == ["Chile", "China", "Czechia"]
+
+
+def test_limite_cubierto_por_prefijos(indice):
+    assert _nombres(indice.buscar_nombre("ch", limite=2)) == ["Chad", "Chile"]
+
+
+def test_limite_completa_con_subcadena(indice):
+    assert _nombres(indice.buscar_nombre("chi", limite=3)) == ["Chile", "China", "Czechia"]
+
+
+def test_nombre_exacto(indice):
+    assert _nombres(indice.buscar_nombre("republic of chile", full=True)) == ["Chile"]
+    assert indice.buscar_nombre("chil", full=True) == []
+
+
+def test_texto_vacio(indice):
+    assert indice.buscar_nombre("  ") == []
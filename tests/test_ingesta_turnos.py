@@ -0,0 +1,108 @@
+# tests/test_ingesta_turnos.py
+# IngestorTurnos con un insertar_lote de prueba (sin BD).
+
+import datetime
+import threading
+
+import pytest
+
+from aplicacion.ingesta_turnos import IngestorTurnos
+from dominio.registrodeturno import RegistroDeTurno
+
+
+def _turno(id_empleado, horas=8):
+    return RegistroDeTurno(None, id_empleado, datetime.datetime(2024, 1, 1, 9), horas, "")
+
+
+class InsertarFalso:
+    def __init__(self, malo=None):
+        self.malo = malo
+        self.lotes = []
+        self._lock = threading.Lock()
+
+    def __call__(self, registros):
+        with self._lock:
+            self.lotes.append([r.obtener_id_empleado() for r in registros])
+        if any(r.obtener_id_empleado() == self.malo for r in registros):
+            raise RuntimeError("FK inexistente")
+        return len(registros)
+
+
+def test_lotes_por_tamano_y_cierre():
+    insertar = InsertarFalso()
+    with IngestorTurnos(tamano_lote=3, intervalo_max=60, insertar_lote=insertar) as ing:
+        ing.enviar_muchos(_turno(i) for i in range(1, 8))
+    assert insertar.lotes == [[1, 2, 3], [4, 5, 6], [7]]
+    assert [r["motivo"] for r in ing.resultados()] == ["tamano", "tamano", "cierre"]
+    stats = ing.estadisticas()
+    assert (stats["recibidos"], stats["insertados"], stats["lotes"], stats["activo"]) == (7, 7, 3, False)
+
+
+def test_lote_por_tiempo():
+    insertar = InsertarFalso()
+    listo = threading.Event()
+    ing = IngestorTurnos(tamano_lote=100, intervalo_max=0.05, insertar_lote=insertar,
+                         al_completar_lote=lambda r: listo.set())
+    with ing:
+        ing.enviar(_turno(1))
+        assert listo.wait(2)
+    assert ing.resultados()[0]["motivo"] == "tiempo"
+
+
+def test_vaciar_escribe_lo_pendiente():
+    insertar = InsertarFalso()
+    with IngestorTurnos(tamano_lote=100, intervalo_max=60, insertar_lote=insertar) as ing:
+        ing.enviar(_turno(1))
+        ing.vaciar()
+        assert insertar.lotes == [[1]]
+
+
+def test_lote_rechazado_se_reintenta_turno_por_turno():
+    insertar = InsertarFalso(malo=2)
+    with IngestorTurnos(tamano_lote=3, intervalo_max=60, insertar_lote=insertar) as ing:
+        ing.enviar_muchos(_turno(i) for i in (1, 2, 3))
+    resultado = ing.resultados()[0]
+    assert resultado["insertados"] == 2
+    assert [r.obtener_id_empleado() for r, _ in resultado["rechazados"]] == [2]
+    assert resultado["error_lote"] == "FK inexistente"
+    assert insertar.lotes == [[1, 2, 3], [1], [2], [3]]
+
+
+def test_despues_de_cerrar():
+    ing = IngestorTurnos(insertar_lote=InsertarFalso())
+    ing.iniciar()
+    ing.cerrar()
+    ing.vaciar()  # no debe bloquearse
+    with pytest.raises(RuntimeError):
+        ing.enviar(_turno(1))
+
+
+def test_envio_concurrente_con_cierre_no_pierde_turnos():
+    insertar = InsertarFalso()
+    ing = IngestorTurnos(tamano_lote=50, intervalo_max=60, capacidad_cola=10, insertar_lote=insertar)
+    ing.iniciar()
+
+    def enviar():
+        for i in range(1, 500):
+            try:
+                ing.enviar(_turno(i))
+            except RuntimeError:
+                return
+
+    hilos = [threading.Thread(target=enviar) for _ in range(4)]
+    for h in hilos:
+        h.start()
+    ing.cerrar()
+    for h in hilos:
+        h.join()
+    assert ing.estadisticas()["recibidos"] == sum(len(lote) for lote in insertar.lotes)
+
+
+@pytest.mark.parametrize("horas", [7.5, -1, "8", True])
+def test_horas_invalidas(horas):
+    with pytest.raises(ValueError):
+        IngestorTurnos._validar(_turno(1, horas))
+
+
+def test_horas_enteras_en_float_se_aceptan():
+    IngestorTurnos._validar(_turno(1, 8.0))
@@ -0,0 +1,31 @@
+# tests/test_paginacion.py
+# clausula_keyset: fragmentos SQL de la paginación por (nombre, id).
+
+import pytest
+
+from persistencia.paginacion import clausula_keyset
+
+
+def test_primera_pagina():
+    assert clausula_keyset("nombre", "id", None, None, 20) == ("", "LIMIT %s", (20,))
+
+
+def test_sin_limite():
+    assert clausula_keyset("nombre", "id", None, None, None) == ("", "", ())
+
+
+def test_pagina_siguiente_usa_forma_expandida():
+    where, limit, params = clausula_keyset("nombre", "id_empleado", "Ana", "7", 21)
+    assert where == "WHERE (nombre > %s OR (nombre = %s AND id_empleado > %s))"
+    assert limit == "LIMIT %s"
+    assert params == ("Ana", "Ana", 7, 21)
+
+
+def test_solo_nombre():
+    assert clausula_keyset("nombre", "id", "Ana", None, None) == ("WHERE nombre > %s", "", ("Ana",))
+
+
+@pytest.mark.parametrize("limite", [0, -1])
+def test_limite_invalido(limite):
+    with pytest.raises(ValueError):
+        clausula_keyset("nombre", "id", None, None, limite)